@@ -0,0 +1,189 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from prometheus_client import Gauge, Histogram
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+from oddstracker import config
+
+logger = logging.getLogger(__name__)
+
+POOL_CHECKED_OUT = Gauge(
+    "oddstracker_db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    ["role"],
+)
+POOL_IDLE = Gauge(
+    "oddstracker_db_pool_idle",
+    "Idle connections currently held by the pool",
+    ["role"],
+)
+POOL_OVERFLOW = Gauge(
+    "oddstracker_db_pool_overflow",
+    "Connections open beyond pool_size",
+    ["role"],
+)
+REPLICA_LAG = Gauge(
+    "oddstracker_db_replica_lag_seconds",
+    "Last measured replication lag of a read replica",
+    ["role"],
+)
+POOL_WAIT = Histogram(
+    "oddstracker_db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ["role"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+
+def asyncpg_url(db_url: str) -> str:
+    if db_url.startswith("postgresql://"):
+        db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    url = make_url(db_url)
+    if "prepared_statement_cache_size" not in url.query:
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(config.PG_STATEMENT_CACHE_SIZE)}
+        )
+    return url.render_as_string(hide_password=False)
+
+
+def engine_options(use_null_pool: bool = False) -> dict:
+    options: dict = {"connect_args": {"statement_cache_size": config.PG_STATEMENT_CACHE_SIZE}}
+    if use_null_pool:
+        options["poolclass"] = NullPool
+        return options
+    options.update(
+        pool_size=config.PG_POOL_SIZE,
+        max_overflow=config.PG_MAX_OVERFLOW,
+        pool_timeout=config.PG_POOL_TIMEOUT,
+        pool_recycle=config.PG_POOL_RECYCLE,
+        pool_pre_ping=config.PG_POOL_PRE_PING,
+    )
+    return options
+
+
+def observe_pool(engine: AsyncEngine, role: str) -> None:
+    pool = engine.sync_engine.pool
+    if not hasattr(pool, "checkedout"):
+        return
+    POOL_CHECKED_OUT.labels(role=role).set(pool.checkedout())
+    POOL_IDLE.labels(role=role).set(pool.checkedin())
+    POOL_OVERFLOW.labels(role=role).set(max(pool.overflow(), 0))
+
+
+def create_engine(db_url: str, role: str = "primary", use_null_pool: bool = False) -> AsyncEngine:
+    """Async engine with the configured pool and statement caches, reporting pool gauges."""
+    engine = create_async_engine(asyncpg_url(db_url), **engine_options(use_null_pool))
+
+    def _on_pool_change(*_):
+        observe_pool(engine, role)
+
+    event.listen(engine.sync_engine, "checkout", _on_pool_change)
+    event.listen(engine.sync_engine, "checkin", _on_pool_change)
+    return engine
+
+
+@asynccontextmanager
+async def timed_session(
+    session_maker: async_sessionmaker[AsyncSession], role: str = "primary"
+) -> AsyncIterator[AsyncSession]:
+    """Session whose connection is checked out up front so the pool wait can be measured."""
+    start = time.perf_counter()
+    async with session_maker() as session:
+        await session.connection()
+        POOL_WAIT.labels(role=role).observe(time.perf_counter() - start)
+        yield session
+
+
+# Lag in seconds, then the replayed WAL position in bytes. The lag is 0 when the
+# replica has replayed everything it received, so an idle primary doesn't look like
+# lag. A replica whose WAL receiver is down or silent has "replayed everything" too,
+# so it measures as NULL (unusable) instead.
+REPLICA_LAG_SQL = text(
+    "WITH r AS (SELECT status, last_msg_receipt_time FROM pg_stat_wal_receiver) "
+    "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN NOT EXISTS (SELECT 1 FROM r) OR (SELECT status FROM r) <> 'streaming' "
+    "OR (SELECT now() - last_msg_receipt_time FROM r) > make_interval(secs => :max_silence) "
+    "THEN NULL "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END, "
+    "CAST(CASE WHEN pg_is_in_recovery() THEN pg_last_wal_replay_lsn() "
+    "ELSE pg_current_wal_lsn() END - '0/0' AS bigint)"
+)
+
+# The primary's current WAL position in bytes, comparable with a replica's replay position
+CURRENT_LSN_SQL = text("SELECT CAST(pg_current_wal_lsn() - '0/0' AS bigint)")
+
+
+class ReadReplica:
+    """A read-only engine with a periodically measured replication lag."""
+
+    def __init__(self, db_url: str, role: str, use_null_pool: bool = False):
+        self.role = role
+        self.engine = create_engine(db_url, role=role, use_null_pool=use_null_pool)
+        self.session_maker = async_sessionmaker(
+            bind=self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+        self.lag: float | None = None
+        self.replayed = 0
+        self.checked_at = 0.0
+        self._probing = asyncio.Lock()
+
+    @property
+    def healthy(self) -> bool:
+        return self.lag is not None and self.lag <= config.PG_REPLICA_MAX_LAG_SECONDS
+
+    def has_replayed(self, lsn: int) -> bool:
+        """Whether the last probe saw this replica past the WAL position `lsn`."""
+        return self.replayed >= lsn
+
+    def mark_unhealthy(self) -> None:
+        self.lag = None
+        self.checked_at = time.monotonic()
+
+    async def check(self) -> bool:
+        """
+        Re-measure the lag at most once per check interval; True when usable. Only
+        one probe runs at a time, bounded by the check timeout, and concurrent
+        callers get the last known state instead of waiting on it.
+        """
+        if time.monotonic() - self.checked_at < config.PG_REPLICA_CHECK_INTERVAL_SECONDS:
+            return self.healthy
+        if self._probing.locked():
+            return self.healthy
+        async with self._probing:
+            try:
+                async with asyncio.timeout(config.PG_REPLICA_CHECK_TIMEOUT_SECONDS):
+                    self.lag = await self._measure()
+                if self.lag is None:
+                    logger.warning(f"Read replica {self.role} is not streaming from the primary")
+                else:
+                    REPLICA_LAG.labels(role=self.role).set(self.lag)
+            except Exception as e:
+                logger.warning(f"Read replica {self.role} unavailable: {e!r}")
+                self.lag = None
+            self.checked_at = time.monotonic()
+        if self.lag is not None and not self.healthy:
+            logger.warning(f"Read replica {self.role} lagging by {self.lag:.1f}s")
+        return self.healthy
+
+    async def _measure(self) -> float | None:
+        async with self.engine.connect() as conn:
+            lag, replayed = (
+                await conn.execute(
+                    REPLICA_LAG_SQL, {"max_silence": config.PG_REPLICA_MAX_SILENCE_SECONDS}
+                )
+            ).one()
+        self.replayed = replayed or 0
+        return None if lag is None else float(lag)
@@ -0,0 +1,127 @@
+import logging
+
+from sqlalchemy import text
+
+from oddstracker.domain.model.sportevent import EventOffer
+
+logger = logging.getLogger(__name__)
+
+# eventoffer column -> (dimension table, id type)
+DIMENSIONS = {
+    "event_id": ("event_dim", "integer"),
+    "bookmaker": ("bookmaker_dim", "smallint"),
+    "offer_type": ("offertype_dim", "smallint"),
+    "choice": ("choice_dim", "integer"),
+}
+
+ENCODED_TABLE = "eventoffer_encoded"
+
+_KEY_COLUMNS = ", ".join(f"{column}_key" for column in DIMENSIONS)
+
+
+def create_statements() -> list[str]:
+    """
+    DDL for the encoded layout: one dimension table per string key column, the
+    integer-keyed hypertable, and an `eventoffer` view decoding it so every read
+    query works unchanged against either storage mode.
+    """
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS {table} ("
+        f"id {'smallserial' if id_type == 'smallint' else 'serial'} PRIMARY KEY, "
+        "value varchar NOT NULL UNIQUE)"
+        for table, id_type in DIMENSIONS.values()
+    ]
+    key_columns = ", ".join(
+        f"{column}_key {id_type} NOT NULL REFERENCES {table} (id)"
+        for column, (table, id_type) in DIMENSIONS.items()
+    )
+    statements += [
+        f"CREATE TABLE IF NOT EXISTS {ENCODED_TABLE} ("
+        f"{key_columns}, "
+        "timestamp timestamptz NOT NULL, "
+        "price double precision NOT NULL, "
+        "point double precision, "
+        "updated_at timestamptz NOT NULL, "
+        f"PRIMARY KEY ({_KEY_COLUMNS}, timestamp))",
+        f"SELECT create_hypertable('{ENCODED_TABLE}', 'timestamp', "
+        "if_not_exists => TRUE, migrate_data => TRUE)",
+        f"CREATE INDEX IF NOT EXISTS ix_{ENCODED_TABLE}_event_timestamp "
+        f"ON {ENCODED_TABLE} (event_id_key, timestamp)",
+    ]
+    decoded = ", ".join(f"{column[0]}d.value AS {column}" for column in DIMENSIONS)
+    joins = " ".join(
+        f"JOIN {table} {column[0]}d ON {column[0]}d.id = eo.{column}_key"
+        for column, (table, _) in DIMENSIONS.items()
+    )
+    statements.append(
+        "CREATE OR REPLACE VIEW eventoffer AS "
+        f"SELECT {decoded}, eo.timestamp, eo.price, eo.point, eo.updated_at "
+        f"FROM {ENCODED_TABLE} eo {joins}"
+    )
+    return statements
+
+
+class DimensionInterner:
+    """In-memory string -> id maps for the dimension tables, filled on demand."""
+
+    def __init__(self):
+        self._ids: dict[str, dict[str, int]] = {column: {} for column in DIMENSIONS}
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self._ids.values())
+
+    def lookup(self, column: str, value: str) -> int | None:
+        return self._ids[column].get(value)
+
+    def missing(self, offers: list[EventOffer]) -> dict[str, set[str]]:
+        missing: dict[str, set[str]] = {}
+        for column, ids in self._ids.items():
+            values = {getattr(o, column) for o in offers} - ids.keys()
+            if values:
+                missing[column] = values
+        return missing
+
+    async def intern(self, session_maker, offers: list[EventOffer]) -> None:
+        """
+        Make sure every key string of `offers` has an id. New values are inserted
+        and committed in their own transaction, so cached ids always exist in the
+        DB even if the caller's write later rolls back.
+        """
+        missing = self.missing(offers)
+        if not missing:
+            return
+        async with session_maker() as session:
+            for column, values in missing.items():
+                table, _ = DIMENSIONS[column]
+                await session.execute(
+                    text(
+                        f"INSERT INTO {table} (value) SELECT unnest(CAST(:values AS varchar[])) "
+                        "ON CONFLICT (value) DO NOTHING"
+                    ),
+                    {"values": sorted(values)},
+                )
+                result = await session.execute(
+                    text(f"SELECT value, id FROM {table} WHERE value = ANY(:values)"),
+                    {"values": sorted(values)},
+                )
+                self._ids[column].update(dict(result.fetchall()))
+            await session.commit()
+        logger.info(f"Interned {sum(len(v) for v in missing.values())} new dimension values")
+
+    def encode(self, offer: EventOffer) -> dict:
+        row = {f"{column}_key": self._ids[column][getattr(offer, column)] for column in DIMENSIONS}
+        row.update(
+            timestamp=offer.timestamp,
+            price=offer.price,
+            point=offer.point,
+            updated_at=offer.updated_at,
+        )
+        return row
+
+
+INSERT_ENCODED = text(
+    f"INSERT INTO {ENCODED_TABLE} ({_KEY_COLUMNS}, timestamp, price, point, updated_at) "
+    f"VALUES ({', '.join(f':{column}_key' for column in DIMENSIONS)}, "
+    ":timestamp, :price, :point, :updated_at) "
+    "ON CONFLICT DO NOTHING"
+)
@@ -0,0 +1,257 @@
+import logging
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from oddstracker.domain.model.sportevent import (
+    EVENTOFFER_COLUMNS,
+    EventOffer,
+    SportEvent,
+    SportEventData,
+)
+from oddstracker.utils import get_utc_now
+
+logger = logging.getLogger(__name__)
+
+# (bookmaker, offer_type, choice)
+OfferKey = tuple[str, str, str]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _to_micros(ts: datetime) -> int:
+    return (ts - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(us: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(us))
+
+
+class MarketSeries:
+    """Growable, timestamp-ordered columns of quotes for one market key."""
+
+    __slots__ = ("timestamps", "prices", "points", "updated", "size")
+
+    def __init__(self, capacity: int = 8):
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.prices = np.empty(capacity, dtype=np.float64)
+        self.points = np.empty(capacity, dtype=np.float64)
+        self.updated = np.empty(capacity, dtype=np.int64)
+        self.size = 0
+
+    def _grow(self) -> None:
+        capacity = self.timestamps.shape[0] * 2
+        for name in ("timestamps", "prices", "points", "updated"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self.size] = column[: self.size]
+            setattr(self, name, grown)
+
+    def append(self, ts: int, price: float, point: float | None, updated: int) -> bool:
+        """Insert a quote in timestamp order; duplicates of a stored timestamp are ignored."""
+        pos = self.size
+        if self.size and ts <= self.timestamps[self.size - 1]:
+            pos = int(np.searchsorted(self.timestamps[: self.size], ts))
+            if self.timestamps[pos] == ts:
+                return False
+        if self.size == self.timestamps.shape[0]:
+            self._grow()
+        for column, value in (
+            (self.timestamps, ts),
+            (self.prices, price),
+            (self.points, np.nan if point is None else point),
+            (self.updated, updated),
+        ):
+            column[pos + 1 : self.size + 1] = column[pos : self.size]
+            column[pos] = value
+        self.size += 1
+        return True
+
+    def row(self, event_id: str, key: OfferKey, i: int) -> tuple:
+        """Quote `i` as a tuple in EVENTOFFER_COLUMNS order."""
+        point = self.points[i]
+        return (
+            event_id,
+            *key,
+            _from_micros(self.timestamps[i]),
+            float(self.prices[i]),
+            None if np.isnan(point) else float(point),
+            _from_micros(self.updated[i]),
+        )
+
+    def offer(self, event_id: str, key: OfferKey, i: int) -> EventOffer:
+        return EventOffer(**dict(zip(EVENTOFFER_COLUMNS, self.row(event_id, key, i), strict=True)))
+
+
+class OddsHotCache:
+    """
+    Complete odds histories for events commencing within the recent window,
+    held as per-market NumPy columns.
+
+    An event is only served from the cache when its whole history is present:
+    either it was loaded at warm-up or it first appeared after warm-up and was
+    fed entirely by the ingest path. Everything else falls through to the DB.
+    """
+
+    def __init__(self, window: timedelta):
+        self.window = window
+        self._events: dict[str, SportEvent] = {}
+        self._markets: dict[str, dict[OfferKey, MarketSeries]] = {}
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._events
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def since(self) -> datetime:
+        return get_utc_now() - self.window
+
+    def _in_window(self, event: SportEvent) -> bool:
+        try:
+            return datetime.fromisoformat(event.commence_time) >= self.since
+        except ValueError:
+            return False
+
+    def warm(self, events: list[SportEvent], rows: list[tuple]) -> None:
+        """Load events and their (event_id, bookmaker, offer_type, choice, timestamp, price, point, updated_at) rows."""
+        self._events.clear()
+        self._markets.clear()
+        self.load(events, rows)
+        logger.info(f"Hot cache warmed with {len(self._events)} events and {len(rows)} offers")
+
+    def load(self, events: list[SportEvent], rows: list[tuple]) -> None:
+        """Replace the given events with their complete histories from `rows`."""
+        for event in events:
+            self._events[event.id] = event
+            self._markets[event.id] = {}
+        self._append_rows(rows)
+
+    def extend(self, events: list[SportEvent], rows: list[tuple]) -> None:
+        """Update cached events and append new rows; quotes already held are skipped."""
+        for event in events:
+            if event.id in self._events:
+                self._events[event.id] = event
+        self._append_rows(rows)
+
+    def watermarks(self, event_ids: list[str]) -> dict[str, datetime]:
+        """Newest `updated_at` held per cached event, for incremental refreshes."""
+        marks = {}
+        for event_id in event_ids:
+            markets = self._markets.get(event_id)
+            if markets is None:
+                continue
+            newest = max(
+                (int(s.updated[: s.size].max()) for s in markets.values() if s.size), default=0
+            )
+            marks[event_id] = _from_micros(newest)
+        return marks
+
+    def _append_rows(self, rows) -> None:
+        for event_id, bookmaker, offer_type, choice, ts, price, point, updated_at in rows:
+            markets = self._markets.get(event_id)
+            if markets is None:
+                continue
+            series = markets.get((bookmaker, offer_type, choice))
+            if series is None:
+                series = markets[(bookmaker, offer_type, choice)] = MarketSeries()
+            series.append(_to_micros(ts), price, point, _to_micros(updated_at))
+
+    def add(self, sportevent: SportEventData, is_new: bool) -> None:
+        """Feed a stored event; `is_new` marks events that had no rows in the DB before."""
+        event = sportevent.event
+        if event.id not in self._events:
+            if not is_new or not self._in_window(event):
+                return
+            self._markets[event.id] = {}
+        self._events[event.id] = event
+        self._append_rows(
+            (o.event_id, o.bookmaker, o.offer_type, o.choice, o.timestamp, o.price, o.point, o.updated_at)
+            for o in sportevent.offers
+        )
+        self.evict()
+
+    def evict(self) -> None:
+        for event_id in [e for e, event in self._events.items() if not self._in_window(event)]:
+            del self._events[event_id]
+            del self._markets[event_id]
+
+    def invalidate(self, event_ids: list[str]) -> None:
+        for event_id in event_ids:
+            self._events.pop(event_id, None)
+            self._markets.pop(event_id, None)
+
+    def get_event(self, event_id: str) -> SportEvent | None:
+        return self._events.get(event_id)
+
+    def get_eventoffer_rows(
+        self,
+        event_id: str,
+        offer_type: str | None = None,
+        first_last: bool = False,
+        latest: bool = False,
+    ) -> list[tuple] | None:
+        markets = self._markets.get(event_id)
+        if markets is None:
+            return None
+        rows = []
+        for key, series in markets.items():
+            if offer_type and key[1] != offer_type:
+                continue
+            if latest:
+                rows.append(series.row(event_id, key, series.size - 1))
+            elif first_last:
+                rows.append(series.row(event_id, key, 0))
+                rows.append(series.row(event_id, key, series.size - 1))
+            else:
+                rows.extend(series.row(event_id, key, i) for i in range(series.size))
+        return rows
+
+    def get_eventoffers(
+        self,
+        event_id: str,
+        offer_type: str | None = None,
+        first_last: bool = False,
+    ) -> list[EventOffer] | None:
+        rows = self.get_eventoffer_rows(event_id, offer_type=offer_type, first_last=first_last)
+        if rows is None:
+            return None
+        return [EventOffer(**dict(zip(EVENTOFFER_COLUMNS, row, strict=True))) for row in rows]
+
+    def get_sporteventdata(
+        self,
+        event_id: str,
+        offer_type: str = "all",
+        first_last: bool = False,
+    ) -> SportEventData | None:
+        event = self._events.get(event_id)
+        if event is None:
+            return None
+        if offer_type == "all":
+            offers = self.get_eventoffers(event_id, first_last=first_last)
+        elif offer_type:
+            offers = self.get_eventoffers(event_id, offer_type, first_last=first_last)
+        else:
+            offers = []
+        return SportEventData(event=event, offers=offers or [])
+
+    def get_eventoffer_history(
+        self, offer_type: str, event_id: str, limit: int = 2
+    ) -> list[EventOffer] | None:
+        markets = self._markets.get(event_id)
+        if markets is None:
+            return None
+        keys = [(k, s) for k, s in markets.items() if k[1] == offer_type]
+        if not keys:
+            return []
+        timestamps = np.concatenate([s.timestamps[: s.size] for _, s in keys])
+        owners = np.concatenate(
+            [np.full(s.size, n, dtype=np.int64) for n, (_, s) in enumerate(keys)]
+        )
+        positions = np.concatenate([np.arange(s.size) for _, s in keys])
+        latest = np.argsort(timestamps, kind="stable")[::-1][:limit]
+        return [
+            keys[owners[i]][1].offer(event_id, keys[owners[i]][0], positions[i])
+            for i in latest
+        ]
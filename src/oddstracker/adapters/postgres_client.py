@@ -1,37 +1,108 @@
+import itertools
 import logging
+import re
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, timedelta
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+import asyncpg
+from asyncpg import Record
+from sqlalchemy import literal_column, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlmodel import SQLModel, select
 
 from oddstracker import config
+from oddstracker.adapters.dbengine import (
+    CURRENT_LSN_SQL,
+    ReadReplica,
+    asyncpg_url,
+    create_engine,
+    timed_session,
+)
+from oddstracker.adapters.encodedstorage import (
+    INSERT_ENCODED,
+    DimensionInterner,
+    create_statements,
+)
+from oddstracker.adapters.hotcache import OddsHotCache
+from oddstracker.domain.model.collectorlease import CollectorLease
 from oddstracker.domain.model.sportevent import (
+    EVENTOFFER_COLUMNS,
+    SPORTEVENT_COLUMNS,
+    ClosingLine,
+    ConsensusLine,
     EventOffer,
     SportEvent,
     SportEventData,
 )
 from oddstracker.domain.teamdata import TeamData
-from oddstracker.utils import get_utc_now
+from oddstracker.utils import as_utc, get_utc_now
 
 logger = logging.getLogger(__name__)
 
+HOT_CACHE_REFRESH_OVERLAP = timedelta(minutes=5)
+
+# ":name" bind parameters, but not "::type" casts
+_NAMED_PARAM = re.compile(r"(?<!:):([A-Za-z_]\w*)")
+
+DESCRIPTIVE_COLUMNS = tuple(
+    c for c in SPORTEVENT_COLUMNS if c not in ("id", "created_at", "updated_at")
+)
+
+
+def _descriptive_fields(event: SportEvent) -> tuple:
+    return tuple(getattr(event, c) for c in DESCRIPTIVE_COLUMNS)
+
+
+_COMMENCE_TIME = DESCRIPTIVE_COLUMNS.index("commence_time")
+
+
+def _commenced_before(fields: tuple, since: datetime) -> bool:
+    try:
+        return as_utc(datetime.fromisoformat(fields[_COMMENCE_TIME])) < since
+    except (TypeError, ValueError):
+        return True
+
 
 class PostgresClient:
-    def __init__(self, db_url: str | None = None, use_null_pool: bool = False):
+    def __init__(
+        self,
+        db_url: str | None = None,
+        use_null_pool: bool = False,
+        read_urls: list[str] | None = None,
+    ):
         try:
             logger.info("Initializing Postgres client")
-            self.db_url = db_url or config.get_pg_url()
-            if self.db_url.startswith("postgresql://"):
-                self.db_url = self.db_url.replace(
-                    "postgresql://", "postgresql+asyncpg://", 1
-                )
-
-            engine_kwargs = {"poolclass": NullPool} if use_null_pool else {}
-            self.engine = create_async_engine(self.db_url, **engine_kwargs)
+            self.db_url = asyncpg_url(db_url or config.get_pg_url())
+            self.engine = create_engine(self.db_url, role="primary", use_null_pool=use_null_pool)
             self.session_maker = async_sessionmaker(
                 bind=self.engine, class_=AsyncSession, expire_on_commit=False
             )
+            self.replicas = [
+                ReadReplica(asyncpg_url(url), role=f"replica{n}", use_null_pool=use_null_pool)
+                for n, url in enumerate(config.PG_READ_URLS if read_urls is None else read_urls)
+            ]
+            self._replica_turn = itertools.count()
+            # Replicas serve reads only once replayed past the newest known write, so
+            # data read right after a change is never older than what caches announce
+            self.min_read_lsn = 0
+            self.hot_cache = (
+                OddsHotCache(timedelta(hours=config.HOT_CACHE_WINDOW_HOURS))
+                if config.HOT_CACHE_ENABLED
+                else None
+            )
+            # Descriptive fields of events as last committed, for dirty tracking. Kept for
+            # the hot-cache window only: older events are rarely re-collected, and a miss
+            # just means a full upsert
+            self._event_fields: dict[str, tuple] = {}
+            self._event_fields_window = timedelta(hours=config.HOT_CACHE_WINDOW_HOURS)
+            if config.EVENTOFFER_STORAGE not in ("plain", "encoded"):
+                raise ValueError(f"Invalid EVENTOFFER_STORAGE: {config.EVENTOFFER_STORAGE}")
+            self.interner = (
+                DimensionInterner() if config.EVENTOFFER_STORAGE == "encoded" else None
+            )
         except Exception as e:
             logger.error(f"Error initializing Postgres client: {e}")
             raise e
@@ -41,21 +112,243 @@ class PostgresClient:
         async with self.session_maker() as session:
             yield session
 
+    def _session(self):
+        return timed_session(self.session_maker, role="primary")
+
+    @staticmethod
+    async def _fetch_records(session: AsyncSession, sql: str, params: dict) -> list[Record]:
+        """
+        Run `sql` directly on the session's asyncpg connection and return its records,
+        skipping SQLAlchemy result processing and model hydration. `:name` parameters
+        are rewritten to asyncpg's positional `$n` form.
+        """
+        names: list[str] = []
+
+        def _positional(match: re.Match) -> str:
+            if match.group(1) not in names:
+                names.append(match.group(1))
+            return f"${names.index(match.group(1)) + 1}"
+
+        sql = _NAMED_PARAM.sub(_positional, sql)
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        return await raw.driver_connection.fetch(sql, *(params[n] for n in names))
+
+    async def _choose_replica(self) -> ReadReplica | None:
+        """
+        Next replica in round-robin order within the staleness bound that has
+        replayed the newest known write, if any.
+        """
+        if not self.replicas:
+            return None
+        start = next(self._replica_turn)
+        for n in range(len(self.replicas)):
+            replica = self.replicas[(start + n) % len(self.replicas)]
+            if await replica.check() and replica.has_replayed(self.min_read_lsn):
+                return replica
+        return None
+
+    def require_lsn(self, lsn: int) -> None:
+        """Keep reads on the primary until a replica has replayed WAL position `lsn`."""
+        self.min_read_lsn = max(self.min_read_lsn, lsn)
+
+    async def note_write(self) -> int:
+        """Record the primary's WAL position after a write and return it."""
+        try:
+            async with self.engine.connect() as conn:
+                lsn = (await conn.execute(CURRENT_LSN_SQL)).scalar_one()
+            self.require_lsn(lsn)
+            return lsn
+        except Exception as e:
+            logger.error(f"Error reading WAL position: {e}")
+            raise e
+
+    async def _read_engine(self):
+        replica = await self._choose_replica()
+        return self.engine if replica is None else replica.engine
+
+    @asynccontextmanager
+    async def _read_session(self):
+        """Session on a fresh-enough replica, falling back to the primary."""
+        async with AsyncExitStack() as stack:
+            session = None
+            if (replica := await self._choose_replica()) is not None:
+                try:
+                    session = await stack.enter_async_context(
+                        timed_session(replica.session_maker, role=replica.role)
+                    )
+                except Exception as e:
+                    logger.warning(f"Falling back to primary, {replica.role} failed: {e}")
+                    replica.mark_unhealthy()
+            if session is None:
+                session = await stack.enter_async_context(self._session())
+            yield session
+
     async def initialize(self):
         """Initialize database tables. Call this after creating the client."""
         await self._create_tables()
+        await self.warm_hot_cache()
+
+    async def warm_hot_cache(self):
+        """Load full histories of events commencing within the hot cache window."""
+        if self.hot_cache is None:
+            return
+        try:
+            events, rows = await self._load_hot_cache_events()
+            self.hot_cache.warm(events, rows)
+        except Exception as e:
+            logger.error(f"Error warming hot cache: {e}")
+            raise e
+
+    async def refresh_hot_cache(self, event_ids: list[str]):
+        """
+        Bring events changed by another process up to date. Cached events only
+        fetch rows stored after what the cache already holds; events not cached
+        yet are loaded in full once.
+        """
+        if self.hot_cache is None or not event_ids:
+            return
+        try:
+            marks = self.hot_cache.watermarks(event_ids)
+            missing = [event_id for event_id in event_ids if event_id not in marks]
+            rows = []
+            if marks:
+                events, rows = await self._load_hot_cache_deltas(marks)
+                self.hot_cache.extend(events, rows)
+            if missing:
+                events, _rows = await self._load_hot_cache_events(missing)
+                self.hot_cache.load(events, _rows)
+            logger.info(
+                f"Hot cache refreshed {len(marks)} cached events with {len(rows)} new offers, "
+                f"loaded {len(missing)} others"
+            )
+        except Exception as e:
+            logger.error(f"Error refreshing hot cache: {e}")
+            raise e
+
+    async def _load_hot_cache_deltas(
+        self, marks: dict[str, datetime]
+    ) -> tuple[list[SportEvent], list]:
+        """Events and their offer rows stored after each event's watermark."""
+        params = {
+            "ids": list(marks),
+            # Writers stamp updated_at before committing, so overlap a little to
+            # catch rows committed out of stamp order; held quotes are skipped
+            "marks": [mark - HOT_CACHE_REFRESH_OVERLAP for mark in marks.values()],
+        }
+        async with self._session() as session:
+            result = await session.execute(
+                text("SELECT * FROM sportevent WHERE id = ANY(:ids)"), {"ids": params["ids"]}
+            )
+            events = [SportEvent(**dict(row._mapping)) for row in result.fetchall()]
+            result = await session.execute(
+                text(
+                    "SELECT eo.event_id, eo.bookmaker, eo.offer_type, eo.choice, "
+                    "eo.timestamp, eo.price, eo.point, eo.updated_at "
+                    "FROM unnest(CAST(:ids AS varchar[]), CAST(:marks AS timestamptz[])) "
+                    "AS w(event_id, mark) "
+                    "JOIN eventoffer eo ON eo.event_id = w.event_id AND eo.updated_at > w.mark "
+                    "ORDER BY eo.timestamp"
+                ),
+                params,
+            )
+            return events, result.fetchall()
+
+    async def _load_hot_cache_events(
+        self, event_ids: list[str] | None = None
+    ) -> tuple[list[SportEvent], list]:
+        assert self.hot_cache is not None
+        params: dict = {"since": self.hot_cache.since}
+        only = ""
+        if event_ids is not None:
+            only = "AND se.id = ANY(:ids) "
+            params["ids"] = event_ids
+        # Always the primary: the cache must hold complete histories
+        async with self._session() as session:
+            result = await session.execute(
+                text(
+                    f"SELECT se.* FROM sportevent se "
+                    f"WHERE CAST(se.commence_time AS timestamptz) >= :since {only}"
+                ),
+                params,
+            )
+            events = [SportEvent(**dict(row._mapping)) for row in result.fetchall()]
+            result = await session.execute(
+                text(
+                    "SELECT eo.event_id, eo.bookmaker, eo.offer_type, eo.choice, "
+                    "eo.timestamp, eo.price, eo.point, eo.updated_at "
+                    "FROM eventoffer eo JOIN sportevent se ON se.id = eo.event_id "
+                    f"WHERE CAST(se.commence_time AS timestamptz) >= :since {only}"
+                    "ORDER BY eo.timestamp"
+                ),
+                params,
+            )
+            return events, result.fetchall()
+
+    async def connect_listener(self):
+        """Dedicated asyncpg connection outside the pool, for LISTEN."""
+        dsn = make_url(self.db_url).set(drivername="postgresql", query={})
+        return await asyncpg.connect(dsn.render_as_string(hide_password=False))
+
+    async def notify(self, channel: str, payloads: list[str]) -> None:
+        try:
+            async with self._session() as session:
+                for payload in payloads:
+                    await session.execute(
+                        text("SELECT pg_notify(:channel, :payload)"),
+                        {"channel": channel, "payload": payload},
+                    )
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Error notifying {channel}: {e}")
+            raise e
 
     async def _create_tables(self):
         try:
             async with self.engine.begin() as conn:
                 await conn.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb"))
-                await conn.run_sync(SQLModel.metadata.create_all)
+                if self.interner is None:
+                    await conn.run_sync(SQLModel.metadata.create_all)
+                    await conn.execute(
+                        text(
+                            "SELECT create_hypertable('eventoffer', 'timestamp', "
+                            "if_not_exists => TRUE, migrate_data => TRUE)"
+                        )
+                    )
+                else:
+                    tables = [
+                        t for t in SQLModel.metadata.sorted_tables if t.name != "eventoffer"
+                    ]
+                    await conn.run_sync(
+                        lambda sync_conn: SQLModel.metadata.create_all(sync_conn, tables=tables)
+                    )
+                    for statement in create_statements():
+                        await conn.execute(text(statement))
                 await conn.execute(
                     text(
-                        "SELECT create_hypertable('eventoffer', 'timestamp', "
+                        "SELECT create_hypertable('consensusline', 'timestamp', "
                         "if_not_exists => TRUE, migrate_data => TRUE)"
                     )
                 )
+                indexes = [
+                    ("ix_sportevent_commence_id", "sportevent (commence_time, id)"),
+                    ("ix_sportevent_sport_commence_id", "sportevent (sport_key, commence_time, id)"),
+                ]
+                if self.interner is None:
+                    # Keyset pages of one event range on timestamp within it; the
+                    # encoded table gets the same index on its integer key
+                    indexes.append(
+                        ("ix_eventoffer_event_timestamp", "eventoffer (event_id, timestamp)")
+                    )
+                for name, columns in indexes:
+                    await conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {columns}"))
+                for side in ("home_team", "away_team"):
+                    await conn.execute(
+                        text(
+                            f"CREATE INDEX IF NOT EXISTS ix_sportevent_{side} ON sportevent "
+                            f"({side}, commence_time)"
+                        )
+                    )
             logger.info("Postgres tables created/checked successfully")
         except Exception as e:
             logger.error(f"Error creating tables: {e}")
@@ -74,51 +367,108 @@ class PostgresClient:
     async def close(self):
         try:
             await self.engine.dispose()
+            for replica in self.replicas:
+                await replica.engine.dispose()
             logger.info("Closed Postgres client connection")
         except Exception as e:
             logger.error(f"Error closing Postgres client connection: {e}")
             raise e
 
     async def add_sporteventdata(self, sportevent: SportEventData):
-        logger.info(f"Upserting event {sportevent}")
-        async with self.session_maker() as session:
+        await self.add_sporteventdata_batch([sportevent])
+
+    async def add_sporteventdata_batch(self, sportevents: list[SportEventData]):
+        """
+        Store many events and their offers in one transaction: at most two statements
+        for the events and one bulk insert for the offers. Re-collected offers are
+        ignored.
+        """
+        logger.info(f"Upserting batch of {len(sportevents)} events")
+        events = {s.event.id: s.event for s in sportevents}
+        async with self._session() as session:
             try:
-                await self._upsert_sportevent(sportevent.event, session)
-                await self._upsert_eventoffers(sportevent.offers, session)
+                new_ids = await self._upsert_sportevents(list(events.values()), session)
+                await self._upsert_eventoffers(
+                    [offer for s in sportevents for offer in s.offers], session
+                )
                 await session.commit()
             except Exception as e:
                 logger.error(f"Error upserting events and betoffers: {e}")
                 await session.rollback()
                 raise e
+        # Only remember what was actually committed, see _upsert_sportevents
+        for event_id, event in events.items():
+            self._event_fields[event_id] = _descriptive_fields(event)
+        since = get_utc_now() - self._event_fields_window
+        for event_id in [e for e, f in self._event_fields.items() if _commenced_before(f, since)]:
+            del self._event_fields[event_id]
+        if self.hot_cache is not None:
+            for sportevent in sportevents:
+                self.hot_cache.add(sportevent, is_new=sportevent.event.id in new_ids)
 
     async def _upsert_eventoffers(self, offers: list[EventOffer], session):
         try:
-            for bo in offers:
-                logger.info(f"Inserting {bo}")
-                session.add(bo)
+            if not offers:
+                return
+            if self.interner is not None:
+                await self.interner.intern(self._session, offers)
+                await session.execute(
+                    INSERT_ENCODED, [self.interner.encode(bo) for bo in offers]
+                )
+            else:
+                await session.execute(
+                    pg_insert(EventOffer.__table__).on_conflict_do_nothing(),
+                    [{c: getattr(bo, c) for c in EVENTOFFER_COLUMNS} for bo in offers],
+                )
             logger.info(f"Inserted {len(offers)} eventoffers successfully.")
         except Exception as e:
             logger.exception(e)
             logger.error(f"Error adding eventoffers: {e.__cause__}")
             raise e
 
-    async def _upsert_sportevent(self, sportevent: SportEvent, session):
+    async def _upsert_sportevents(self, events: list[SportEvent], session) -> set[str]:
+        """
+        Upsert events and return the ids that did not exist yet.
+
+        Events whose descriptive fields match what this client last committed only
+        get their updated_at bumped. Everything else (new, changed, or unknown since
+        start-up) goes through one INSERT ... ON CONFLICT (id) DO UPDATE.
+        """
         try:
-            existing = await session.get(SportEvent, sportevent.id)
-            if not existing:
-                session.add(sportevent)
-            else:
-                existing.updated_at = get_utc_now()
-                session.add(existing)
-            logger.info(f"Upserted event {sportevent.id} successfully.")
+            now = get_utc_now()
+            clean = [e.id for e in events if self._event_fields.get(e.id) == _descriptive_fields(e)]
+            touched: set[str] = set()
+            if clean:
+                result = await session.execute(
+                    text("UPDATE sportevent SET updated_at = :now WHERE id = ANY(:ids) RETURNING id"),
+                    {"now": now, "ids": clean},
+                )
+                touched = set(result.scalars().all())
+
+            dirty = [e for e in events if e.id not in touched]
+            new_ids: set[str] = set()
+            if dirty:
+                stmt = pg_insert(SportEvent.__table__).values(
+                    [{c: getattr(e, c) for c in SPORTEVENT_COLUMNS} for e in dirty]
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={c: stmt.excluded[c] for c in DESCRIPTIVE_COLUMNS} | {"updated_at": now},
+                ).returning(SportEvent.__table__.c.id, literal_column("xmax = 0"))
+                result = await session.execute(stmt)
+                new_ids = {event_id for event_id, inserted in result.fetchall() if inserted}
+            logger.info(
+                f"Upserted {len(events)} events ({len(touched)} unchanged, {len(new_ids)} new)."
+            )
+            return new_ids
         except Exception as e:
-            logger.error(f"Error adding event {sportevent.id}: {e}")
+            logger.error(f"Error upserting events: {e}")
             raise e
 
     async def get_events(self, **filters) -> list[SportEvent]:
         try:
             logger.info(f"Fetching events from with {filters}")
-            async with self.session_maker() as session:
+            async with self._read_session() as session:
                 query = select(SportEvent)
                 # if not include_deleted:
                 #     query = query.where(KambiEvent.deleted_at is None)
@@ -138,6 +488,196 @@ class PostgresClient:
             logger.error(f"Error getting events: {e}")
             raise e
 
+    async def get_events_page(
+        self,
+        limit: int,
+        after: tuple[str, str] | None = None,
+        sport_key: str | None = None,
+        team: str | None = None,
+    ) -> list[SportEvent]:
+        """Up to `limit` events ordered by (commence_time, id), strictly after the `after` key."""
+        try:
+            logger.info(f"Fetching events page after={after} sport_key={sport_key} team={team}")
+            clauses, params = [], {"limit": limit}
+            if after is not None:
+                clauses.append("(commence_time, id) > (:after_commence, :after_id)")
+                params["after_commence"], params["after_id"] = after
+            if sport_key:
+                clauses.append("sport_key = :sport_key")
+                params["sport_key"] = sport_key
+            if team:
+                clauses.append("(home_team = :team OR away_team = :team)")
+                params["team"] = team
+            where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+            async with self._read_session() as session:
+                result = await session.execute(
+                    text(f"SELECT * FROM sportevent {where}ORDER BY commence_time, id LIMIT :limit"),
+                    params,
+                )
+                return [SportEvent(**dict(row._mapping)) for row in result.fetchall()]
+        except Exception as e:
+            logger.error(f"Error getting events page: {e}")
+            raise e
+
+    async def get_eventoffers_page(
+        self,
+        limit: int,
+        after: tuple | None = None,
+        event_id: str | None = None,
+        sport_key: str | None = None,
+        team: str | None = None,
+        bookmaker: str | None = None,
+        offer_type: str | None = None,
+    ) -> list[EventOffer]:
+        """
+        Up to `limit` offers ordered by (timestamp, event_id, bookmaker, offer_type, choice),
+        strictly after the `after` key.
+        """
+        try:
+            logger.info(f"Fetching eventoffers page after={after} event_id={event_id}")
+            clauses, params = [], {"limit": limit}
+            if after is not None:
+                # The plain timestamp bound lets chunk exclusion and the timestamp index
+                # apply; the row comparison then skips ties already returned
+                clauses.append("o.timestamp >= :after_ts")
+                clauses.append(
+                    "(o.timestamp, o.event_id, o.bookmaker, o.offer_type, o.choice) > "
+                    "(:after_ts, :after_event, :after_bookmaker, :after_offer_type, :after_choice)"
+                )
+                (
+                    params["after_ts"],
+                    params["after_event"],
+                    params["after_bookmaker"],
+                    params["after_offer_type"],
+                    params["after_choice"],
+                ) = after
+            for column, value in (
+                ("o.event_id", event_id),
+                ("o.bookmaker", bookmaker),
+                ("o.offer_type", offer_type),
+            ):
+                if value:
+                    name = column.removeprefix("o.")
+                    clauses.append(f"{column} = :{name}")
+                    params[name] = value
+            join = ""
+            if sport_key or team:
+                join = "JOIN sportevent e ON e.id = o.event_id "
+                if sport_key:
+                    clauses.append("e.sport_key = :sport_key")
+                    params["sport_key"] = sport_key
+                if team:
+                    clauses.append("(e.home_team = :team OR e.away_team = :team)")
+                    params["team"] = team
+            where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+            columns = ", ".join(f"o.{c}" for c in EVENTOFFER_COLUMNS)
+            sql = (
+                f"SELECT {columns} FROM eventoffer o {join}{where}"
+                "ORDER BY o.timestamp, o.event_id, o.bookmaker, o.offer_type, o.choice "
+                "LIMIT :limit"
+            )
+            async with self._read_session() as session:
+                result = await session.execute(text(sql), params)
+                return [
+                    EventOffer(**dict(zip(EVENTOFFER_COLUMNS, row, strict=True)))
+                    for row in result.fetchall()
+                ]
+        except Exception as e:
+            logger.error(f"Error getting eventoffers page: {e}")
+            raise e
+
+    async def get_event_rows(self, **filters) -> list[tuple]:
+        """Like get_events, but returns asyncpg records in SPORTEVENT_COLUMNS order."""
+        try:
+            logger.info(f"Fetching event rows with {filters}")
+            clauses, params = [], {}
+            for key, value in filters.items():
+                column = key.removeprefix("not_")
+                if column not in SPORTEVENT_COLUMNS:
+                    raise ValueError(f"Invalid filter: {key}")
+                operator = "!=" if key.startswith("not_") else "="
+                clauses.append(f"{column} {operator} :{column}")
+                params[column] = value
+            where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+            sql = f"SELECT {', '.join(SPORTEVENT_COLUMNS)} FROM sportevent{where}"
+            async with self._read_session() as session:
+                return await self._fetch_records(session, sql, params)
+        except Exception as e:
+            logger.error(f"Error getting event rows: {e}")
+            raise e
+
+    async def get_eventoffer_rows(
+        self, event_id: str, offer_type: str | None = None, first_last: bool = False
+    ) -> list[tuple]:
+        """
+        Like get_eventoffers_for_sportevent, but returns rows in EVENTOFFER_COLUMNS
+        order: tuples from the hot cache, asyncpg records from the DB.
+        """
+        try:
+            logger.info(f"Fetching eventoffer rows for event ID {event_id} (range={first_last})")
+            if self.hot_cache is not None and event_id in self.hot_cache:
+                return self.hot_cache.get_eventoffer_rows(
+                    event_id, offer_type=offer_type, first_last=first_last
+                ) or []
+            columns = ", ".join(EVENTOFFER_COLUMNS)
+            where = (
+                'WHERE "event_id" = :event_id '
+                "AND (CAST(:offer_type AS varchar) IS NULL OR offer_type = :offer_type) "
+            )
+            if first_last:
+                sql = " UNION ALL ".join(
+                    "(SELECT DISTINCT ON (event_id, bookmaker, offer_type, choice) "
+                    f"{columns} FROM eventoffer {where}"
+                    f"ORDER BY event_id, bookmaker, offer_type, choice, timestamp {direction})"
+                    for direction in ("ASC", "DESC")
+                )
+            else:
+                sql = f"SELECT {columns} FROM eventoffer {where}"
+            async with self._read_session() as session:
+                return await self._fetch_records(
+                    session, sql, {"event_id": event_id, "offer_type": offer_type}
+                )
+        except Exception as e:
+            logger.error(f"Error getting eventoffer rows for event {event_id}: {e}")
+            raise e
+
+    async def get_team_eventoffer_rows(
+        self, team_abbr: str, upcoming: bool = False, latest: bool = False
+    ) -> list[tuple]:
+        """
+        Offers for every event a team plays in from one join on sportevent, as asyncpg
+        records in EVENTOFFER_COLUMNS order. `upcoming` skips events that already started and
+        `latest` keeps only the last quote per market key.
+        """
+        try:
+            logger.info(f"Fetching eventoffer rows for team:{team_abbr} (upcoming={upcoming})")
+            columns = ", ".join(f"o.{c}" for c in EVENTOFFER_COLUMNS)
+            where = "WHERE (e.home_team = :team_abbr OR e.away_team = :team_abbr) "
+            if upcoming:
+                where += "AND e.commence_time::timestamptz >= now() "
+            if latest:
+                sql = (
+                    "SELECT DISTINCT ON (o.event_id, o.bookmaker, o.offer_type, o.choice) "
+                    f"{columns} FROM eventoffer o JOIN sportevent e ON e.id = o.event_id {where}"
+                    "ORDER BY o.event_id, o.bookmaker, o.offer_type, o.choice, o.timestamp DESC"
+                )
+            else:
+                sql = (
+                    f"SELECT {columns} FROM eventoffer o JOIN sportevent e ON e.id = o.event_id "
+                    f"{where}ORDER BY e.commence_time, o.event_id, o.timestamp"
+                )
+            async with self._read_session() as session:
+                return await self._fetch_records(session, sql, {"team_abbr": team_abbr})
+        except Exception as e:
+            logger.error(f"Error getting eventoffer rows for team {team_abbr}: {e}")
+            raise e
+
+    async def get_team_eventoffers(
+        self, team_abbr: str, upcoming: bool = False, latest: bool = False
+    ) -> list[EventOffer]:
+        rows = await self.get_team_eventoffer_rows(team_abbr, upcoming=upcoming, latest=latest)
+        return [EventOffer(**dict(zip(EVENTOFFER_COLUMNS, row, strict=True))) for row in rows]
+
     async def get_sporteventdata(
         self,
         event_id: str,
@@ -146,7 +686,11 @@ class PostgresClient:
     ) -> SportEventData | None:
         try:
             logger.info(f"Fetching event with ID {event_id}")
-            async with self.session_maker() as session:
+            if self.hot_cache is not None and event_id in self.hot_cache:
+                return self.hot_cache.get_sporteventdata(
+                    event_id, offer_type=offer_type, first_last=first_last
+                )
+            async with self._read_session() as session:
                 event = await session.get(SportEvent, event_id)
                 if event is None:
                     return None
@@ -172,6 +716,114 @@ class PostgresClient:
             logger.error(f"Error getting events: {e}")
             raise e
 
+    async def get_sporteventdata_batch(
+        self,
+        event_ids: list[str] | None = None,
+        sport_key: str | None = None,
+        season: int | None = None,
+        week: int | None = None,
+        offer_type: str | None = None,
+        mode: str = "all",
+        limit: int | None = None,
+    ) -> list[SportEventData]:
+        """
+        SportEventData for up to `limit` events from a constant number of queries.
+
+        `mode` is "all" for full histories, "latest" for the last quote per market
+        key, or "range" for the first and last quote per market key. Week filtering
+        relies on nfl_data_py game ids ("<season>_<week>_<away>_<home>").
+        """
+        try:
+            logger.info(f"Fetching batch of events ids={event_ids} sport_key={sport_key}")
+            clauses, params = [], {}
+            if event_ids is not None:
+                clauses.append("id = ANY(:ids)")
+                params["ids"] = event_ids
+            if sport_key:
+                clauses.append("sport_key = :sport_key")
+                params["sport_key"] = sport_key
+            if season is not None:
+                prefix = f"{season}_" if week is None else f"{season}_{week:02d}_"
+                clauses.append("starts_with(id, :prefix)")
+                params["prefix"] = prefix
+            where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+            limit_clause = ""
+            if limit is not None:
+                limit_clause = "LIMIT :limit"
+                params["limit"] = limit
+
+            async with self._read_session() as session:
+                result = await session.execute(
+                    text(
+                        f"SELECT * FROM sportevent {where}ORDER BY commence_time, id {limit_clause}"
+                    ),
+                    params,
+                )
+                events = [SportEvent(**dict(row._mapping)) for row in result.fetchall()]
+                rows = await self._eventoffer_rows_batch(
+                    session, [e.id for e in events], offer_type, mode
+                )
+            offers: dict[str, list[EventOffer]] = {e.id: [] for e in events}
+            for row in rows:
+                offers[row[0]].append(EventOffer(**dict(zip(EVENTOFFER_COLUMNS, row, strict=True))))
+
+            return [SportEventData(event=e, offers=offers[e.id]) for e in events]
+        except Exception as e:
+            logger.error(f"Error getting batch of events: {e}")
+            raise e
+
+    async def get_eventoffer_rows_batch(
+        self, event_ids: list[str], offer_type: str | None = None, mode: str = "all"
+    ) -> list[tuple]:
+        """Offer rows of many events in EVENTOFFER_COLUMNS order, see get_sporteventdata_batch."""
+        try:
+            logger.info(f"Fetching eventoffer rows for {len(event_ids)} events (mode={mode})")
+            async with self._read_session() as session:
+                return await self._eventoffer_rows_batch(session, event_ids, offer_type, mode)
+        except Exception as e:
+            logger.error(f"Error getting batch of eventoffer rows: {e}")
+            raise e
+
+    async def _eventoffer_rows_batch(
+        self, session, event_ids: list[str], offer_type: str | None, mode: str
+    ) -> list[tuple]:
+        rows, uncached = [], []
+        for event_id in event_ids:
+            if self.hot_cache is not None and event_id in self.hot_cache:
+                rows.extend(
+                    self.hot_cache.get_eventoffer_rows(
+                        event_id,
+                        offer_type=offer_type,
+                        first_last=mode == "range",
+                        latest=mode == "latest",
+                    )
+                    or []
+                )
+            else:
+                uncached.append(event_id)
+        if not uncached:
+            return rows
+
+        columns = ", ".join(EVENTOFFER_COLUMNS)
+        where = (
+            "WHERE event_id = ANY(:ids) "
+            "AND (CAST(:offer_type AS varchar) IS NULL OR offer_type = :offer_type) "
+        )
+        distinct = (
+            f"(SELECT DISTINCT ON (event_id, bookmaker, offer_type, choice) {columns} "
+            f"FROM eventoffer {where}"
+            "ORDER BY event_id, bookmaker, offer_type, choice, timestamp {})"
+        )
+        if mode == "latest":
+            sql = distinct.format("DESC")
+        elif mode == "range":
+            sql = f"{distinct.format('ASC')} UNION ALL {distinct.format('DESC')}"
+        else:
+            sql = f"SELECT {columns} FROM eventoffer {where}"
+        result = await session.execute(text(sql), {"ids": uncached, "offer_type": offer_type})
+        rows.extend(tuple(row) for row in result.fetchall())
+        return rows
+
     async def get_eventoffers_for_sportevent(
         self, event_id: str, offer_type: str | None = None, first_last: bool = False
     ) -> list[EventOffer]:
@@ -179,7 +831,11 @@ class PostgresClient:
             logger.info(
                 f"Fetching eventoffers for event ID {event_id} (range={first_last})"
             )
-            async with self.session_maker() as session:
+            if self.hot_cache is not None and event_id in self.hot_cache:
+                return self.hot_cache.get_eventoffers(
+                    event_id, offer_type=offer_type, first_last=first_last
+                ) or []
+            async with self._read_session() as session:
                 return await self._fetch_eventoffers_for_sportevent(
                     session,
                     event_id,
@@ -203,9 +859,10 @@ class PostgresClient:
                     text(
                         "SELECT DISTINCT ON (event_id, bookmaker, offer_type, choice) * FROM eventoffer "
                         'WHERE "event_id" = :event_id '
+                        "AND (CAST(:offer_type AS varchar) IS NULL OR offer_type = :offer_type) "
                         "ORDER BY event_id, bookmaker, offer_type, choice, timestamp ASC"
                     ),
-                    {"event_id": event_id},
+                    {"event_id": event_id, "offer_type": offer_type},
                 )
                 first_offers = {
                     (row.event_id, row.bookmaker, row.offer_type, row.choice): EventOffer(**dict(row._mapping))
@@ -216,9 +873,10 @@ class PostgresClient:
                     text(
                         "SELECT DISTINCT ON (event_id, bookmaker, offer_type, choice) * FROM eventoffer "
                         'WHERE "event_id" = :event_id '
+                        "AND (CAST(:offer_type AS varchar) IS NULL OR offer_type = :offer_type) "
                         "ORDER BY event_id, bookmaker, offer_type, choice, timestamp DESC"
                     ),
-                    {"event_id": event_id},
+                    {"event_id": event_id, "offer_type": offer_type},
                 )
                 last_offers = {
                     (row.event_id, row.bookmaker, row.offer_type, row.choice): EventOffer(**dict(row._mapping))
@@ -249,7 +907,9 @@ class PostgresClient:
     ) -> list[EventOffer]:
         try:
             logger.debug(f"Fetching history for event:{event_id} offer {offer_type}")
-            async with self.session_maker() as session:
+            if self.hot_cache is not None and event_id in self.hot_cache:
+                return self.hot_cache.get_eventoffer_history(offer_type, event_id, limit) or []
+            async with self._read_session() as session:
                 result = await session.execute(
                     text(
                         'SELECT * FROM eventoffer WHERE offer_type = :offer_type AND "event_id" = :event_id '
@@ -271,10 +931,380 @@ class PostgresClient:
             logger.error(f"Error getting eventoffer history: {e}")
             raise e
 
+    async def get_eventoffer_series(
+        self,
+        event_id: str,
+        offer_type: str,
+        bucket: timedelta,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[tuple]:
+        """
+        Prices resampled to `bucket` per (bookmaker, choice), gap-filled with
+        the last observed value. Rows are (bucket, bookmaker, choice, price, point).
+        Raises ValueError when the range spans more than SERIES_MAX_BUCKETS buckets.
+        """
+        try:
+            logger.debug(f"Fetching {bucket} series for event:{event_id} offer {offer_type}")
+            start = start and as_utc(start)
+            end = end and as_utc(end)
+            async with self._read_session() as session:
+                if start is None or end is None:
+                    result = await session.execute(
+                        text(
+                            "SELECT min(timestamp), max(timestamp) FROM eventoffer "
+                            'WHERE "event_id" = :event_id AND offer_type = :offer_type'
+                        ),
+                        {"event_id": event_id, "offer_type": offer_type},
+                    )
+                    first, last = result.one()
+                    if first is None:
+                        return []
+                    start = start or first
+                    end = end or last
+                    if start > end:
+                        # The open end of the range lies beyond the event's quotes
+                        return []
+                buckets = (end - start) / bucket
+                if buckets > config.SERIES_MAX_BUCKETS:
+                    raise ValueError(
+                        f"Series of {buckets:.0f} {bucket} buckets exceeds the limit of "
+                        f"{config.SERIES_MAX_BUCKETS}. Use a wider bucket or a shorter range."
+                    )
+                # Leading buckets carry the last quote from before `start` forward
+                seed = (
+                    "(SELECT p.{column} FROM eventoffer p "
+                    "WHERE p.event_id = :event_id AND p.offer_type = :offer_type "
+                    "AND p.bookmaker = eventoffer.bookmaker AND p.choice = eventoffer.choice "
+                    "AND p.timestamp < :start ORDER BY p.timestamp DESC LIMIT 1)"
+                )
+                result = await session.execute(
+                    text(
+                        "SELECT time_bucket_gapfill(:bucket, timestamp, "
+                        "CAST(:start AS timestamptz), CAST(:end AS timestamptz)) AS bucket, "
+                        "bookmaker, choice, "
+                        f"locf(last(price, timestamp), prev => {seed.format(column='price')}) "
+                        "AS price, "
+                        f"locf(last(point, timestamp), prev => {seed.format(column='point')}) "
+                        "AS point "
+                        "FROM eventoffer "
+                        'WHERE "event_id" = :event_id AND offer_type = :offer_type '
+                        "AND timestamp >= :start AND timestamp <= :end "
+                        "GROUP BY bucket, bookmaker, choice "
+                        "ORDER BY bookmaker, choice, bucket"
+                    ),
+                    {
+                        "bucket": bucket,
+                        "start": start,
+                        "end": end,
+                        "event_id": event_id,
+                        "offer_type": offer_type,
+                    },
+                )
+                return [tuple(row) for row in result.fetchall()]
+        except Exception as e:
+            logger.error(f"Error getting eventoffer series for event {event_id}: {e}")
+            raise e
+
+    @staticmethod
+    def _asof_filters(
+        sport_key: str | None, bookmaker: str | None, offer_type: str | None
+    ) -> tuple[str, str, dict]:
+        join, where, params = "", "", {}
+        if sport_key:
+            join = "JOIN sportevent se ON se.id = eo.event_id AND se.sport_key = :sport_key "
+            params["sport_key"] = sport_key
+        if bookmaker:
+            where += "AND eo.bookmaker = :bookmaker "
+            params["bookmaker"] = bookmaker
+        if offer_type:
+            where += "AND eo.offer_type = :offer_type "
+            params["offer_type"] = offer_type
+        return join, where, params
+
+    async def get_eventoffers_asof(
+        self,
+        at: datetime,
+        sport_key: str | None = None,
+        bookmaker: str | None = None,
+        offer_type: str | None = None,
+    ) -> list[EventOffer]:
+        """Last quote at or before `at` for every market key."""
+        try:
+            logger.info(f"Fetching eventoffers as of {at}")
+            join, where, params = self._asof_filters(sport_key, bookmaker, offer_type)
+            async with self._read_session() as session:
+                result = await session.execute(
+                    text(
+                        "SELECT DISTINCT ON (eo.event_id, eo.bookmaker, eo.offer_type, eo.choice) "
+                        f"eo.* FROM eventoffer eo {join}"
+                        f"WHERE eo.timestamp <= :at {where}"
+                        "ORDER BY eo.event_id, eo.bookmaker, eo.offer_type, eo.choice, "
+                        "eo.timestamp DESC"
+                    ),
+                    {"at": at, **params},
+                )
+                return [EventOffer(**dict(row._mapping)) for row in result.fetchall()]
+        except Exception as e:
+            logger.error(f"Error getting eventoffers as of {at}: {e}")
+            raise e
+
+    async def get_eventoffers_asof_batch(
+        self,
+        ats: list[datetime],
+        sport_key: str | None = None,
+        bookmaker: str | None = None,
+        offer_type: str | None = None,
+    ) -> dict[datetime, list[EventOffer]]:
+        """As-of snapshots for several timestamps in a single round trip."""
+        try:
+            logger.info(f"Fetching eventoffers as of {len(ats)} timestamps")
+            join, where, params = self._asof_filters(sport_key, bookmaker, offer_type)
+            snapshots: dict[datetime, list[EventOffer]] = {at: [] for at in ats}
+            async with self._read_session() as session:
+                result = await session.execute(
+                    text(
+                        "SELECT t.asof, s.* FROM unnest(CAST(:ats AS timestamptz[])) AS t(asof) "
+                        "CROSS JOIN LATERAL ("
+                        "SELECT DISTINCT ON (eo.event_id, eo.bookmaker, eo.offer_type, eo.choice) "
+                        f"eo.* FROM eventoffer eo {join}"
+                        f"WHERE eo.timestamp <= t.asof {where}"
+                        "ORDER BY eo.event_id, eo.bookmaker, eo.offer_type, eo.choice, "
+                        "eo.timestamp DESC"
+                        ") s"
+                    ),
+                    {"ats": ats, **params},
+                )
+                for row in result.fetchall():
+                    values = dict(row._mapping)
+                    asof = values.pop("asof")
+                    snapshots.setdefault(asof, []).append(EventOffer(**values))
+            return snapshots
+        except Exception as e:
+            logger.error(f"Error getting batch eventoffers as of: {e}")
+            raise e
+
+    async def stream_eventoffer_rows(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        event_id: str | None = None,
+        bookmaker: str | None = None,
+        offer_type: str | None = None,
+        chunk_size: int = 10000,
+    ) -> AsyncIterator[list[tuple]]:
+        """
+        Yield eventoffer rows in chunks from a server-side cursor. Rows are
+        (event_id, bookmaker, offer_type, choice, timestamp, price, point).
+        """
+        clauses, params = [], {}
+        for column, op, value in (
+            ("timestamp", ">=", start),
+            ("timestamp", "<", end),
+            ("event_id", "=", event_id),
+            ("bookmaker", "=", bookmaker),
+            ("offer_type", "=", offer_type),
+        ):
+            if value is not None:
+                name = f"{column}_{len(params)}"
+                clauses.append(f'"{column}" {op} :{name}')
+                params[name] = value
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        try:
+            logger.info(f"Streaming eventoffer rows with {params}")
+            async with (await self._read_engine()).connect() as conn:
+                result = await conn.stream(
+                    text(
+                        "SELECT event_id, bookmaker, offer_type, choice, timestamp, price, point "
+                        f"FROM eventoffer {where}ORDER BY timestamp"
+                    ),
+                    params,
+                )
+                async for rows in result.partitions(chunk_size):
+                    yield [tuple(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Error streaming eventoffer rows: {e}")
+            raise e
+
+    async def freeze_closing_lines(self, since: datetime | None = None) -> int:
+        """
+        Snapshot the last pre-kickoff quote per market key for events that kicked
+        off after `since` (default: within CLOSING_LINE_WINDOW_HOURS). Bounding the
+        kickoff range keeps events without pre-kickoff quotes from being rescanned
+        on every call.
+        """
+        now = get_utc_now()
+        if since is None:
+            since = now - timedelta(hours=config.CLOSING_LINE_WINDOW_HOURS)
+        try:
+            async with self._session() as session:
+                result = await session.execute(
+                    text(
+                        "INSERT INTO closingline "
+                        "(event_id, bookmaker, offer_type, choice, timestamp, price, point, captured_at) "
+                        "SELECT DISTINCT ON (eo.event_id, eo.bookmaker, eo.offer_type, eo.choice) "
+                        "eo.event_id, eo.bookmaker, eo.offer_type, eo.choice, eo.timestamp, "
+                        "eo.price, eo.point, now() "
+                        "FROM sportevent se JOIN eventoffer eo ON eo.event_id = se.id "
+                        "AND eo.timestamp <= CAST(se.commence_time AS timestamptz) "
+                        # commence_time is stored as UTC ISO text, so the range compares
+                        # as strings and can use ix_sportevent_commence_id
+                        "WHERE se.commence_time > :since AND se.commence_time <= :now "
+                        # Per market key, so books stored after another book's line was
+                        # frozen are still captured
+                        "AND NOT EXISTS (SELECT 1 FROM closingline cl "
+                        "WHERE cl.event_id = eo.event_id AND cl.bookmaker = eo.bookmaker "
+                        "AND cl.offer_type = eo.offer_type AND cl.choice = eo.choice) "
+                        "ORDER BY eo.event_id, eo.bookmaker, eo.offer_type, eo.choice, "
+                        "eo.timestamp DESC "
+                        "ON CONFLICT DO NOTHING"
+                    ),
+                    {
+                        "since": since.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "now": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    },
+                )
+                await session.commit()
+                frozen = result.rowcount or 0
+                if frozen:
+                    logger.info(f"Froze {frozen} closing lines")
+                return frozen
+        except Exception as e:
+            logger.error(f"Error freezing closing lines: {e}")
+            raise e
+
+    async def get_closing_lines(self, event_ids: list[str]) -> list[ClosingLine]:
+        try:
+            logger.info(f"Fetching closing lines for {len(event_ids)} events")
+            async with self._read_session() as session:
+                query = select(ClosingLine).where(
+                    ClosingLine.event_id.in_(event_ids)  # type: ignore
+                )
+                result = await session.execute(query)
+                return list(result.scalars().all())
+        except Exception as e:
+            logger.error(f"Error getting closing lines: {e}")
+            raise e
+
+    async def acquire_lease(
+        self, name: str, holder: str, ttl: timedelta, min_age: timedelta = timedelta(0)
+    ) -> bool:
+        """
+        Take the lease `name` unless another holder's lease is still live, or the
+        last collection under it started less than `min_age` ago.
+        """
+        try:
+            async with self._session() as session:
+                result = await session.execute(
+                    text(
+                        "INSERT INTO collectorlease (name, holder, acquired_at, expires_at) "
+                        "VALUES (:name, :holder, now(), now() + CAST(:ttl AS interval)) "
+                        "ON CONFLICT (name) DO UPDATE SET holder = EXCLUDED.holder, "
+                        "acquired_at = EXCLUDED.acquired_at, expires_at = EXCLUDED.expires_at "
+                        "WHERE collectorlease.expires_at <= now() "
+                        "AND (collectorlease.collected_at IS NULL "
+                        "OR collectorlease.collected_at <= now() - CAST(:min_age AS interval)) "
+                        "RETURNING holder"
+                    ),
+                    {"name": name, "holder": holder, "ttl": ttl, "min_age": min_age},
+                )
+                acquired = result.scalar_one_or_none() is not None
+                await session.commit()
+                return acquired
+        except Exception as e:
+            logger.error(f"Error acquiring lease {name}: {e}")
+            raise e
+
+    async def renew_lease(self, name: str, holder: str, ttl: timedelta) -> bool:
+        """Extend a held lease; False when it expired and was taken over meanwhile."""
+        try:
+            async with self._session() as session:
+                result = await session.execute(
+                    text(
+                        "UPDATE collectorlease SET expires_at = now() + CAST(:ttl AS interval) "
+                        "WHERE name = :name AND holder = :holder RETURNING name"
+                    ),
+                    {"name": name, "holder": holder, "ttl": ttl},
+                )
+                renewed = result.scalar_one_or_none() is not None
+                await session.commit()
+                return renewed
+        except Exception as e:
+            logger.error(f"Error renewing lease {name}: {e}")
+            raise e
+
+    async def release_lease(self, name: str, holder: str, collected: bool) -> None:
+        """Expire a held lease, recording its start as the last collection when `collected`."""
+        try:
+            async with self._session() as session:
+                await session.execute(
+                    text(
+                        "UPDATE collectorlease SET expires_at = now(), collected_at = "
+                        "CASE WHEN :collected THEN acquired_at ELSE collected_at END "
+                        "WHERE name = :name AND holder = :holder"
+                    ),
+                    {"name": name, "holder": holder, "collected": collected},
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Error releasing lease {name}: {e}")
+            raise e
+
+    async def get_leases(self) -> list[CollectorLease]:
+        try:
+            async with self._session() as session:
+                result = await session.execute(
+                    select(CollectorLease).order_by(CollectorLease.name)  # type: ignore
+                )
+                return list(result.scalars().all())
+        except Exception as e:
+            logger.error(f"Error getting leases: {e}")
+            raise e
+
+    async def add_consensuslines(self, lines: list[ConsensusLine]) -> None:
+        if not lines:
+            return
+        try:
+            logger.info(f"Inserting {len(lines)} consensus lines")
+            async with self._session() as session:
+                insert = pg_insert(ConsensusLine).values([line.model_dump() for line in lines])
+                # Lines are stamped with their compute time; a same-instant recompute
+                # replaces the earlier row instead of being dropped
+                await session.execute(
+                    insert.on_conflict_do_update(
+                        index_elements=["event_id", "offer_type", "choice", "timestamp"],
+                        set_={
+                            column: insert.excluded[column]
+                            for column in ConsensusLine.model_fields
+                            if column not in ("event_id", "offer_type", "choice", "timestamp")
+                        },
+                    )
+                )
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Error inserting consensus lines: {e}")
+            raise e
+
+    async def get_consensus_history(
+        self, event_id: str, offer_type: str | None = None
+    ) -> list[ConsensusLine]:
+        try:
+            logger.info(f"Fetching consensus history for event {event_id}")
+            async with self._read_session() as session:
+                query = select(ConsensusLine).where(ConsensusLine.event_id == event_id)
+                if offer_type:
+                    query = query.where(ConsensusLine.offer_type == offer_type)
+                query = query.order_by(ConsensusLine.timestamp)  # type: ignore
+                result = await session.execute(query)
+                return list(result.scalars().all())
+        except Exception as e:
+            logger.error(f"Error getting consensus history for event {event_id}: {e}")
+            raise e
+
     async def add_teamdata(self, teamdata: list[TeamData]):
         try:
             logger.info(f"Upserting teamdata {len(teamdata)}.")
-            async with self.session_maker() as session:
+            async with self._session() as session:
                 # if none exist add all
 
                 result = await session.execute(select(TeamData).limit(1))
@@ -291,7 +1321,7 @@ class PostgresClient:
     async def get_teams(self) -> list[TeamData]:
         try:
             logger.info("Fetching all teams from DB")
-            async with self.session_maker() as session:
+            async with self._session() as session:
                 query = select(TeamData)
                 result = await session.execute(query)
                 teams = list(result.scalars().all())
@@ -303,7 +1333,7 @@ class PostgresClient:
     async def get_events_by_teamabbr(self, team_abbr: str) -> list[SportEvent]:
         try:
             logger.info(f"Fetching events for team:{team_abbr}")
-            async with self.session_maker() as session:
+            async with self._read_session() as session:
                 query = (
                     select(SportEvent).where(
                         (SportEvent.home_team == team_abbr)
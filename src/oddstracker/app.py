@@ -1,26 +1,92 @@
 import logging
 from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Annotated
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import add_pagination
 from prometheus_fastapi_instrumentator import Instrumentator
 from pydantic import __version__
 
 from oddstracker import utils
 from oddstracker.app_initializer import instrument_prometheus, instrument_tracing, setup_tracing
-from oddstracker.config import APP_PORT, LOG_LEVEL
+from oddstracker.config import (
+    APP_PORT,
+    CHANGE_FEED_ENABLED,
+    COLLECT_INTERVAL_SECONDS,
+    CONVERT_EXECUTOR,
+    GZIP_MINIMUM_SIZE,
+    LOG_LEVEL,
+    RESPONSE_CACHE_ENABLED,
+)
 from oddstracker.domain.model.collection_response import CollectionResponse
 from oddstracker.domain.model.healthstatus import HealthStatusResponse
-from oddstracker.domain.model.sportevent import EventOffer, SportEvent, SportEventData
+from oddstracker.domain.model.sportevent import (
+    ClosingLine,
+    ConsensusLine,
+    EventOffer,
+    SportEvent,
+    SportEventData,
+)
 from oddstracker.domain.providers import LEAGUES_SUPPORTED, PROVIDER_KEYS_SUPPORTED
 from oddstracker.service import get_client
+from oddstracker.service.changefeed import get_change_feed
+from oddstracker.service.closingline import (
+    ClvResult,
+    ClvTicket,
+    get_closing_lines,
+    get_ticket_clv,
+)
+from oddstracker.service.collectjobs import CollectJob, get_collect_job_queue
+from oddstracker.service.collectorcoordinator import get_collector_scheduler
+from oddstracker.service.consensus import (
+    get_consensus,
+    get_consensus_history,
+    warm_consensus,
+)
+from oddstracker.service.conversionpool import get_conversion_pool
+from oddstracker.service.dataversion import ConditionalRequestMiddleware
+from oddstracker.service.fastresponse import (
+    get_sportevent_eventoffers_fast,
+    get_sportevents_fast,
+    get_team_event_offers_fast,
+)
 from oddstracker.service.oddschanges import EventLineMovesResponse, get_linemoves
-from oddstracker.service.oddscollector import collect_and_store_bettingdata
+from oddstracker.service.oddsexport import (
+    EXPORT_FORMATS,
+    EXPORT_MEDIA_TYPES,
+    export_eventoffers,
+)
 from oddstracker.service.oddsretriever import (
+    BATCH_MODES,
+    AsOfSnapshot,
+    get_eventoffers_asof,
+    get_eventoffers_asof_batch,
     get_sportevent_eventoffers,
     get_sporteventdata,
+    get_sporteventdata_batch,
     get_sportevents,
 )
+from oddstracker.service.oddsseries import OddsSeriesResponse, get_eventoffer_series
+from oddstracker.service.oddsstream import (
+    STREAM_FORMATS,
+    STREAM_MEDIA_TYPES,
+    stream_eventoffers,
+)
+from oddstracker.service.pagination import (
+    EventOfferPage,
+    SportEventPage,
+    get_eventoffers_page,
+    get_sportevents_page,
+)
+from oddstracker.service.responsecache import ResponseCacheMiddleware
+from oddstracker.service.steamdetector import (
+    MarketVelocity,
+    SteamEvent,
+    get_steam_detector,
+)
 from oddstracker.service.teamprofiler import (
     get_events_by_teamabbr,
     get_team_by_abbr,
@@ -39,10 +105,25 @@ async def lifespan(app: FastAPI):
 
     await get_client().initialize()
     logging.info("PostgresClient initialized.")
+    await warm_consensus()
+    if CHANGE_FEED_ENABLED:
+        await get_change_feed().start()
+        logging.info("Change feed listening.")
+    if COLLECT_INTERVAL_SECONDS > 0:
+        get_collector_scheduler().start()
+    if CONVERT_EXECUTOR == "process":
+        await get_conversion_pool().start()
+    get_collect_job_queue().start()
     logging.info("Application startup complete.")
     yield
 
     logging.info("Application shutdown starting.")
+    await get_collect_job_queue().stop()
+    get_conversion_pool().shutdown()
+    if COLLECT_INTERVAL_SECONDS > 0:
+        await get_collector_scheduler().stop()
+    if CHANGE_FEED_ENABLED:
+        await get_change_feed().stop()
     await get_client().close()
     logging.info("Application shutdown complete.")
 
@@ -56,6 +137,10 @@ app = FastAPI(
     version=__version__,
 )
 add_pagination(app)
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+if RESPONSE_CACHE_ENABLED:
+    app.add_middleware(ResponseCacheMiddleware)
+app.add_middleware(ConditionalRequestMiddleware)
 instrument_tracing(app)
 instrument_prometheus(app)
 
@@ -73,7 +158,7 @@ def health():
 
 @app.put(
     "/collect",
-    summary="Collect SportEvents and BettingData",
+    summary="Queue collection of SportEvents and BettingData",
     response_model_exclude_none=True,
     tags=["DataCollection", "SportEvents"],
     operation_id="collect_sportevents",
@@ -81,11 +166,27 @@ def health():
 async def collect_sportevents(
     provider_key: PROVIDER_KEYS_SUPPORTED = "kambi",
     league: LEAGUES_SUPPORTED = "nfl",
+    wait: bool = False,
 ) -> CollectionResponse:
-    return await collect_and_store_bettingdata(
-        provider_key=provider_key,
-        league=league,
-    )
+    queue = get_collect_job_queue()
+    job = queue.submit(provider_key=provider_key, league=league)
+    if wait:
+        job = await queue.wait(job.job_id)
+    return job.to_response()
+
+
+@app.get(
+    "/collect/{job_id}",
+    summary="Get the status, stage timings and counts of a collection job",
+    response_model_exclude_none=True,
+    tags=["DataCollection"],
+    operation_id="get_collect_job",
+)
+async def get_collect_job(job_id: str) -> CollectJob:
+    job = get_collect_job_queue().get(job_id)
+    if job is None:
+        raise ValueError(f"Collection job '{job_id}' not found.")
+    return job
 
 
 @app.get(
@@ -94,10 +195,90 @@ async def collect_sportevents(
     tags=["SportEvents"],
     operation_id="get_sportevents",
 )
-async def sportevents() -> list[SportEvent]:
+async def sportevents(fast: bool = False, fields: str | None = None) -> list[SportEvent]:
+    if fast or fields:
+        return await get_sportevents_fast(fields=fields)
     return await get_sportevents()
 
 
+@app.get(
+    "/events",
+    summary="Paginated SportEvents ordered by commence time",
+    response_model_exclude_none=True,
+    tags=["SportEvents"],
+    operation_id="get_sportevents_page",
+)
+async def sportevents_page(
+    limit: int = 100,
+    cursor: str | None = None,
+    sport_key: str | None = None,
+    team: str | None = None,
+) -> SportEventPage:
+    return await get_sportevents_page(
+        limit=limit, cursor=cursor, sport_key=sport_key, team=team
+    )
+
+
+@app.get(
+    "/offers",
+    summary="Paginated EventOffers ordered by timestamp",
+    response_model_exclude_none=True,
+    tags=["SportEvents"],
+    operation_id="get_eventoffers_page",
+)
+async def eventoffers_page(
+    limit: int = 100,
+    cursor: str | None = None,
+    event_id: str | None = None,
+    sport_key: str | None = None,
+    team: str | None = None,
+    bookmaker: str | None = None,
+    offer_type: str | None = None,
+) -> EventOfferPage:
+    if offer_type:
+        offer_type = validate_betoffer_type(offer_type)
+    return await get_eventoffers_page(
+        limit=limit,
+        cursor=cursor,
+        event_id=event_id,
+        sport_key=sport_key,
+        team=team,
+        bookmaker=bookmaker,
+        offer_type=offer_type,
+    )
+
+
+@app.get(
+    "/event/batch",
+    summary="SportEventData for many events in one request",
+    response_model_exclude_none=True,
+    tags=["SportEvents"],
+    operation_id="get_sportevent_batch",
+)
+async def sporteventdata_batch(
+    event_id: Annotated[list[str] | None, Query()] = None,
+    sport_key: str | None = None,
+    season: int | None = None,
+    week: int | None = None,
+    offer_type: str | None = None,
+    mode: BATCH_MODES = "latest",
+) -> list[SportEventData]:
+    if offer_type:
+        offer_type = validate_betoffer_type(offer_type)
+    try:
+        return await get_sporteventdata_batch(
+            event_ids=event_id,
+            sport_key=sport_key,
+            season=season,
+            week=week,
+            offer_type=offer_type,
+            mode=mode,
+        )
+    except ValueError as e:
+        # No ids or filters, too many ids, or a selection over the batch cap
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+
 @app.get(
     "/event/{event_id}",
     response_model_exclude_none=True,
@@ -121,7 +302,16 @@ async def sportevent_get_eventoffers(
     event_id: str,
     offer_type: str,
     range: bool = False,
+    fast: bool = False,
+    fields: str | None = None,
 ):
+    if fast or fields:
+        return await get_sportevent_eventoffers_fast(
+            event_id,
+            offer_type=validate_betoffer_type(offer_type),
+            range_query=range,
+            fields=fields,
+        )
     return await get_sportevent_eventoffers(
         event_id,
         offer_type=validate_betoffer_type(offer_type),
@@ -129,6 +319,181 @@ async def sportevent_get_eventoffers(
     )
 
 
+@app.get(
+    "/event/{event_id}/offer/{offer_type}/series",
+    response_model_exclude_none=True,
+    tags=["SportEvents"],
+    summary="Get bucketed, gap-filled price series for charting",
+    operation_id="get_sportevent_offer_series",
+)
+async def sportevent_get_eventoffer_series(
+    event_id: str,
+    offer_type: str,
+    bucket: str = "5m",
+    start: datetime | None = None,
+    end: datetime | None = None,
+    max_points: int | None = None,
+) -> OddsSeriesResponse:
+    offer_type = validate_betoffer_type(offer_type)
+    try:
+        return await get_eventoffer_series(
+            event_id,
+            offer_type=offer_type,
+            bucket=bucket,
+            start=start,
+            end=end,
+            max_points=max_points,
+        )
+    except ValueError as e:
+        # Bad bucket, empty range or too many buckets
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@app.get(
+    "/event/{event_id}/consensus",
+    response_model_exclude_none=True,
+    tags=["SportEvents", "Consensus"],
+    summary="Get the current cross-bookmaker consensus for a sport event",
+    operation_id="get_sportevent_consensus",
+)
+async def sportevent_consensus(
+    event_id: str, offer_type: str | None = None
+) -> list[ConsensusLine]:
+    return await get_consensus(
+        event_id,
+        offer_type=validate_betoffer_type(offer_type) if offer_type else None,
+    )
+
+
+@app.get(
+    "/event/{event_id}/consensus/history",
+    response_model_exclude_none=True,
+    tags=["SportEvents", "Consensus"],
+    summary="Get consensus movement over time for a sport event",
+    operation_id="get_sportevent_consensus_history",
+)
+async def sportevent_consensus_history(
+    event_id: str, offer_type: str | None = None
+) -> list[ConsensusLine]:
+    return await get_consensus_history(
+        event_id,
+        offer_type=validate_betoffer_type(offer_type) if offer_type else None,
+    )
+
+
+@app.get(
+    "/asof",
+    response_model_exclude_none=True,
+    tags=["SportEvents"],
+    summary="Get the last quote per market at or before a point in time",
+    operation_id="get_eventoffers_asof",
+)
+async def eventoffers_asof(
+    at: datetime,
+    sport_key: str | None = None,
+    bookmaker: str | None = None,
+    offer_type: str | None = None,
+) -> list[EventOffer]:
+    return await get_eventoffers_asof(
+        at,
+        sport_key=sport_key,
+        bookmaker=bookmaker,
+        offer_type=validate_betoffer_type(offer_type) if offer_type else None,
+    )
+
+
+@app.post(
+    "/asof",
+    response_model_exclude_none=True,
+    tags=["SportEvents"],
+    summary="Get as-of snapshots for a batch of points in time",
+    operation_id="get_eventoffers_asof_batch",
+)
+async def eventoffers_asof_batch(
+    ats: list[datetime],
+    sport_key: str | None = None,
+    bookmaker: str | None = None,
+    offer_type: str | None = None,
+) -> list[AsOfSnapshot]:
+    return await get_eventoffers_asof_batch(
+        ats,
+        sport_key=sport_key,
+        bookmaker=bookmaker,
+        offer_type=validate_betoffer_type(offer_type) if offer_type else None,
+    )
+
+
+@app.get(
+    "/export",
+    tags=["Export"],
+    summary="Stream odds history as Parquet or Arrow IPC",
+    operation_id="export_eventoffers",
+)
+async def eventoffers_export(
+    format: EXPORT_FORMATS = "parquet",
+    start: datetime | None = None,
+    end: datetime | None = None,
+    event_id: str | None = None,
+    bookmaker: str | None = None,
+    offer_type: str | None = None,
+) -> StreamingResponse:
+    return StreamingResponse(
+        export_eventoffers(
+            format,
+            start=start,
+            end=end,
+            event_id=event_id,
+            bookmaker=bookmaker,
+            offer_type=validate_betoffer_type(offer_type) if offer_type else None,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="eventoffer.{format}"',
+        },
+    )
+
+
+@app.get(
+    "/event/{event_id}/stream",
+    tags=["SportEvents", "Export"],
+    summary="Stream an event's full offer history as NDJSON or CSV",
+    operation_id="stream_sportevent_offers",
+)
+async def sportevent_stream_eventoffers(
+    event_id: str,
+    format: STREAM_FORMATS = "ndjson",
+    offer_type: str | None = None,
+    bookmaker: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_eventoffers(
+            event_id,
+            format,
+            offer_type=validate_betoffer_type(offer_type) if offer_type else None,
+            bookmaker=bookmaker,
+            start=start,
+            end=end,
+        ),
+        media_type=STREAM_MEDIA_TYPES[format],
+    )
+
+
+@app.get(
+    "/changes",
+    tags=["SportEvents"],
+    summary="Server-sent events for every stored ingest change",
+    operation_id="stream_changes",
+)
+async def stream_changes() -> StreamingResponse:
+    return StreamingResponse(
+        get_change_feed().events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @app.get(
     "/team",
     response_model_exclude_none=True,
@@ -158,11 +523,21 @@ async def team_events(team_abbr: str):
     summary="Get event offers for a team",
     operation_id="get_team_event_offers",
 )
-async def team_event_offers(team_abbr: str) -> list[EventOffer]:
+async def team_event_offers(
+    team_abbr: str,
+    upcoming: bool = False,
+    latest: bool = False,
+    fast: bool = False,
+    fields: str | None = None,
+) -> list[EventOffer]:
     team = await get_team_by_abbr(team_abbr)
     if not team or not team.team_nick:
         raise ValueError(f"Team with abbreviation '{team_abbr}' not found.")
-    return await get_team_event_offers(team_abbr)
+    if fast or fields:
+        return await get_team_event_offers_fast(
+            team_abbr, upcoming=upcoming, latest=latest, fields=fields
+        )
+    return await get_team_event_offers(team_abbr, upcoming=upcoming, latest=latest)
 
 
 @app.get(
@@ -176,6 +551,49 @@ async def linemoves() -> list[EventLineMovesResponse]:
     return await get_linemoves()
 
 
+@app.get(
+    "/steam",
+    response_model_exclude_none=True,
+    tags=["OddsChanges"],
+    summary="Get recently detected steam moves",
+    operation_id="get_steam_events",
+)
+async def steam_events(event_id: str | None = None, limit: int = 100) -> list[SteamEvent]:
+    return get_steam_detector().get_events(event_id=event_id, limit=limit)
+
+
+@app.get(
+    "/event/{event_id}/velocity",
+    response_model_exclude_none=True,
+    tags=["OddsChanges", "SportEvents"],
+    summary="Get rolling price velocity per market for a sport event",
+    operation_id="get_sportevent_velocity",
+)
+async def sportevent_velocity(event_id: str) -> list[MarketVelocity]:
+    return get_steam_detector().get_velocities(event_id)
+
+
+@app.get(
+    "/event/{event_id}/closing",
+    response_model_exclude_none=True,
+    tags=["SportEvents", "ClosingLine"],
+    summary="Get the closing line snapshot for a sport event",
+    operation_id="get_sportevent_closing_lines",
+)
+async def sportevent_closing_lines(event_id: str) -> list[ClosingLine]:
+    return await get_closing_lines(event_id)
+
+
+@app.post(
+    "/clv",
+    tags=["ClosingLine"],
+    summary="Compute closing line value for a batch of tickets",
+    operation_id="compute_clv",
+)
+async def clv(tickets: list[ClvTicket]) -> list[ClvResult]:
+    return await get_ticket_clv(tickets)
+
+
 if __name__ == "__main__":
     import uvicorn
 
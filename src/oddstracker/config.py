@@ -1,5 +1,6 @@
 import logging
 import os
+import uuid
 
 from dotenv import load_dotenv
 
@@ -33,6 +34,64 @@ POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
 POSTGRES_PORT = os.getenv("POSTGRES_PORT", "5433")
 POSTGRES_DB = os.getenv("POSTGRES_DB", "oddstracker")
 
+# Connection pool and statement cache settings
+
+PG_POOL_SIZE = int(os.getenv("PG_POOL_SIZE", 5))
+PG_MAX_OVERFLOW = int(os.getenv("PG_MAX_OVERFLOW", 10))
+PG_POOL_TIMEOUT = float(os.getenv("PG_POOL_TIMEOUT", 30))
+PG_POOL_RECYCLE = int(os.getenv("PG_POOL_RECYCLE", 1800))
+PG_POOL_PRE_PING = os.getenv("PG_POOL_PRE_PING", "true").lower() == "true"
+# asyncpg's per-connection prepared statement cache and SQLAlchemy's asyncpg dialect cache
+PG_STATEMENT_CACHE_SIZE = int(os.getenv("PG_STATEMENT_CACHE_SIZE", 500))
+
+# Optional read replicas, comma separated URLs. get_* queries go to a replica whose
+# replication lag is within PG_REPLICA_MAX_LAG_SECONDS and fall back to the primary.
+PG_READ_URLS = [u.strip() for u in os.getenv("PG_READ_URLS", "").split(",") if u.strip()]
+PG_REPLICA_MAX_LAG_SECONDS = float(os.getenv("PG_REPLICA_MAX_LAG_SECONDS", 10))
+PG_REPLICA_CHECK_INTERVAL_SECONDS = float(os.getenv("PG_REPLICA_CHECK_INTERVAL_SECONDS", 5))
+PG_REPLICA_CHECK_TIMEOUT_SECONDS = float(os.getenv("PG_REPLICA_CHECK_TIMEOUT_SECONDS", 1))
+# A replica that heard nothing from the primary for this long is treated as disconnected;
+# keep it above the primary's wal_sender_timeout / 2 keepalive cadence
+PG_REPLICA_MAX_SILENCE_SECONDS = float(os.getenv("PG_REPLICA_MAX_SILENCE_SECONDS", 60))
+
+# "plain" stores eventoffer keys as strings, "encoded" maps them to integer ids in
+# dimension tables behind an `eventoffer` view. Switching an existing DB requires migration.
+EVENTOFFER_STORAGE = os.getenv("EVENTOFFER_STORAGE", "plain").lower()
+
+# Number of concurrent DB writers a collection cycle is sharded across by event_id
+INGEST_WRITERS = max(int(os.getenv("INGEST_WRITERS", 1)), 1)
+
+# Ingest changes are published with NOTIFY so every API replica can invalidate its caches
+CHANGE_FEED_ENABLED = os.getenv("CHANGE_FEED_ENABLED", "true").lower() == "true"
+CHANGE_FEED_CHANNEL = os.getenv("CHANGE_FEED_CHANNEL", "oddstracker_changes")
+
+# Identifies this replica in change notifications and collector leases
+INSTANCE_ID = os.getenv("INSTANCE_ID") or uuid.uuid4().hex[:12]
+
+# Collector coordination: at most one replica collects a provider/league at a time.
+# A lease not renewed within COLLECTOR_LEASE_SECONDS fails over to another replica.
+COLLECTOR_COORDINATION = os.getenv("COLLECTOR_COORDINATION", "true").lower() == "true"
+COLLECTOR_LEASE_SECONDS = float(os.getenv("COLLECTOR_LEASE_SECONDS", 120))
+# Scheduled collection every COLLECT_INTERVAL_SECONDS (0 disables) of the
+# "provider:league" COLLECT_TARGETS, spread across replicas
+COLLECT_INTERVAL_SECONDS = float(os.getenv("COLLECT_INTERVAL_SECONDS", 0))
+COLLECT_TARGETS = [
+    (provider.strip(), league.strip() or "nfl")
+    for provider, _, league in (
+        item.partition(":") for item in os.getenv("COLLECT_TARGETS", "kambi:nfl").split(",")
+    )
+    if provider.strip()
+]
+
+# In-process collection job queue behind PUT /collect
+COLLECT_JOB_WORKERS = max(int(os.getenv("COLLECT_JOB_WORKERS", 1)), 1)
+COLLECT_JOB_HISTORY = int(os.getenv("COLLECT_JOB_HISTORY", 200))
+
+# "inline" converts provider payloads on the event loop, "process" in a pool of
+# CONVERT_PROCESSES worker processes with the nfl_data_py reference data preloaded
+CONVERT_EXECUTOR = os.getenv("CONVERT_EXECUTOR", "inline").lower()
+CONVERT_PROCESSES = max(int(os.getenv("CONVERT_PROCESSES", os.cpu_count() or 1)), 1)
+
 TOA_API_KEY = os.environ.get("THEODDSAPI_KEY")
 
 
@@ -42,3 +101,69 @@ def get_pg_url(db: str | None = None) -> str:
         f"postgresql://{POSTGRES_USER}:"
         f"{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{db}"
     )
+
+# Steam detection settings
+
+STEAM_WINDOW_SECONDS = int(os.getenv("STEAM_WINDOW_SECONDS", 900))
+STEAM_BUFFER_SIZE = int(os.getenv("STEAM_BUFFER_SIZE", 32))
+STEAM_MAX_MARKETS = int(os.getenv("STEAM_MAX_MARKETS", 50000))
+STEAM_MIN_BOOKS = int(os.getenv("STEAM_MIN_BOOKS", 3))
+STEAM_MIN_MOVE = float(os.getenv("STEAM_MIN_MOVE", 0.01))
+STEAM_MIN_SYNC = float(os.getenv("STEAM_MIN_SYNC", 0.6))
+STEAM_EVENT_HISTORY = int(os.getenv("STEAM_EVENT_HISTORY", 1000))
+
+# Most events /event/batch returns; larger selections must be narrowed by filters
+BATCH_MAX_EVENTS = int(os.getenv("BATCH_MAX_EVENTS", 500))
+
+# Most buckets a /series request may resample to; narrower buckets over a longer range
+# are rejected rather than gap-filled row by row
+SERIES_MAX_BUCKETS = int(os.getenv("SERIES_MAX_BUCKETS", 5000))
+
+# Consensus settings
+
+CONSENSUS_BOOK_WEIGHTS = {
+    book.strip(): float(weight)
+    for book, _, weight in (
+        item.partition(":")
+        for item in os.getenv("CONSENSUS_BOOK_WEIGHTS", "").split(",")
+        if item.strip()
+    )
+}
+CONSENSUS_OUTLIER_THRESHOLD = float(os.getenv("CONSENSUS_OUTLIER_THRESHOLD", 0.05))
+# Outcomes of events without a new quote for this long are dropped from memory
+CONSENSUS_WINDOW_HOURS = float(os.getenv("CONSENSUS_WINDOW_HOURS", 48))
+
+# Closing lines are frozen for events that kicked off within this window
+CLOSING_LINE_WINDOW_HOURS = float(os.getenv("CLOSING_LINE_WINDOW_HOURS", 24))
+
+# Hot cache settings
+
+HOT_CACHE_ENABLED = os.getenv("HOT_CACHE_ENABLED", "true").lower() == "true"
+HOT_CACHE_WINDOW_HOURS = float(os.getenv("HOT_CACHE_WINDOW_HOURS", 48))
+
+# Response cache settings
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1024))
+RESPONSE_CACHE_TTLS = {
+    "events": 300.0,
+    "event": 300.0,
+    "event_batch": 300.0,
+    "event_offers": 300.0,
+    "teams": 3600.0,
+    "team": 300.0,
+    "linemoves": 300.0,
+    "events_page": 300.0,
+    "offers_page": 300.0,
+} | {
+    route.strip(): float(ttl)
+    for route, _, ttl in (
+        item.partition(":")
+        for item in os.getenv("RESPONSE_CACHE_TTLS", "").split(",")
+        if item.strip()
+    )
+}
+
+# Response compression settings
+
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", 1024))
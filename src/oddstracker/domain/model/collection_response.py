@@ -7,7 +7,11 @@ from oddstracker.domain.providers import PROVIDER_KEYS_SUPPORTED
 
 
 class CollectionResponse(BaseModel):
-    status: Literal["queued", "success"] = Field(default="success")
+    status: Literal["queued", "success", "skipped"] = Field(default="success")
     collected: int = Field(default=0)
+    offers: int = Field(default=0)
+    # Seconds spent per collection stage (fetch, convert, store)
+    stages: dict[str, float] | None = Field(default=None)
+    job_id: str | None = Field(default=None)
     version: str | None = Field(default=__version__)
     provider_key: PROVIDER_KEYS_SUPPORTED | None = Field(default=None)
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime
+from sqlalchemy import String as SAString
+from sqlmodel import Field, SQLModel
+
+
+class CollectorLease(SQLModel, table=True):
+    """
+    Which replica may collect a provider/league. A lease is held until
+    `expires_at`; `collected_at` is when the last successful collection started.
+    """
+
+    __tablename__ = "collectorlease"  # type: ignore
+
+    name: str = Field(sa_column=Column(SAString, primary_key=True, nullable=False))
+    holder: str = Field(sa_column=Column(SAString, nullable=False))
+    acquired_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    expires_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    collected_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
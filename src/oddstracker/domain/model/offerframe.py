@@ -0,0 +1,233 @@
+import logging
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from oddstracker.domain.model.sportevent import EventOffer
+
+logger = logging.getLogger(__name__)
+
+CATEGORICAL = ("event_id", "bookmaker", "offer_type", "choice")
+
+# (event_id, bookmaker, offer_type, choice)
+MarketKey = tuple[str, str, str, str]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def to_micros(ts: datetime) -> int:
+    return (ts - _EPOCH) // timedelta(microseconds=1)
+
+
+def from_micros(us: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(us))
+
+
+class OfferFrameBuilder:
+    """Accumulates offers into compact typed arrays, interning the string columns."""
+
+    def __init__(self):
+        self._index: dict[str, dict[str, int]] = {column: {} for column in CATEGORICAL}
+        self._codes = {column: array("i") for column in CATEGORICAL}
+        self._timestamps = array("q")
+        self._prices = array("d")
+        self._points = array("d")
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def append(
+        self,
+        event_id: str,
+        bookmaker: str,
+        offer_type: str,
+        choice: str,
+        timestamp: datetime,
+        price: float,
+        point: float | None = None,
+    ) -> None:
+        for column, value in zip(CATEGORICAL, (event_id, bookmaker, offer_type, choice), strict=True):
+            index = self._index[column]
+            code = index.get(value)
+            if code is None:
+                code = index[value] = len(index)
+            self._codes[column].append(code)
+        self._timestamps.append(to_micros(timestamp))
+        self._prices.append(price)
+        self._points.append(np.nan if point is None else point)
+
+    def append_offer(self, offer: EventOffer | dict) -> None:
+        if isinstance(offer, dict):
+            self.append(
+                offer["event_id"],
+                offer["bookmaker"],
+                offer["offer_type"],
+                offer["choice"],
+                offer["timestamp"],
+                offer["price"],
+                offer.get("point"),
+            )
+        else:
+            self.append(
+                offer.event_id,
+                offer.bookmaker,
+                offer.offer_type,
+                offer.choice,
+                offer.timestamp,
+                offer.price,
+                offer.point,
+            )
+
+    def build(self) -> "OfferFrame":
+        return OfferFrame(
+            categories={column: list(index) for column, index in self._index.items()},
+            codes={
+                column: np.frombuffer(codes, dtype=np.int32).copy()
+                for column, codes in self._codes.items()
+            },
+            timestamps=np.frombuffer(self._timestamps, dtype=np.int64).copy(),
+            prices=np.frombuffer(self._prices, dtype=np.float64).copy(),
+            points=np.frombuffer(self._points, dtype=np.float64).copy(),
+        )
+
+
+class OfferFrame:
+    """
+    Struct-of-arrays view of many offers for bulk in-process work.
+
+    String key columns are categorical: an int32 code per row into a shared
+    category list. Timestamps are int64 microseconds since the epoch and points
+    are NaN where not quoted. The grouping of rows by market key, ordered by
+    timestamp, is computed once on first use.
+    """
+
+    __slots__ = ("categories", "codes", "timestamps", "prices", "points", "_groups")
+
+    def __init__(
+        self,
+        categories: dict[str, list[str]],
+        codes: dict[str, np.ndarray],
+        timestamps: np.ndarray,
+        prices: np.ndarray,
+        points: np.ndarray,
+    ):
+        self.categories = categories
+        self.codes = codes
+        self.timestamps = timestamps
+        self.prices = prices
+        self.points = points
+        self._groups: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return self.timestamps.shape[0]
+
+    @classmethod
+    def from_offers(cls, offers: Iterable[EventOffer | dict]) -> "OfferFrame":
+        builder = OfferFrameBuilder()
+        for offer in offers:
+            builder.append_offer(offer)
+        return builder.build()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> "OfferFrame":
+        """Rows starting with (event_id, bookmaker, offer_type, choice, timestamp, price, point)."""
+        builder = OfferFrameBuilder()
+        for row in rows:
+            builder.append(*row[:7])
+        return builder.build()
+
+    def value(self, column: str, i: int) -> str:
+        return self.categories[column][self.codes[column][i]]
+
+    def market_codes(self) -> np.ndarray:
+        """One int64 code per row identifying its (event_id, bookmaker, offer_type, choice)."""
+        market = np.zeros(len(self), dtype=np.int64)
+        for column in CATEGORICAL:
+            market = market * max(len(self.categories[column]), 1) + self.codes[column]
+        return market
+
+    def group_index(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (order, starts, ends): `order` sorts rows by market key then timestamp, and
+        order[starts[g]:ends[g]] are the rows of market group g.
+        """
+        if self._groups is None:
+            market = self.market_codes()
+            order = np.lexsort((self.timestamps, market))
+            boundaries = np.flatnonzero(np.diff(market[order])) + 1
+            starts = np.concatenate(([0], boundaries)) if len(self) else boundaries
+            ends = np.concatenate((boundaries, [len(self)])) if len(self) else boundaries
+            self._groups = (order, starts, ends)
+        return self._groups
+
+    def market_key(self, i: int) -> MarketKey:
+        return tuple(self.value(column, i) for column in CATEGORICAL)  # type: ignore[return-value]
+
+    def groups(self) -> dict[MarketKey, np.ndarray]:
+        """Row indices per market key, ordered by timestamp."""
+        order, starts, ends = self.group_index()
+        return {
+            self.market_key(order[start]): order[start:end]
+            for start, end in zip(starts, ends, strict=True)
+        }
+
+    def latest(self) -> np.ndarray:
+        """Index of the last quote of every market key."""
+        order, _, ends = self.group_index()
+        return order[ends - 1]
+
+    def first_last(self) -> np.ndarray:
+        """Indices of the first and last quote of every market key."""
+        order, starts, ends = self.group_index()
+        return np.unique(np.concatenate((order[starts], order[ends - 1])))
+
+    def take(self, indices: np.ndarray) -> "OfferFrame":
+        """Subset of rows sharing this frame's categories."""
+        return OfferFrame(
+            categories=self.categories,
+            codes={column: codes[indices] for column, codes in self.codes.items()},
+            timestamps=self.timestamps[indices],
+            prices=self.prices[indices],
+            points=self.points[indices],
+        )
+
+    def where(self, **equals: str) -> "OfferFrame":
+        """Rows whose categorical columns equal the given values, e.g. where(offer_type="h2h")."""
+        mask = np.ones(len(self), dtype=bool)
+        for column, value in equals.items():
+            try:
+                code = self.categories[column].index(value)
+            except ValueError:
+                return self.take(np.empty(0, dtype=np.int64))
+            mask &= self.codes[column] == code
+        return self.take(np.flatnonzero(mask))
+
+    def row(self, i: int) -> tuple:
+        """Row `i` as (event_id, bookmaker, offer_type, choice, timestamp, price, point)."""
+        point = self.points[i]
+        return (
+            *self.market_key(i),
+            from_micros(self.timestamps[i]),
+            float(self.prices[i]),
+            None if np.isnan(point) else float(point),
+        )
+
+    def rows(self, indices: Iterable[int] | None = None) -> Iterator[tuple]:
+        for i in range(len(self)) if indices is None else indices:
+            yield self.row(i)
+
+    def to_offers(self, indices: Iterable[int] | None = None) -> list[EventOffer]:
+        return [
+            EventOffer(
+                event_id=event_id,
+                bookmaker=bookmaker,
+                offer_type=offer_type,
+                choice=choice,
+                timestamp=timestamp,
+                price=price,
+                point=point,
+            )
+            for event_id, bookmaker, offer_type, choice, timestamp, price, point in self.rows(indices)
+        ]
@@ -42,6 +42,51 @@ class EventOffer(SQLModel, table=True):
         return f"{self.bookmaker} {self.offer_type} {self.choice} @ {self.price}"
 
 
+class ClosingLine(SQLModel, table=True):
+    """Last quote per market key at or before the event's commence_time."""
+
+    __tablename__ = "closingline"  # type: ignore
+
+    event_id: str = Field(sa_column=Column(SAString, primary_key=True, nullable=False))
+    bookmaker: str = Field(sa_column=Column(SAString, primary_key=True, nullable=False))
+    offer_type: str = Field(sa_column=Column(SAString, primary_key=True, nullable=False))
+    choice: str = Field(sa_column=Column(SAString, primary_key=True, nullable=False))
+    timestamp: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    price: float
+    point: float | None = None
+    captured_at: datetime = Field(
+        sa_column=Column(
+            DateTime(timezone=True),
+            nullable=False,
+            default=get_utc_now,
+        ),
+        default_factory=get_utc_now,
+    )
+
+
+class ConsensusLine(SQLModel, table=True):
+    """Cross-bookmaker consensus for one outcome, recorded each time it changes."""
+
+    __tablename__ = "consensusline"  # type: ignore
+
+    event_id: str = Field(sa_column=Column(SAString, primary_key=True, nullable=False))
+    offer_type: str = Field(sa_column=Column(SAString, primary_key=True, nullable=False))
+    choice: str = Field(sa_column=Column(SAString, primary_key=True, nullable=False))
+    timestamp: datetime = Field(
+        sa_column=Column(
+            DateTime(timezone=True),
+            primary_key=True,
+            nullable=False,
+        )
+    )
+    price_median: float
+    price_weighted: float
+    point_median: float | None = None
+    point_weighted: float | None = None
+    books: int
+    excluded: int = 0
+
+
 class SportEvent(SQLModel, table=True):
     id: str = Field(sa_column=Column(String, primary_key=True, nullable=False))
     created_at: datetime = Field(
@@ -69,6 +114,10 @@ class SportEvent(SQLModel, table=True):
     away_team: str
 
 
+EVENTOFFER_COLUMNS: tuple[str, ...] = tuple(EventOffer.model_fields)
+SPORTEVENT_COLUMNS: tuple[str, ...] = tuple(SportEvent.model_fields)
+
+
 class SportEventData(SQLModel):
     event: SportEvent
     offers: list[EventOffer]
@@ -0,0 +1,201 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+
+import orjson
+from prometheus_client import Counter
+
+from oddstracker import config
+from oddstracker.domain.model.offerframe import OfferFrame
+from oddstracker.domain.model.sportevent import SportEventData
+from oddstracker.service import get_client
+from oddstracker.service.consensus import get_consensus_engine
+from oddstracker.service.dataversion import get_data_versions
+from oddstracker.service.responsecache import get_response_cache
+from oddstracker.service.steamdetector import get_steam_detector
+from oddstracker.service.teamprofiler import invalidate_teams
+
+logger = logging.getLogger(__name__)
+
+CHANGES_RECEIVED = Counter(
+    "oddstracker_change_notifications_total",
+    "Change notifications received on the change feed",
+    ["origin"],
+)
+
+# Identifies this process so it can skip re-applying its own notifications
+INSTANCE_ID = config.INSTANCE_ID
+
+# NOTIFY payloads must stay below 8000 bytes
+MAX_PAYLOAD_BYTES = 7500
+
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+def encode_payloads(
+    event_ids: list[str],
+    teams: list[str],
+    version: int,
+    origin: str = INSTANCE_ID,
+    lsn: int = 0,
+) -> list[str]:
+    """Compact JSON change notifications, split so each fits in one NOTIFY."""
+    payloads: list[str] = []
+    batch: list[str] = []
+
+    def _payload(ids: list[str]) -> str:
+        return orjson.dumps(
+            {"origin": origin, "version": version, "lsn": lsn, "events": ids, "teams": teams}
+        ).decode()
+
+    for event_id in event_ids:
+        if batch and len(_payload([*batch, event_id])) > MAX_PAYLOAD_BYTES:
+            payloads.append(_payload(batch))
+            batch = []
+        batch.append(event_id)
+    payloads.append(_payload(batch))
+    return payloads
+
+
+class ChangeFeed:
+    """
+    Publishes ingest changes with NOTIFY and listens for them on a dedicated
+    connection. Changes from other processes invalidate this process's caches;
+    every change is fanned out to push subscribers.
+    """
+
+    def __init__(self, channel: str = config.CHANGE_FEED_CHANNEL):
+        self.channel = channel
+        self._connection = None
+        self._subscribers: set[asyncio.Queue] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._stopping = False
+
+    @property
+    def listening(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    async def start(self) -> None:
+        self._stopping = False
+        self._connection = await get_client().connect_listener()
+        self._connection.add_termination_listener(self._on_terminated)
+        await self._connection.add_listener(self.channel, self._on_notification)
+        logger.info(f"Listening for changes on {self.channel} as {INSTANCE_ID}")
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for task in list(self._tasks):
+            task.cancel()
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+    async def publish(self, sportevents: list[SportEventData], version: int, lsn: int = 0) -> None:
+        teams = sorted({t for s in sportevents for t in (s.event.home_team, s.event.away_team)})
+        payloads = encode_payloads([s.event.id for s in sportevents], teams, version, lsn=lsn)
+        await get_client().notify(self.channel, payloads)
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _on_notification(self, _connection, _pid, _channel, payload: str) -> None:
+        try:
+            change = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Ignoring malformed change notification: {payload[:200]}")
+            return
+        remote = change.get("origin") != INSTANCE_ID
+        CHANGES_RECEIVED.labels(origin="remote" if remote else "local").inc()
+        self._fan_out(change)
+        if remote:
+            self._spawn(self._apply_remote(change))
+
+    def _fan_out(self, change: dict) -> None:
+        for queue in list(self._subscribers):
+            if queue.full():
+                # Slow subscriber: drop its oldest change rather than block the feed
+                queue.get_nowait()
+            queue.put_nowait(change)
+
+    async def _apply_remote(self, change: dict) -> None:
+        """
+        Bring this process up to date with another one's ingest. The hot cache is
+        refreshed before response caches are invalidated and data versions bumped,
+        so no response built from stale data is cached under the new version, and
+        replicas serve reads again only once replayed past the publisher's write.
+        The payload's version is the publisher's own counter and is only logged.
+        """
+        event_ids = change.get("events") or []
+        get_client().require_lsn(change.get("lsn") or 0)
+        try:
+            # Only rows stored since the cache's watermark are read, and the latest
+            # quotes below are then served from the refreshed cache
+            await get_client().refresh_hot_cache(event_ids)
+            rows = await get_client().get_eventoffer_rows_batch(event_ids, mode="latest")
+            frame = OfferFrame.from_rows(rows)
+            get_consensus_engine().update(frame)
+            get_steam_detector().observe_offers(frame.to_offers())
+        except Exception as ex:
+            logger.error(f"Failed to apply remote change {change.get('version')}: {ex}")
+        finally:
+            get_response_cache().invalidate(event_ids, teams=change.get("teams") or [])
+            get_data_versions().bump(event_ids)
+
+    def _on_terminated(self, _connection) -> None:
+        self._connection = None
+        if not self._stopping:
+            logger.warning("Change feed connection lost, reconnecting")
+            self._spawn(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = 1.0
+        while not self._stopping:
+            try:
+                await self.start()
+                break
+            except Exception as ex:
+                logger.error(f"Change feed reconnect failed, retrying in {delay:.0f}s: {ex}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+        # Notifications may have been missed while disconnected
+        get_response_cache().clear()
+        get_data_versions().bump([])
+        invalidate_teams()
+        try:
+            await get_client().warm_hot_cache()
+        except Exception as ex:
+            logger.error(f"Failed to re-warm hot cache after reconnect: {ex}")
+
+    async def events(self, keepalive: float = 15.0) -> AsyncIterator[bytes]:
+        """Server-sent events for every change until the client disconnects."""
+        queue = self.subscribe()
+        try:
+            while True:
+                try:
+                    change = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                yield b"event: change\ndata: " + orjson.dumps(change) + b"\n\n"
+        finally:
+            self.unsubscribe(queue)
+
+
+CHANGE_FEED: ChangeFeed | None = None
+
+
+def get_change_feed() -> ChangeFeed:
+    global CHANGE_FEED
+    if CHANGE_FEED is None:
+        CHANGE_FEED = ChangeFeed()
+    return CHANGE_FEED
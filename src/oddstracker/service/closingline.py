@@ -0,0 +1,96 @@
+import logging
+
+import numpy as np
+from pydantic import BaseModel
+
+from oddstracker.domain.model.sportevent import ClosingLine
+from oddstracker.service import get_client
+
+logger = logging.getLogger(__name__)
+
+
+class ClvTicket(BaseModel):
+    event_id: str
+    offer_type: str
+    choice: str
+    price: float
+    bookmaker: str | None = None
+
+
+class ClvResult(BaseModel):
+    event_id: str
+    offer_type: str
+    choice: str
+    bookmaker: str | None
+    price: float
+    closing_price: float | None
+    clv: float | None
+    clv_implied: float | None
+
+
+def compute_clv(
+    taken: np.ndarray, closing: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Closing line value for decimal prices.
+
+    Returns (price CLV, implied probability CLV); both are positive when the
+    taken price beat the close and NaN where no closing price exists.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        clv = taken / closing - 1.0
+        clv_implied = 1.0 / closing - 1.0 / taken
+    return clv, clv_implied
+
+
+def _closing_reference(
+    closing_lines: list[ClosingLine],
+) -> dict[tuple[str, str, str, str | None], float]:
+    """Closing price per book, plus the cross-book median under bookmaker None."""
+    by_book = {}
+    by_market: dict[tuple[str, str, str], list[float]] = {}
+    for cl in closing_lines:
+        by_book[(cl.event_id, cl.offer_type, cl.choice, cl.bookmaker)] = cl.price
+        by_market.setdefault((cl.event_id, cl.offer_type, cl.choice), []).append(cl.price)
+    for market, prices in by_market.items():
+        by_book[(*market, None)] = float(np.median(prices))
+    return by_book
+
+
+async def get_closing_lines(event_id: str) -> list[ClosingLine]:
+    # Closing lines are frozen by the collector after each cycle, reads never write
+    return await get_client().get_closing_lines([event_id])
+
+
+async def get_ticket_clv(tickets: list[ClvTicket]) -> list[ClvResult]:
+    logger.info(f"Computing CLV for {len(tickets)} tickets")
+    if not tickets:
+        return []
+    event_ids = list({t.event_id for t in tickets})
+    reference = _closing_reference(await get_client().get_closing_lines(event_ids))
+
+    taken = np.fromiter((t.price for t in tickets), dtype=np.float64, count=len(tickets))
+    closing = np.fromiter(
+        (
+            reference.get((t.event_id, t.offer_type, t.choice, t.bookmaker), np.nan)
+            for t in tickets
+        ),
+        dtype=np.float64,
+        count=len(tickets),
+    )
+    clv, clv_implied = compute_clv(taken, closing)
+    found = ~np.isnan(closing)
+
+    return [
+        ClvResult(
+            event_id=t.event_id,
+            offer_type=t.offer_type,
+            choice=t.choice,
+            bookmaker=t.bookmaker,
+            price=t.price,
+            closing_price=float(closing[i]) if found[i] else None,
+            clv=float(clv[i]) if found[i] else None,
+            clv_implied=float(clv_implied[i]) if found[i] else None,
+        )
+        for i, t in enumerate(tickets)
+    ]
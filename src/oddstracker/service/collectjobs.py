@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Literal
+
+from prometheus_client import Counter, Gauge
+from pydantic import BaseModel, Field
+
+from oddstracker import config
+from oddstracker.domain.model.collection_response import CollectionResponse
+from oddstracker.domain.providers import PROVIDER_KEYS_SUPPORTED
+from oddstracker.service.collectorcoordinator import coordinated_collect
+from oddstracker.utils import get_utc_now
+
+logger = logging.getLogger(__name__)
+
+COLLECT_JOBS = Counter(
+    "oddstracker_collect_jobs_total",
+    "Collection jobs by final status",
+    ["provider_key", "league", "status"],
+)
+COLLECT_JOBS_DEDUPED = Counter(
+    "oddstracker_collect_jobs_deduped_total",
+    "Collection submissions joined to an identical queued or running job",
+)
+COLLECT_QUEUE_DEPTH = Gauge(
+    "oddstracker_collect_queue_depth",
+    "Collection jobs waiting for a worker",
+)
+
+JOB_STATUS = Literal["queued", "running", "success", "skipped", "failed"]
+
+
+class CollectJob(BaseModel):
+    job_id: str
+    provider_key: PROVIDER_KEYS_SUPPORTED
+    league: str
+    status: JOB_STATUS = Field(default="queued")
+    submitted_at: datetime = Field(default_factory=get_utc_now)
+    started_at: datetime | None = Field(default=None)
+    finished_at: datetime | None = Field(default=None)
+    # Seconds per stage: queue wait, then the collection's fetch/convert/store
+    stages: dict[str, float] = Field(default_factory=dict)
+    collected: int = Field(default=0)
+    offers: int = Field(default=0)
+    error: str | None = Field(default=None)
+
+    @property
+    def done(self) -> bool:
+        return self.status not in ("queued", "running")
+
+    def to_response(self) -> CollectionResponse:
+        if self.status == "failed":
+            raise ValueError(f"Collection job {self.job_id} failed: {self.error}")
+        return CollectionResponse(
+            status=self.status if self.done else "queued",  # type: ignore
+            collected=self.collected,
+            offers=self.offers,
+            stages=self.stages or None,
+            provider_key=self.provider_key,
+            job_id=self.job_id,
+        )
+
+
+class CollectJobQueue:
+    """
+    In-process queue of collection jobs drained by a fixed set of async workers.
+    Submitting a provider/league that is already queued or running returns the
+    existing job instead of collecting twice. Finished jobs are kept for status
+    lookups up to `history` entries.
+    """
+
+    def __init__(
+        self,
+        workers: int = config.COLLECT_JOB_WORKERS,
+        history: int = config.COLLECT_JOB_HISTORY,
+    ):
+        self.workers = workers
+        self.history = history
+        self._queue: asyncio.Queue[CollectJob] = asyncio.Queue()
+        self._jobs: OrderedDict[str, CollectJob] = OrderedDict()
+        self._inflight: dict[tuple[str, str], CollectJob] = {}
+        self._done: dict[str, asyncio.Event] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, provider_key: PROVIDER_KEYS_SUPPORTED, league: str) -> CollectJob:
+        key = (provider_key, league)
+        if (job := self._inflight.get(key)) is not None:
+            COLLECT_JOBS_DEDUPED.inc()
+            logger.info(f"Joined collection {provider_key}:{league} to job {job.job_id}")
+            return job
+        job = CollectJob(job_id=uuid.uuid4().hex, provider_key=provider_key, league=league)
+        self._inflight[key] = job
+        self._jobs[job.job_id] = job
+        self._done[job.job_id] = asyncio.Event()
+        self._trim()
+        self._queue.put_nowait(job)
+        COLLECT_QUEUE_DEPTH.set(self._queue.qsize())
+        self.start()
+        logger.info(f"Queued collection {provider_key}:{league} as job {job.job_id}")
+        return job
+
+    def get(self, job_id: str) -> CollectJob | None:
+        return self._jobs.get(job_id)
+
+    async def wait(self, job_id: str) -> CollectJob:
+        # Hold on to the job itself: it may be trimmed from history while we wait
+        if (job := self._jobs.get(job_id)) is None:
+            raise ValueError(f"Unknown collection job {job_id}")
+        if (done := self._done.get(job_id)) is not None:
+            await done.wait()
+        return job
+
+    def _trim(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[: max(len(finished) - self.history, 0)]:
+            del self._jobs[job_id]
+            self._done.pop(job_id, None)
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            COLLECT_QUEUE_DEPTH.set(self._queue.qsize())
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: CollectJob) -> None:
+        job.started_at = get_utc_now()
+        job.status = "running"
+        job.stages["queue"] = round((job.started_at - job.submitted_at).total_seconds(), 4)
+        try:
+            response = await coordinated_collect(job.provider_key, job.league)
+            job.status = response.status if response.status == "skipped" else "success"
+            job.collected = response.collected
+            job.offers = response.offers
+            job.stages.update(response.stages or {})
+        except Exception as ex:
+            logger.error(f"Collection job {job.job_id} failed: {ex}")
+            job.status = "failed"
+            job.error = str(ex)
+        finally:
+            job.finished_at = get_utc_now()
+            self._inflight.pop((job.provider_key, job.league), None)
+            self._done[job.job_id].set()
+            COLLECT_JOBS.labels(
+                provider_key=job.provider_key, league=job.league, status=job.status
+            ).inc()
+
+
+COLLECT_JOB_QUEUE: CollectJobQueue | None = None
+
+
+def get_collect_job_queue() -> CollectJobQueue:
+    global COLLECT_JOB_QUEUE
+    if COLLECT_JOB_QUEUE is None:
+        COLLECT_JOB_QUEUE = CollectJobQueue()
+    return COLLECT_JOB_QUEUE
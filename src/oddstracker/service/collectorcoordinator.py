@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
+from prometheus_client import Counter
+
+from oddstracker import config
+from oddstracker.domain.model.collection_response import CollectionResponse
+from oddstracker.domain.providers import PROVIDER_KEYS_SUPPORTED
+from oddstracker.service import get_client
+from oddstracker.service.oddscollector import collect_and_store_bettingdata
+
+logger = logging.getLogger(__name__)
+
+COLLECTIONS = Counter(
+    "oddstracker_coordinated_collections_total",
+    "Coordinated collection attempts by outcome",
+    ["provider_key", "league", "status"],
+)
+
+
+def lease_name(provider_key: str, league: str) -> str:
+    return f"collect:{provider_key}:{league}"
+
+
+def preferred_targets(
+    targets: list[tuple[str, str]], instance_id: str = config.INSTANCE_ID
+) -> list[tuple[str, str]]:
+    """
+    Rendezvous order of the targets for one replica: every replica ranks the
+    targets differently, so concurrent schedulers start on different leases.
+    """
+    return sorted(
+        targets,
+        key=lambda t: zlib.crc32(f"{instance_id}:{t[0]}:{t[1]}".encode()),
+        reverse=True,
+    )
+
+
+class LeaseLostError(RuntimeError):
+    """The lease was taken over, or could not be renewed within its ttl, mid-block."""
+
+
+@asynccontextmanager
+async def collector_lease(
+    name: str,
+    min_age: timedelta = timedelta(0),
+    ttl: timedelta = timedelta(seconds=config.COLLECTOR_LEASE_SECONDS),
+) -> AsyncIterator[bool]:
+    """
+    Hold the lease `name` for the duration of the block, renewing it every third
+    of its ttl. Yields False without entering the lease when another replica
+    holds it. The lease is released as collected only if the block completes.
+
+    Losing the lease cancels the block and raises LeaseLostError, so a replica
+    never keeps storing once another one may have started collecting.
+    """
+    client = get_client()
+    holder = config.INSTANCE_ID
+    if not await client.acquire_lease(name, holder, ttl, min_age):
+        yield False
+        return
+
+    owner = asyncio.current_task()
+    lost: list[str] = []
+    interval = ttl.total_seconds() / 3
+
+    async def _renew():
+        loop = asyncio.get_running_loop()
+        renewed_at = loop.time()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with asyncio.timeout(interval):
+                    if not await client.renew_lease(name, holder, ttl):
+                        lost.append("taken over by another replica")
+                        break
+                renewed_at = loop.time()
+            except Exception as ex:
+                logger.error(f"Failed to renew lease {name}: {ex}")
+                if loop.time() - renewed_at >= ttl.total_seconds():
+                    lost.append(f"not renewed within its {ttl.total_seconds():.0f}s ttl")
+                    break
+        logger.warning(f"Lease {name} was lost while collecting: {lost[0]}")
+        if owner is not None:
+            owner.cancel()
+
+    renewer = asyncio.create_task(_renew())
+    collected = False
+    try:
+        yield True
+        collected = True
+        if lost and owner is not None and owner.cancelling():
+            # The block finished before the renewer's cancellation was delivered
+            owner.uncancel()
+    except asyncio.CancelledError:
+        if not lost or owner is None:
+            raise
+        # Cancelled by the renewer rather than from outside: report the lost lease
+        owner.uncancel()
+        raise LeaseLostError(f"Lease {name} was {lost[0]}") from None
+    finally:
+        renewer.cancel()
+        try:
+            await client.release_lease(name, holder, collected=collected)
+        except Exception as ex:
+            # An unreleased lease still expires after its ttl
+            logger.error(f"Failed to release lease {name}: {ex}")
+
+
+async def coordinated_collect(
+    provider_key: PROVIDER_KEYS_SUPPORTED,
+    league: str,
+    min_interval: float = 0,
+) -> CollectionResponse:
+    """
+    Collect unless another replica is already collecting this provider/league, or
+    one did less than `min_interval` seconds ago.
+    """
+    if not config.COLLECTOR_COORDINATION:
+        return await collect_and_store_bettingdata(provider_key=provider_key, league=league)
+    name = lease_name(provider_key, league)
+    try:
+        async with collector_lease(name, min_age=timedelta(seconds=min_interval)) as acquired:
+            if not acquired:
+                logger.info(f"Skipping {name}, held or recently collected by another replica")
+                COLLECTIONS.labels(provider_key=provider_key, league=league, status="skipped").inc()
+                return CollectionResponse(status="skipped", provider_key=provider_key)
+            response = await collect_and_store_bettingdata(provider_key=provider_key, league=league)
+    except LeaseLostError:
+        COLLECTIONS.labels(provider_key=provider_key, league=league, status="lost").inc()
+        raise
+    COLLECTIONS.labels(provider_key=provider_key, league=league, status=response.status).inc()
+    return response
+
+
+class CollectorScheduler:
+    """
+    Periodically collects every configured target. Any number of replicas may
+    run it: leases make each target collected by one replica per interval, and
+    a replica that dies mid-collection loses its lease after the lease ttl.
+    """
+
+    def __init__(
+        self,
+        targets: list[tuple[str, str]] = config.COLLECT_TARGETS,
+        interval: float = config.COLLECT_INTERVAL_SECONDS,
+    ):
+        self.targets = preferred_targets(targets)
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Collecting {self.targets} every {self.interval:.0f}s")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run_once(self) -> list[CollectionResponse]:
+        responses = []
+        for provider_key, league in self.targets:
+            try:
+                responses.append(
+                    await coordinated_collect(
+                        provider_key,  # type: ignore
+                        league,
+                        # Slightly under the interval so a tick landing just short of
+                        # it still collects
+                        min_interval=self.interval * 0.9,
+                    )
+                )
+            except Exception as ex:
+                logger.error(f"Scheduled collection of {provider_key}:{league} failed: {ex}")
+        return responses
+
+    async def _run(self) -> None:
+        # Tick twice per interval so a target is picked up soon after it becomes due
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval / 2)
+
+
+COLLECTOR_SCHEDULER: CollectorScheduler | None = None
+
+
+def get_collector_scheduler() -> CollectorScheduler:
+    global COLLECTOR_SCHEDULER
+    if COLLECTOR_SCHEDULER is None:
+        COLLECTOR_SCHEDULER = CollectorScheduler()
+    return COLLECTOR_SCHEDULER
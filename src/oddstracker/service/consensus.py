@@ -0,0 +1,208 @@
+import logging
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from oddstracker import config
+from oddstracker.domain.model.offerframe import OfferFrame
+from oddstracker.domain.model.sportevent import ConsensusLine, EventOffer
+from oddstracker.service import get_client
+from oddstracker.utils import get_utc_now
+
+logger = logging.getLogger(__name__)
+
+# (event_id, offer_type, choice)
+GroupKey = tuple[str, str, str]
+
+
+def compute_consensus(
+    prices: np.ndarray,
+    points: np.ndarray,
+    weights: np.ndarray,
+    outlier_threshold: float,
+) -> tuple[float, float, float | None, float | None, int]:
+    """
+    Median and weighted consensus over one outcome's latest quotes.
+
+    Quotes whose implied probability is further than `outlier_threshold` from
+    the median implied probability are excluded. The weighted price is
+    averaged in implied probability space. Points are NaN where not quoted.
+
+    Returns (price_median, price_weighted, point_median, point_weighted, excluded).
+    """
+    implied = 1.0 / prices
+    keep = np.abs(implied - np.median(implied)) <= outlier_threshold
+    if not keep.any():
+        keep = np.ones_like(keep)
+
+    prices, points, weights, implied = prices[keep], points[keep], weights[keep], implied[keep]
+    price_median = float(np.median(prices))
+    price_weighted = float(weights.sum() / (weights * implied).sum())
+
+    quoted = ~np.isnan(points)
+    point_median = point_weighted = None
+    if quoted.any():
+        point_median = float(np.median(points[quoted]))
+        point_weighted = float(np.average(points[quoted], weights=weights[quoted]))
+    return price_median, price_weighted, point_median, point_weighted, int((~keep).sum())
+
+
+class ConsensusEngine:
+    """
+    Keeps the latest quote per bookmaker for every outcome and incrementally
+    recomputes consensus only for outcomes touched by new quotes. State is kept
+    per event and dropped once an event has gone `window` without being seen in
+    an update, so markets whose quotes rarely change stay cached while collected.
+    """
+
+    def __init__(
+        self,
+        book_weights: dict[str, float] | None = None,
+        outlier_threshold: float = config.CONSENSUS_OUTLIER_THRESHOLD,
+        window: timedelta = timedelta(hours=config.CONSENSUS_WINDOW_HOURS),
+    ):
+        self.book_weights = config.CONSENSUS_BOOK_WEIGHTS if book_weights is None else book_weights
+        self.outlier_threshold = outlier_threshold
+        self.window = window
+        # event_id -> (offer_type, choice) -> bookmaker -> (timestamp, price, point)
+        self._quotes: dict[
+            str, dict[tuple[str, str], dict[str, tuple[datetime, float, float]]]
+        ] = {}
+        # event_id -> (offer_type, choice) -> consensus
+        self._cache: dict[str, dict[tuple[str, str], ConsensusLine]] = {}
+        # event_id -> when the event was last seen in an update
+        self._last_seen: dict[str, datetime] = {}
+
+    def __len__(self) -> int:
+        return sum(len(lines) for lines in self._cache.values())
+
+    def update(
+        self, offers: list[EventOffer] | OfferFrame, now: datetime | None = None
+    ) -> list[ConsensusLine]:
+        """
+        Apply new quotes and return the consensus lines that changed, stamped with
+        `now` (default: the current time) so every move gets its own history row.
+        """
+        now = now or get_utc_now()
+        if isinstance(offers, OfferFrame):
+            # Only the last quote of each market key can move the consensus
+            quotes = offers.rows(offers.latest())
+        else:
+            quotes = (
+                (o.event_id, o.bookmaker, o.offer_type, o.choice, o.timestamp, o.price, o.point)
+                for o in offers
+            )
+        touched = set()
+        for event_id, bookmaker, offer_type, choice, timestamp, price, point in quotes:
+            self._last_seen[event_id] = now
+            books = self._quotes.setdefault(event_id, {}).setdefault((offer_type, choice), {})
+            current = books.get(bookmaker)
+            if current is not None and current[0] >= timestamp:
+                continue
+            books[bookmaker] = (timestamp, price, np.nan if point is None else point)
+            touched.add((event_id, offer_type, choice))
+
+        changed = []
+        for group in touched:
+            line = self._compute(group, now)
+            lines = self._cache.setdefault(group[0], {})
+            cached = lines.get(group[1:])
+            if cached is None or self._differs(cached, line):
+                lines[group[1:]] = line
+                changed.append(line)
+        self.evict(now - self.window)
+        return changed
+
+    def evict(self, before: datetime) -> int:
+        """Drop events not seen in an update since `before`."""
+        stale = [event_id for event_id, seen in self._last_seen.items() if seen < before]
+        for event_id in stale:
+            del self._last_seen[event_id]
+            self._quotes.pop(event_id, None)
+            self._cache.pop(event_id, None)
+        return len(stale)
+
+    def _compute(self, group: GroupKey, now: datetime) -> ConsensusLine:
+        books = self._quotes[group[0]][group[1:]]
+        names = list(books)
+        quotes = [books[b] for b in names]
+        price_median, price_weighted, point_median, point_weighted, excluded = compute_consensus(
+            np.array([q[1] for q in quotes], dtype=np.float64),
+            np.array([q[2] for q in quotes], dtype=np.float64),
+            np.array([self.book_weights.get(b, 1.0) for b in names], dtype=np.float64),
+            self.outlier_threshold,
+        )
+        return ConsensusLine(
+            event_id=group[0],
+            offer_type=group[1],
+            choice=group[2],
+            timestamp=now,
+            price_median=price_median,
+            price_weighted=price_weighted,
+            point_median=point_median,
+            point_weighted=point_weighted,
+            books=len(quotes),
+            excluded=excluded,
+        )
+
+    @staticmethod
+    def _differs(a: ConsensusLine, b: ConsensusLine) -> bool:
+        def _moved(x: float | None, y: float | None) -> bool:
+            if x is None or y is None:
+                return x is not y
+            return abs(x - y) > 0.001
+
+        return (
+            _moved(a.price_median, b.price_median)
+            or _moved(a.price_weighted, b.price_weighted)
+            or _moved(a.point_median, b.point_median)
+            or _moved(a.point_weighted, b.point_weighted)
+            or a.books != b.books
+        )
+
+    def get_lines(self, event_id: str, offer_type: str | None = None) -> list[ConsensusLine]:
+        return [
+            line
+            for (_offer_type, _), line in self._cache.get(event_id, {}).items()
+            if offer_type is None or _offer_type == offer_type
+        ]
+
+
+CONSENSUS_ENGINE: ConsensusEngine | None = None
+
+
+def get_consensus_engine() -> ConsensusEngine:
+    global CONSENSUS_ENGINE
+    if CONSENSUS_ENGINE is None:
+        CONSENSUS_ENGINE = ConsensusEngine()
+    return CONSENSUS_ENGINE
+
+
+async def warm_consensus() -> None:
+    """Seed the engine with the latest quotes of events kicking off within its window."""
+    engine = get_consensus_engine()
+    after = ((get_utc_now() - engine.window).strftime("%Y-%m-%dT%H:%M:%SZ"), "")
+    event_ids = []
+    while page := await get_client().get_events_page(500, after=after):
+        event_ids.extend(e.id for e in page)
+        after = (page[-1].commence_time, page[-1].id)
+    if event_ids:
+        rows = await get_client().get_eventoffer_rows_batch(event_ids, mode="latest")
+        engine.update(OfferFrame.from_rows(rows))
+    logger.info(f"Consensus warmed with {len(get_consensus_engine())} outcomes")
+
+
+async def update_consensus(offers: list[EventOffer] | OfferFrame) -> list[ConsensusLine]:
+    changed = get_consensus_engine().update(offers)
+    await get_client().add_consensuslines(changed)
+    return changed
+
+
+async def get_consensus(event_id: str, offer_type: str | None = None) -> list[ConsensusLine]:
+    return get_consensus_engine().get_lines(event_id, offer_type=offer_type)
+
+
+async def get_consensus_history(
+    event_id: str, offer_type: str | None = None
+) -> list[ConsensusLine]:
+    return await get_client().get_consensus_history(event_id, offer_type=offer_type)
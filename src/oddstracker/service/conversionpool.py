@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import orjson
+
+from oddstracker import config
+from oddstracker.domain.model import converter
+from oddstracker.domain.model.converter import convert_to_sportevents
+from oddstracker.domain.model.sportevent import SportEventData
+
+logger = logging.getLogger(__name__)
+
+
+def split_payload(provider_key: str, data: dict | list[dict], parts: int) -> list[dict | list]:
+    """Split a provider payload into at most `parts` payloads of the same shape."""
+    if provider_key == "kambi" and isinstance(data, dict):
+        events = data.get("events", [])
+    elif provider_key == "theoddsapi":
+        events = data
+    else:
+        return [data]
+    size = max(-(-len(events) // parts), 1)
+    chunks = [events[i : i + size] for i in range(0, len(events), size)] or [[]]
+    if provider_key == "kambi":
+        return [{"events": chunk} for chunk in chunks]
+    return chunks
+
+
+def _init_worker() -> None:
+    # With forkserver the converter's reference data is already loaded by the
+    # preload; under spawn this loads it once per worker, before the first task
+    logger.info(f"Conversion worker ready with {len(converter.TEAMS)} teams")
+
+
+def _ping() -> None:
+    return None
+
+
+def _convert_payload(provider_key: str, payload: bytes) -> list[SportEventData]:
+    return convert_to_sportevents(provider_key, orjson.loads(payload))
+
+
+def _mp_context():
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        # Workers fork from a server that has imported the converter once, so
+        # nfl_data_py is not re-downloaded per worker
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+class ConversionPool:
+    """
+    Converts provider payloads in worker processes, keeping the CPU-bound
+    parsing and team/schedule lookups off the event loop. Payloads are shipped
+    as JSON bytes in one chunk per worker, and the converted events come back
+    already validated, so the parent only unpickles them.
+    """
+
+    def __init__(self, processes: int = config.CONVERT_PROCESSES):
+        self.processes = processes
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=_mp_context(),
+                initializer=_init_worker,
+            )
+        return self._executor
+
+    async def start(self) -> None:
+        """Start every worker up front so the first collection doesn't pay for it."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, _ping) for _ in range(self.processes))
+        )
+        logger.info(f"Conversion pool started with {self.processes} processes")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def convert(self, provider_key: str, data: dict | list[dict]) -> list[SportEventData]:
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        parts = split_payload(provider_key, data, self.processes)
+        try:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor, _convert_payload, provider_key, orjson.dumps(part)
+                    )
+                    for part in parts
+                )
+            )
+        except BrokenProcessPool as ex:
+            # A crashed worker breaks the whole pool; replace it for the next call
+            logger.error(f"Conversion pool broken, restarting it: {ex}")
+            self.shutdown()
+            raise ex
+        return [_event for result in results for _event in result]
+
+
+CONVERSION_POOL: ConversionPool | None = None
+
+
+def get_conversion_pool() -> ConversionPool:
+    global CONVERSION_POOL
+    if CONVERSION_POOL is None:
+        CONVERSION_POOL = ConversionPool()
+    return CONVERSION_POOL
+
+
+async def convert_sportevents(
+    provider_key: str,
+    data: dict | list[dict],
+    executor: str = config.CONVERT_EXECUTOR,
+) -> list[SportEventData]:
+    if executor == "inline":
+        return convert_to_sportevents(provider_key, data)
+    if executor == "process":
+        return await get_conversion_pool().convert(provider_key, data)
+    raise ValueError(f"Unsupported CONVERT_EXECUTOR: {executor}")
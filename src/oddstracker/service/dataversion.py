@@ -0,0 +1,118 @@
+import logging
+import zlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from oddstracker import config
+from oddstracker.service.responsecache import match_rule
+from oddstracker.utils import get_utc_now
+
+logger = logging.getLogger(__name__)
+
+
+class DataVersions:
+    """
+    Cheap global and per-event data versions, bumped by the ingest path.
+
+    Versions are scoped to this process by a boot id so an ETag issued before a
+    restart can never match data served after it. Each replica counts its own
+    versions, so ETags are per replica too: behind a load balancer a client that
+    switches replicas gets a full response rather than a 304, never a wrong 304.
+    """
+
+    def __init__(self, instance_id: str = config.INSTANCE_ID):
+        self.started = get_utc_now().replace(microsecond=0)
+        self.boot_id = f"{zlib.crc32(instance_id.encode()):x}{int(self.started.timestamp()):x}"
+        self.version = 0
+        self.modified = self.started
+        self._events: dict[str, tuple[int, datetime]] = {}
+
+    def bump(self, event_ids: list[str]) -> int:
+        self.version += 1
+        self.modified = get_utc_now().replace(microsecond=0)
+        for event_id in event_ids:
+            self._events[event_id] = (self.version, self.modified)
+        return self.version
+
+    def get(self, event_id: str | None = None) -> tuple[int, datetime]:
+        if event_id is None:
+            return self.version, self.modified
+        return self._events.get(event_id, (0, self.started))
+
+    def etag(self, event_id: str | None = None) -> str:
+        version, _ = self.get(event_id)
+        return f'W/"{self.boot_id}-{version}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(t.strip().removeprefix("W/") == opaque for t in if_none_match.split(","))
+
+
+def _not_modified_since(if_modified_since: str, modified: datetime) -> bool:
+    try:
+        return modified <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+class ConditionalRequestMiddleware:
+    """
+    ASGI middleware adding ETag/Last-Modified to cacheable GET routes and answering
+    conditional requests with 304 from the data versions alone.
+    """
+
+    def __init__(self, app, versions: "DataVersions | None" = None):
+        self.app = app
+        self.versions = versions or get_data_versions()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        matched = match_rule(scope["path"])
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        _, tags = matched
+        event_id = next((t.removeprefix("event:") for t in tags if t.startswith("event:")), None)
+        etag = self.versions.etag(event_id)
+        _, modified = self.versions.get(event_id)
+        validators = [
+            (b"etag", etag.encode()),
+            (b"last-modified", format_datetime(modified, usegmt=True).encode()),
+            (b"cache-control", b"no-cache"),
+        ]
+
+        headers = {k.decode().lower(): v.decode() for k, v in scope.get("headers", [])}
+        if "if-none-match" in headers:
+            not_modified = _etag_matches(headers["if-none-match"], etag)
+        elif "if-modified-since" in headers:
+            not_modified = _not_modified_since(headers["if-modified-since"], modified)
+        else:
+            not_modified = False
+
+        if not_modified:
+            await send({"type": "http.response.start", "status": 304, "headers": validators})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def add_validators(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message = {**message, "headers": [*message.get("headers", []), *validators]}
+            await send(message)
+
+        await self.app(scope, receive, add_validators)
+
+
+DATA_VERSIONS: DataVersions | None = None
+
+
+def get_data_versions() -> DataVersions:
+    global DATA_VERSIONS
+    if DATA_VERSIONS is None:
+        DATA_VERSIONS = DataVersions()
+    return DATA_VERSIONS
@@ -0,0 +1,66 @@
+import logging
+
+import orjson
+from fastapi import Response
+
+from oddstracker.domain.model.sportevent import EVENTOFFER_COLUMNS, SPORTEVENT_COLUMNS
+from oddstracker.service import get_client
+
+logger = logging.getLogger(__name__)
+
+
+def parse_fields(fields: str | None, columns: tuple[str, ...]) -> list[str]:
+    if not fields:
+        return list(columns)
+    selected = [f.strip() for f in fields.split(",") if f.strip()]
+    if unknown := [f for f in selected if f not in columns]:
+        raise ValueError(f"Invalid fields: {unknown}. Valid fields: {list(columns)}")
+    return selected
+
+
+def rows_response(
+    rows: list[tuple], columns: tuple[str, ...], fields: str | None = None
+) -> Response:
+    """
+    Serialize row tuples straight to JSON, keeping only the selected fields and
+    dropping nulls to match response_model_exclude_none. UTC datetimes end in "Z"
+    like pydantic's, so both response paths format timestamps the same way.
+    """
+    selected = parse_fields(fields, columns)
+    positions = [(name, columns.index(name)) for name in selected]
+    body = orjson.dumps(
+        [
+            {name: row[i] for name, i in positions if row[i] is not None}
+            for row in rows
+        ],
+        option=orjson.OPT_UTC_Z,
+    )
+    return Response(content=body, media_type="application/json")
+
+
+async def get_sportevents_fast(fields: str | None = None) -> Response:
+    return rows_response(await get_client().get_event_rows(), SPORTEVENT_COLUMNS, fields)
+
+
+async def get_sportevent_eventoffers_fast(
+    event_id: str,
+    offer_type: str | None = None,
+    range_query: bool = False,
+    fields: str | None = None,
+) -> Response:
+    rows = await get_client().get_eventoffer_rows(
+        event_id, offer_type=offer_type, first_last=range_query
+    )
+    return rows_response(rows, EVENTOFFER_COLUMNS, fields)
+
+
+async def get_team_event_offers_fast(
+    team_abbr: str,
+    upcoming: bool = False,
+    latest: bool = False,
+    fields: str | None = None,
+) -> Response:
+    rows = await get_client().get_team_eventoffer_rows(
+        team_abbr, upcoming=upcoming, latest=latest
+    )
+    return rows_response(rows, EVENTOFFER_COLUMNS, fields)
@@ -1,8 +1,9 @@
 import logging
 
+import numpy as np
 from pydantic import BaseModel
 
-from oddstracker.domain.model.sportevent import EventOffer
+from oddstracker.domain.model.offerframe import OfferFrame
 from oddstracker.service import get_client
 
 logger = logging.getLogger(__name__)
@@ -31,76 +32,68 @@ class EventLineMovesResponse(BaseModel):
     changes: list[OfferChange]
 
 
-def _has_changed(current: EventOffer, previous: EventOffer) -> tuple[bool, bool]:
-    """Returns (price_changed, point_changed)"""
-    price_changed = abs(current.price - previous.price) > 0.001
-    point_changed = False
-
-    if current.point is not None and previous.point is not None:
-        point_changed = abs(current.point - previous.point) > 0.001
-    elif current.point != previous.point:
-        point_changed = True
+def frame_changes(frame: OfferFrame) -> dict[str, list[OfferChange]]:
+    """
+    Compare the last two quotes of every market key in `frame` and return the
+    changed ones grouped by event_id.
+    """
+    order, starts, ends = frame.group_index()
+    multi = (ends - starts) >= 2
+    current = order[ends[multi] - 1]
+    previous = order[ends[multi] - 2]
+
+    price_changed = np.abs(frame.prices[current] - frame.prices[previous]) > 0.001
+    cur_points, prev_points = frame.points[current], frame.points[previous]
+    cur_nan, prev_nan = np.isnan(cur_points), np.isnan(prev_points)
+    with np.errstate(invalid="ignore"):
+        point_changed = np.where(
+            cur_nan | prev_nan,
+            cur_nan != prev_nan,
+            np.abs(cur_points - prev_points) > 0.001,
+        )
 
-    return price_changed, point_changed
+    changes: dict[str, list[OfferChange]] = {}
+    for n in np.flatnonzero(price_changed | point_changed):
+        event_id, bookmaker, offer_type, choice, new_ts, new_price, new_point = frame.row(
+            current[n]
+        )
+        _, _, _, _, old_ts, old_price, old_point = frame.row(previous[n])
+        logger.info(
+            f"Offer {(bookmaker, offer_type, choice)} changed - price: {bool(price_changed[n])}, "
+            f"point: {bool(point_changed[n])}"
+        )
+        changes.setdefault(event_id, []).append(
+            OfferChange(
+                bookmaker=bookmaker,
+                choice=choice,
+                offer_type=offer_type,
+                old_price=old_price,
+                new_price=new_price,
+                old_point=old_point,
+                new_point=new_point,
+                old_timestamp=old_ts.isoformat(),
+                new_timestamp=new_ts.isoformat(),
+                price_changed=bool(price_changed[n]),
+                point_changed=bool(point_changed[n]),
+            )
+        )
+    return changes
 
 
 async def get_linemoves() -> list[EventLineMovesResponse]:
     logger.info("Fetching all bet offer changes across events")
-    events = await get_client().get_events()
+    events = sorted(await get_client().get_events(), key=lambda e: (e.commence_time, e.id))
+    rows = await get_client().get_eventoffer_rows_batch([e.id for e in events], mode="range")
+    changes = frame_changes(OfferFrame.from_rows(rows))
 
     changes_by_event = []
-
     for event in events:
-        logger.info(f"Processing changes for event {event.id}")
-        sporteventdata = await get_client().get_sporteventdata(
-            event_id=event.id,
-            offer_type="all",
-            first_last=True,
-        )
-        if not sporteventdata:
-            logger.info(f"No sport event data found for event {event.id}, skipping")
+        event_changes = changes.get(event.id)
+        if not event_changes:
+            logger.debug(f"No changes found for event {event.id}")
             continue
-
-        unique_offers = sporteventdata.sort_uniqueoffers()
-        event_changes = []
-
-        for offer_key, offers in unique_offers.items():
-            if len(offers) < 2:
-                logger.debug(f"Offer {offer_key} has only {len(offers)} entry, skipping")
-                continue
-
-            offers_sorted = sorted(offers, key=lambda x: x.timestamp)
-            current = offers_sorted[-1]
-            previous = offers_sorted[-2]
-
-            price_changed, point_changed = _has_changed(current, previous)
-
-            if not price_changed and not point_changed:
-                logger.debug(f"Offer {offer_key} has not changed")
-                continue
-
-            logger.info(
-                f"Offer {offer_key} changed - price: {price_changed}, point: {point_changed}"
-            )
-
-            change = OfferChange(
-                bookmaker=current.bookmaker,
-                choice=current.choice,
-                offer_type=current.offer_type,
-                old_price=previous.price,
-                new_price=current.price,
-                old_point=previous.point,
-                new_point=current.point,
-                old_timestamp=previous.timestamp.isoformat(),
-                new_timestamp=current.timestamp.isoformat(),
-                price_changed=price_changed,
-                point_changed=point_changed,
-            )
-
-            event_changes.append(change)
-
-        if event_changes:
-            response = EventLineMovesResponse(
+        changes_by_event.append(
+            EventLineMovesResponse(
                 event_id=event.id,
                 home_team=event.home_team,
                 away_team=event.away_team,
@@ -108,10 +101,8 @@ async def get_linemoves() -> list[EventLineMovesResponse]:
                 commence_time=event.commence_time,
                 changes=event_changes,
             )
-            changes_by_event.append(response)
-            logger.info(f"Found {len(event_changes)} changes for event {event.id}")
-        else:
-            logger.debug(f"No changes found for event {event.id}")
+        )
+        logger.info(f"Found {len(event_changes)} changes for event {event.id}")
 
     logger.info(f"Processed {len(events)} events, found changes in {len(changes_by_event)} events")
     return changes_by_event
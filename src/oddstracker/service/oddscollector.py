@@ -1,10 +1,13 @@
+import asyncio
 import logging
+import time
+import zlib
 
 import requests
 
-from oddstracker.config import RAW_STORE
+from oddstracker.config import CHANGE_FEED_ENABLED, INGEST_WRITERS, RAW_STORE
 from oddstracker.domain.model.collection_response import CollectionResponse
-from oddstracker.domain.model.converter import convert_to_sportevents
+from oddstracker.domain.model.converter import convert_to_sportevents  # noqa: F401
 from oddstracker.domain.model.sportevent import SportEventData
 from oddstracker.domain.providers import (
     KAMBI_PROVIDERS,
@@ -14,6 +17,12 @@ from oddstracker.domain.providers import (
     TheOddsAPIProvider,
 )
 from oddstracker.service import get_client
+from oddstracker.service.changefeed import get_change_feed
+from oddstracker.service.consensus import update_consensus
+from oddstracker.service.conversionpool import convert_sportevents
+from oddstracker.service.dataversion import get_data_versions
+from oddstracker.service.responsecache import get_response_cache
+from oddstracker.service.steamdetector import get_steam_detector
 from oddstracker.utils import store_json
 
 logger = logging.getLogger(__name__)
@@ -24,20 +33,37 @@ async def collect_and_store_bettingdata(
     league: str,
     db_store: bool = True,
 ) -> CollectionResponse:
+    stages: dict[str, float] = {}
+    start = time.perf_counter()
+
+    def _stage(name: str) -> None:
+        nonlocal start
+        now = time.perf_counter()
+        stages[name] = round(now - start, 4)
+        start = now
+
     provider = get_provider(provider_key)
-    _raw_data = fetch_sports_betting_data(provider, league)
+    # The blocking HTTP call runs in a thread so it doesn't stall the event loop
+    _raw_data = await asyncio.to_thread(fetch_sports_betting_data, provider, league)
+    _stage("fetch")
     if RAW_STORE:
         store_json(f"{provider_key}_{league}", "raw", _raw_data)
 
     count = 0
+    offers = 0
     if db_store:
-        _sportevents = convert_to_sportevents(provider_key, _raw_data)
+        _sportevents = await convert_sportevents(provider_key, _raw_data)
+        _stage("convert")
         await store_sports_betting_info(_sportevents)
+        _stage("store")
         count = len(_sportevents)
+        offers = sum(len(_event.offers) for _event in _sportevents)
 
     return CollectionResponse(
         status="success",
         collected=count,
+        offers=offers,
+        stages=stages,
         provider_key=provider_key,
     )
 
@@ -63,16 +89,76 @@ def fetch_sports_betting_data(provider: Provider, league: str) -> dict:
     return data
 
 
-async def store_sports_betting_info(sportevents: list[SportEventData]) -> None:
-    logger.info(f"Storing {len(sportevents)} events to DB")
+def shard_sportevents(
+    sportevents: list[SportEventData], shards: int
+) -> list[list[SportEventData]]:
+    """
+    Partition events by crc32(event_id) % shards. All quotes of a market key belong
+    to one event, so each market is written by exactly one writer, in order.
+    """
+    out: list[list[SportEventData]] = [[] for _ in range(shards)]
+    for _event in sportevents:
+        out[zlib.crc32(_event.event.id.encode()) % shards].append(_event)
+    return [shard for shard in out if shard]
+
+
+async def store_sports_betting_info(
+    sportevents: list[SportEventData], writers: int = INGEST_WRITERS
+) -> None:
+    logger.info(f"Storing {len(sportevents)} events to DB with {writers} writers")
+    shards = shard_sportevents(sportevents, writers)
+    results = await asyncio.gather(*(_store_shard(shard) for shard in shards))
+    stored = [_event for shard in results for _event in shard]
+    logger.info(f"Processed {len(sportevents)} events to DB")
+    await on_sportevents_stored(stored)
+
+
+async def _store_shard(sportevents: list[SportEventData]) -> list[SportEventData]:
+    try:
+        await get_client().add_sporteventdata_batch(sportevents)
+        return list(sportevents)
+    except Exception as ex:
+        # Fall back to per-event writes so one bad event doesn't drop the whole shard
+        logger.error(f"Batch store failed, storing events one by one: {ex}")
+    stored = []
     for _event in sportevents:
         try:
             logger.info(f"Processing event: {_event}")
             await get_client().add_sporteventdata(_event)
+            stored.append(_event)
             logger.info(f"Stored: {_event}")
         except Exception as ex:
             logger.error(ex)
-    logger.info(f"Processed {len(sportevents)} events to DB")
+    return stored
+
+
+async def on_sportevents_stored(sportevents: list[SportEventData]) -> None:
+    offers = [offer for _event in sportevents for offer in _event.offers]
+    lsn = 0
+    try:
+        # Read replicas stay unused until they replay this write
+        lsn = await get_client().note_write()
+    except Exception as ex:
+        logger.error(f"Failed to record write position: {ex}")
+    get_response_cache().invalidate_sportevents(sportevents)
+    version = get_data_versions().bump([_event.event.id for _event in sportevents])
+    if CHANGE_FEED_ENABLED:
+        try:
+            await get_change_feed().publish(sportevents, version, lsn=lsn)
+        except Exception as ex:
+            logger.error(f"Failed to publish changes: {ex}")
+    try:
+        get_steam_detector().observe_offers(offers)
+    except Exception as ex:
+        logger.error(f"Failed to feed steam detector: {ex}")
+    try:
+        await update_consensus(offers)
+    except Exception as ex:
+        logger.error(f"Failed to update consensus: {ex}")
+    try:
+        await get_client().freeze_closing_lines()
+    except Exception as ex:
+        logger.error(f"Failed to freeze closing lines: {ex}")
 
 
 def get_provider(provider_key: str) -> Provider:
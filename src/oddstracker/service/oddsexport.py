@@ -0,0 +1,171 @@
+import argparse
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Literal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from oddstracker.service import get_client
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = Literal["parquet", "arrow"]
+
+EXPORT_MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+_DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+
+EXPORT_SCHEMA = pa.schema(
+    [
+        pa.field("event_id", _DICT_STRING, nullable=False),
+        pa.field("bookmaker", _DICT_STRING, nullable=False),
+        pa.field("offer_type", _DICT_STRING, nullable=False),
+        pa.field("choice", _DICT_STRING, nullable=False),
+        pa.field("timestamp", pa.timestamp("us", tz="UTC"), nullable=False),
+        pa.field("price", pa.float64(), nullable=False),
+        pa.field("point", pa.float64()),
+    ]
+)
+
+
+class _ChunkSink:
+    """Write-only file object that hands back whatever was written since the last drain."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def rows_to_batch(rows: list[tuple]) -> pa.RecordBatch:
+    """Build a record batch with dictionary-encoded string columns from row tuples."""
+    event_id, bookmaker, offer_type, choice, timestamp, price, point = zip(*rows, strict=True)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(event_id, pa.string()).dictionary_encode(),
+            pa.array(bookmaker, pa.string()).dictionary_encode(),
+            pa.array(offer_type, pa.string()).dictionary_encode(),
+            pa.array(choice, pa.string()).dictionary_encode(),
+            pa.array(timestamp, pa.timestamp("us", tz="UTC")),
+            pa.array(price, pa.float64()),
+            pa.array(point, pa.float64()),
+        ],
+        schema=EXPORT_SCHEMA,
+    )
+
+
+def _open_writer(fmt: EXPORT_FORMATS, sink: _ChunkSink):
+    if fmt == "parquet":
+        return pq.ParquetWriter(sink, EXPORT_SCHEMA, compression="zstd")
+    if fmt == "arrow":
+        return pa.ipc.new_stream(sink, EXPORT_SCHEMA)
+    raise ValueError(f"Unsupported export format: {fmt}")
+
+
+async def encode_batches(
+    fmt: EXPORT_FORMATS, chunks: AsyncIterator[list[tuple]]
+) -> AsyncIterator[bytes]:
+    """Encode row chunks into Parquet row groups or Arrow IPC messages as they arrive."""
+    sink = _ChunkSink()
+    writer = _open_writer(fmt, sink)
+    rows_written = 0
+    try:
+        async for rows in chunks:
+            if not rows:
+                continue
+            writer.write_batch(rows_to_batch(rows))
+            rows_written += len(rows)
+            if data := sink.drain():
+                yield data
+    finally:
+        writer.close()
+    logger.info(f"Exported {rows_written} eventoffer rows as {fmt}")
+    if data := sink.drain():
+        yield data
+
+
+def export_eventoffers(
+    fmt: EXPORT_FORMATS = "parquet",
+    start: datetime | None = None,
+    end: datetime | None = None,
+    event_id: str | None = None,
+    bookmaker: str | None = None,
+    offer_type: str | None = None,
+    chunk_size: int = 10000,
+) -> AsyncIterator[bytes]:
+    return encode_batches(
+        fmt,
+        get_client().stream_eventoffer_rows(
+            start=start,
+            end=end,
+            event_id=event_id,
+            bookmaker=bookmaker,
+            offer_type=offer_type,
+            chunk_size=chunk_size,
+        ),
+    )
+
+
+async def _export_to_file(path: str, **kwargs) -> None:
+    try:
+        with open(path, "wb") as f:
+            async for data in export_eventoffers(**kwargs):
+                f.write(data)
+    finally:
+        await get_client().close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Export odds history to Parquet or Arrow IPC")
+    parser.add_argument("output", help="Output file path")
+    parser.add_argument("--format", dest="fmt", choices=["parquet", "arrow"], default="parquet")
+    parser.add_argument("--start", type=datetime.fromisoformat)
+    parser.add_argument("--end", type=datetime.fromisoformat)
+    parser.add_argument("--event-id")
+    parser.add_argument("--bookmaker")
+    parser.add_argument("--offer-type")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    asyncio.run(
+        _export_to_file(
+            args.output,
+            fmt=args.fmt,
+            start=args.start,
+            end=args.end,
+            event_id=args.event_id,
+            bookmaker=args.bookmaker,
+            offer_type=args.offer_type,
+            chunk_size=args.chunk_size,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
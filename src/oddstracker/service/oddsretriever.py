@@ -1,5 +1,17 @@
-from oddstracker.domain.model.sportevent import EventOffer, SportEvent
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+from oddstracker.config import BATCH_MAX_EVENTS
+from oddstracker.domain.model.sportevent import EventOffer, SportEvent, SportEventData
 from oddstracker.service import get_client
+from oddstracker.utils import as_utc
+
+
+class AsOfSnapshot(BaseModel):
+    at: datetime
+    offers: list[EventOffer]
 
 
 async def get_sportevents() -> list[SportEvent]:
@@ -14,6 +26,39 @@ async def get_sporteventdata(event_id: str, offer_type: str = "all"):
     return await get_client().get_sporteventdata(event_id, offer_type=offer_type)
 
 
+BATCH_MODES = Literal["all", "latest", "range"]
+
+
+async def get_sporteventdata_batch(
+    event_ids: list[str] | None = None,
+    sport_key: str | None = None,
+    season: int | None = None,
+    week: int | None = None,
+    offer_type: str | None = None,
+    mode: BATCH_MODES = "latest",
+) -> list[SportEventData]:
+    if week is not None and season is None:
+        raise ValueError("Filtering by week requires a season.")
+    if not event_ids and sport_key is None and season is None:
+        raise ValueError("A batch requires event ids or a sport_key/season filter.")
+    if event_ids and len(event_ids) > BATCH_MAX_EVENTS:
+        raise ValueError(f"A batch is limited to {BATCH_MAX_EVENTS} event ids.")
+    batch = await get_client().get_sporteventdata_batch(
+        event_ids=event_ids,
+        sport_key=sport_key,
+        season=season,
+        week=week,
+        offer_type=offer_type,
+        mode=mode,
+        limit=BATCH_MAX_EVENTS + 1,
+    )
+    if len(batch) > BATCH_MAX_EVENTS:
+        raise ValueError(
+            f"Filters match more than {BATCH_MAX_EVENTS} events. Narrow them with season/week."
+        )
+    return batch
+
+
 async def get_sportevent_eventoffers(
     event_id: str,
     offer_type: str,
@@ -24,3 +69,33 @@ async def get_sportevent_eventoffers(
         offer_type=offer_type,
         first_last=range_query,
     )
+
+
+async def get_eventoffers_asof(
+    at: datetime,
+    sport_key: str | None = None,
+    bookmaker: str | None = None,
+    offer_type: str | None = None,
+) -> list[EventOffer]:
+    return await get_client().get_eventoffers_asof(
+        as_utc(at),
+        sport_key=sport_key,
+        bookmaker=bookmaker,
+        offer_type=offer_type,
+    )
+
+
+async def get_eventoffers_asof_batch(
+    ats: list[datetime],
+    sport_key: str | None = None,
+    bookmaker: str | None = None,
+    offer_type: str | None = None,
+) -> list[AsOfSnapshot]:
+    ats = sorted({as_utc(at) for at in ats})
+    snapshots = await get_client().get_eventoffers_asof_batch(
+        ats,
+        sport_key=sport_key,
+        bookmaker=bookmaker,
+        offer_type=offer_type,
+    )
+    return [AsOfSnapshot(at=at, offers=snapshots.get(at, [])) for at in ats]
@@ -0,0 +1,135 @@
+import logging
+import re
+from datetime import datetime, timedelta
+
+import numpy as np
+from pydantic import BaseModel
+
+from oddstracker.service import get_client
+from oddstracker.utils import as_utc
+
+logger = logging.getLogger(__name__)
+
+_BUCKET_PATTERN = re.compile(r"^\s*(\d+)\s*([a-z]+)\s*$")
+_BUCKET_UNITS = {
+    "s": "seconds",
+    "sec": "seconds",
+    "second": "seconds",
+    "seconds": "seconds",
+    "m": "minutes",
+    "min": "minutes",
+    "minute": "minutes",
+    "minutes": "minutes",
+    "h": "hours",
+    "hour": "hours",
+    "hours": "hours",
+    "d": "days",
+    "day": "days",
+    "days": "days",
+}
+
+
+class OddsSeries(BaseModel):
+    bookmaker: str
+    choice: str
+    timestamps: list[datetime]
+    prices: list[float]
+    points: list[float | None]
+
+
+class OddsSeriesResponse(BaseModel):
+    event_id: str
+    offer_type: str
+    bucket: str
+    series: list[OddsSeries]
+
+
+def parse_bucket(bucket: str) -> timedelta:
+    match = _BUCKET_PATTERN.match(bucket.lower())
+    if not match or match.group(2) not in _BUCKET_UNITS:
+        raise ValueError(f"Invalid bucket: {bucket}. Use e.g. '30s', '5m', '1 hour'.")
+    width = timedelta(**{_BUCKET_UNITS[match.group(2)]: int(match.group(1))})
+    if width <= timedelta(0):
+        raise ValueError(f"Invalid bucket: {bucket}. Must be positive.")
+    return width
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of at most `threshold` points that preserve the visual
+    shape of the series, always keeping the first and last point.
+    """
+    n = x.shape[0]
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = hi, edges[i + 2] if i + 2 < edges.shape[0] else n
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def _build_series(rows: list[tuple], max_points: int | None) -> list[OddsSeries]:
+    grouped: dict[tuple[str, str], list[tuple]] = {}
+    for bucket, bookmaker, choice, price, point in rows:
+        if price is None:
+            continue
+        grouped.setdefault((bookmaker, choice), []).append((bucket, price, point))
+
+    series = []
+    for (bookmaker, choice), values in grouped.items():
+        if max_points and len(values) > max_points:
+            x = np.array([v[0].timestamp() for v in values], dtype=np.float64)
+            y = np.array([v[1] for v in values], dtype=np.float64)
+            values = [values[i] for i in lttb(x, y, max_points)]
+        series.append(
+            OddsSeries(
+                bookmaker=bookmaker,
+                choice=choice,
+                timestamps=[v[0] for v in values],
+                prices=[v[1] for v in values],
+                points=[v[2] for v in values],
+            )
+        )
+    return series
+
+
+async def get_eventoffer_series(
+    event_id: str,
+    offer_type: str,
+    bucket: str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    max_points: int | None = None,
+) -> OddsSeriesResponse:
+    start = start and as_utc(start)
+    end = end and as_utc(end)
+    if start is not None and end is not None and start >= end:
+        raise ValueError(f"Invalid range: start {start} must be before end {end}.")
+    rows = await get_client().get_eventoffer_series(
+        event_id,
+        offer_type,
+        bucket=parse_bucket(bucket),
+        start=start,
+        end=end,
+    )
+    return OddsSeriesResponse(
+        event_id=event_id,
+        offer_type=offer_type,
+        bucket=bucket,
+        series=_build_series(rows, max_points),
+    )
@@ -0,0 +1,92 @@
+import csv
+import io
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Literal
+
+import orjson
+
+from oddstracker.service import get_client
+
+logger = logging.getLogger(__name__)
+
+STREAM_FORMATS = Literal["ndjson", "csv"]
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+STREAM_COLUMNS = ("event_id", "bookmaker", "offer_type", "choice", "timestamp", "price", "point")
+
+
+async def encode_ndjson(chunks: AsyncIterator[list[tuple]]) -> AsyncIterator[bytes]:
+    """One JSON object per row, nulls dropped, one output chunk per input chunk."""
+    async for rows in chunks:
+        if rows:
+            yield b"".join(
+                orjson.dumps(
+                    {c: v for c, v in zip(STREAM_COLUMNS, row, strict=True) if v is not None}
+                )
+                + b"\n"
+                for row in rows
+            )
+
+
+async def encode_csv(chunks: AsyncIterator[list[tuple]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(STREAM_COLUMNS)
+    async for rows in chunks:
+        writer.writerows(
+            (*row[:4], row[4].isoformat(), row[5], "" if row[6] is None else row[6])
+            for row in rows
+        )
+        if data := buffer.getvalue():
+            yield data.encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if data := buffer.getvalue():
+        yield data.encode()
+
+
+async def _counted(
+    chunks: AsyncIterator[list[tuple]], fmt: STREAM_FORMATS
+) -> AsyncIterator[list[tuple]]:
+    total = 0
+    async for rows in chunks:
+        total += len(rows)
+        yield rows
+    logger.info(f"Streamed {total} eventoffer rows as {fmt}")
+
+
+def stream_eventoffers(
+    event_id: str,
+    fmt: STREAM_FORMATS = "ndjson",
+    offer_type: str | None = None,
+    bookmaker: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    chunk_size: int = 5000,
+) -> AsyncIterator[bytes]:
+    """
+    Encode an event's offer history as it is read from a server-side cursor, so
+    memory stays bounded by `chunk_size` regardless of history length.
+    """
+    chunks = _counted(
+        get_client().stream_eventoffer_rows(
+            start=start,
+            end=end,
+            event_id=event_id,
+            bookmaker=bookmaker,
+            offer_type=offer_type,
+            chunk_size=chunk_size,
+        ),
+        fmt,
+    )
+    if fmt == "ndjson":
+        return encode_ndjson(chunks)
+    if fmt == "csv":
+        return encode_csv(chunks)
+    raise ValueError(f"Unsupported stream format: {fmt}")
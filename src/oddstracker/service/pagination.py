@@ -0,0 +1,102 @@
+import base64
+import binascii
+import logging
+from datetime import datetime
+
+import orjson
+from pydantic import BaseModel
+
+from oddstracker.domain.model.sportevent import EventOffer, SportEvent
+from oddstracker.service import get_client
+
+logger = logging.getLogger(__name__)
+
+MAX_PAGE_SIZE = 1000
+
+
+class SportEventPage(BaseModel):
+    items: list[SportEvent]
+    next_cursor: str | None = None
+
+
+class EventOfferPage(BaseModel):
+    items: list[EventOffer]
+    next_cursor: str | None = None
+
+
+def encode_cursor(key: tuple) -> str:
+    """Opaque cursor for the sort key of the last item on a page."""
+    payload = orjson.dumps(list(key))
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = orjson.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, orjson.JSONDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(key, list) or len(key) != length:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return key
+
+
+def _check_limit(limit: int) -> None:
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+
+async def get_sportevents_page(
+    limit: int = 100,
+    cursor: str | None = None,
+    sport_key: str | None = None,
+    team: str | None = None,
+) -> SportEventPage:
+    """Events ordered by (commence_time, id), continuing after `cursor`."""
+    _check_limit(limit)
+    after = tuple(decode_cursor(cursor, 2)) if cursor else None
+    events = await get_client().get_events_page(
+        limit=limit + 1, after=after, sport_key=sport_key, team=team
+    )
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        next_cursor = encode_cursor((events[-1].commence_time, events[-1].id))
+    return SportEventPage(items=events, next_cursor=next_cursor)
+
+
+async def get_eventoffers_page(
+    limit: int = 100,
+    cursor: str | None = None,
+    event_id: str | None = None,
+    sport_key: str | None = None,
+    team: str | None = None,
+    bookmaker: str | None = None,
+    offer_type: str | None = None,
+) -> EventOfferPage:
+    """Offers ordered by (timestamp, event_id, bookmaker, offer_type, choice), continuing after `cursor`."""
+    _check_limit(limit)
+    after = None
+    if cursor:
+        ts, *key = decode_cursor(cursor, 5)
+        try:
+            after = (datetime.fromisoformat(ts), *key)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+    offers = await get_client().get_eventoffers_page(
+        limit=limit + 1,
+        after=after,
+        event_id=event_id,
+        sport_key=sport_key,
+        team=team,
+        bookmaker=bookmaker,
+        offer_type=offer_type,
+    )
+    next_cursor = None
+    if len(offers) > limit:
+        offers = offers[:limit]
+        last = offers[-1]
+        next_cursor = encode_cursor(
+            (last.timestamp, last.event_id, last.bookmaker, last.offer_type, last.choice)
+        )
+    return EventOfferPage(items=offers, next_cursor=next_cursor)
@@ -0,0 +1,88 @@
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import text
+
+from oddstracker.domain.model.sportevent import EVENTOFFER_COLUMNS, EventOffer
+from oddstracker.service import get_client
+from oddstracker.service.fastresponse import rows_response
+
+logger = logging.getLogger(__name__)
+
+_OFFERS_JSON = TypeAdapter(list[EventOffer])
+
+
+async def _largest_event_id() -> str:
+    async with get_client()._read_session() as session:
+        result = await session.execute(
+            text(
+                "SELECT event_id FROM eventoffer GROUP BY event_id "
+                "ORDER BY count(*) DESC LIMIT 1"
+            )
+        )
+        event_id = result.scalar_one_or_none()
+    if event_id is None:
+        raise ValueError("No eventoffers stored to benchmark against.")
+    return event_id
+
+
+async def bench_eventoffer_reads(event_id: str, repeat: int = 20) -> dict[str, float]:
+    """
+    Median seconds to fetch and serialize one event's full offer history through
+    the ORM path and through the asyncpg record path, bypassing the hot cache.
+    """
+    client = get_client()
+
+    async def orm() -> int:
+        offers = await client.get_eventoffers_for_sportevent(event_id)
+        return len(_OFFERS_JSON.dump_json(offers, exclude_none=True))
+
+    async def records() -> int:
+        rows = await client.get_eventoffer_rows(event_id)
+        return len(rows_response(rows, EVENTOFFER_COLUMNS).body)
+
+    hot_cache, client.hot_cache = client.hot_cache, None
+    try:
+        timings = {}
+        for name, path in (("orm", orm), ("records", records)):
+            await path()
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                await path()
+                samples.append(time.perf_counter() - start)
+            timings[name] = statistics.median(samples)
+    finally:
+        client.hot_cache = hot_cache
+    return timings
+
+
+async def _run(event_id: str | None, repeat: int) -> None:
+    try:
+        event_id = event_id or await _largest_event_id()
+        rows = len(await get_client().get_eventoffer_rows(event_id))
+        timings = await bench_eventoffer_reads(event_id, repeat=repeat)
+        print(f"event {event_id}: {rows} offers, median of {repeat} runs")
+        for name, seconds in timings.items():
+            print(f"  {name:<8} {seconds * 1000:8.2f} ms")
+        print(f"  speedup  {timings['orm'] / timings['records']:8.2f}x")
+    finally:
+        await get_client().close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare ORM and asyncpg record read paths for one event's offers"
+    )
+    parser.add_argument("--event-id", help="Defaults to the event with the most offers")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+    asyncio.run(_run(args.event_id, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
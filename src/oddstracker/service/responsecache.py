@@ -0,0 +1,229 @@
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from prometheus_client import Counter, Gauge
+
+from oddstracker import config
+from oddstracker.domain.model.sportevent import SportEventData
+
+logger = logging.getLogger(__name__)
+
+CACHE_REQUESTS = Counter(
+    "oddstracker_response_cache_requests_total",
+    "Response cache lookups",
+    ["route", "result"],
+)
+CACHE_ENTRIES = Gauge(
+    "oddstracker_response_cache_entries",
+    "Responses currently held in the response cache",
+)
+
+GLOBAL_TAG = "*"
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    route: str
+    pattern: re.Pattern
+    # "global" entries depend on every event, "event"/"team" on the path parameter
+    scope: str | None
+
+
+CACHE_RULES = [
+    CacheRule("events", re.compile(r"^/event/?$"), "global"),
+    CacheRule("event_batch", re.compile(r"^/event/batch/?$"), "global"),
+    CacheRule("event", re.compile(r"^/event/(?P<event_id>[^/]+)/?$"), "event"),
+    CacheRule(
+        "event_offers",
+        re.compile(r"^/event/(?P<event_id>[^/]+)/offer/[^/]+/?$"),
+        "event",
+    ),
+    CacheRule("teams", re.compile(r"^/team/?$"), None),
+    CacheRule("team", re.compile(r"^/team/(?P<team>[^/]+)/(events|offers)/?$"), "team"),
+    CacheRule("linemoves", re.compile(r"^/linemoves/?$"), "global"),
+    CacheRule("events_page", re.compile(r"^/events/?$"), "global"),
+    CacheRule("offers_page", re.compile(r"^/offers/?$"), "global"),
+]
+
+
+def match_rule(
+    path: str, rules: list[CacheRule] = CACHE_RULES
+) -> tuple[CacheRule, frozenset[str]] | None:
+    """First rule matching `path` with the tags its responses depend on."""
+    for rule in rules:
+        if (m := rule.pattern.match(path)) is None:
+            continue
+        if rule.scope == "global":
+            return rule, frozenset({GLOBAL_TAG})
+        if rule.scope == "event":
+            return rule, frozenset({f"event:{m.group('event_id')}"})
+        if rule.scope == "team":
+            return rule, frozenset({f"team:{m.group('team')}"})
+        return rule, frozenset()
+    return None
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    expires_at: float
+    tags: frozenset[str] = field(default_factory=frozenset)
+
+
+class ResponseCache:
+    """Bounded LRU of serialized responses with per-route TTLs and tag-based invalidation."""
+
+    def __init__(
+        self,
+        max_entries: int = config.RESPONSE_CACHE_MAX_ENTRIES,
+        ttls: dict[str, float] | None = None,
+        rules: list[CacheRule] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttls = config.RESPONSE_CACHE_TTLS if ttls is None else ttls
+        self.rules = CACHE_RULES if rules is None else rules
+        self.generation = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def match(self, path: str) -> tuple[CacheRule, frozenset[str]] | None:
+        return match_rule(path, self.rules)
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: str,
+        rule: CacheRule,
+        tags: frozenset[str],
+        status: int,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+    ) -> None:
+        ttl = self.ttls.get(rule.route, 0)
+        if ttl <= 0:
+            return
+        self._remove(key)
+        self._entries[key] = CachedResponse(
+            status=status,
+            headers=headers,
+            body=body,
+            expires_at=time.monotonic() + ttl,
+            tags=tags,
+        )
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+        CACHE_ENTRIES.set(len(self._entries))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def invalidate(self, event_ids: list[str], teams: list[str] | None = None) -> int:
+        """Drop entries for the given events/teams and every globally scoped entry."""
+        self.generation += 1
+        tags = [GLOBAL_TAG, *(f"event:{e}" for e in event_ids), *(f"team:{t}" for t in teams or [])]
+        keys = {key for tag in tags for key in self._tags.get(tag, ())}
+        for key in keys:
+            self._remove(key)
+        CACHE_ENTRIES.set(len(self._entries))
+        logger.info(f"Response cache invalidated {len(keys)} entries")
+        return len(keys)
+
+    def invalidate_sportevents(self, sportevents: list[SportEventData]) -> int:
+        return self.invalidate(
+            [s.event.id for s in sportevents],
+            teams=list({t for s in sportevents for t in (s.event.home_team, s.event.away_team)}),
+        )
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._tags.clear()
+        CACHE_ENTRIES.set(0)
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving successful GET responses of cacheable routes from a ResponseCache."""
+
+    def __init__(self, app, cache: "ResponseCache | None" = None):
+        self.app = app
+        self.cache = cache or get_response_cache()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        matched = self.cache.match(scope["path"])
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        rule, tags = matched
+        query = "&".join(sorted(scope.get("query_string", b"").decode().split("&")))
+        # Responses are cached after compression, so the encoding is part of the key
+        accept_encoding = dict(scope.get("headers", [])).get(b"accept-encoding", b"")
+        encoding = "gzip" if b"gzip" in accept_encoding else "identity"
+        key = f"{scope['path']}?{query}|{encoding}"
+        if (entry := self.cache.get(key)) is not None:
+            CACHE_REQUESTS.labels(route=rule.route, result="hit").inc()
+            await send(
+                {"type": "http.response.start", "status": entry.status, "headers": entry.headers}
+            )
+            await send({"type": "http.response.body", "body": entry.body})
+            return
+
+        CACHE_REQUESTS.labels(route=rule.route, result="miss").inc()
+        generation = self.cache.generation
+        start: dict = {}
+        chunks: list[bytes] = []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False) and start.get("status") == 200:
+                    # Skip storing if an ingest invalidated the cache mid-request
+                    if generation == self.cache.generation:
+                        self.cache.put(
+                            key, rule, tags, 200, list(start.get("headers", [])), b"".join(chunks)
+                        )
+            await send(message)
+
+        await self.app(scope, receive, capture)
+
+
+RESPONSE_CACHE: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    global RESPONSE_CACHE
+    if RESPONSE_CACHE is None:
+        RESPONSE_CACHE = ResponseCache()
+    return RESPONSE_CACHE
@@ -0,0 +1,282 @@
+import logging
+from collections import OrderedDict, deque
+from datetime import UTC, datetime
+from typing import Literal
+
+import numpy as np
+from prometheus_client import Counter, Gauge
+from pydantic import BaseModel
+
+from oddstracker import config
+from oddstracker.domain.model.sportevent import EventOffer
+
+logger = logging.getLogger(__name__)
+
+# (event_id, bookmaker, offer_type, choice)
+MarketKey = tuple[str, str, str, str]
+# (event_id, offer_type, choice)
+GroupKey = tuple[str, str, str]
+
+STEAM_EVENTS = Counter(
+    "oddstracker_steam_events_total",
+    "Steam moves detected across bookmakers",
+    ["offer_type", "direction"],
+)
+STEAM_QUOTES = Counter(
+    "oddstracker_steam_quotes_total",
+    "Quotes observed by the steam detector",
+)
+STEAM_MARKETS = Gauge(
+    "oddstracker_steam_markets",
+    "Markets currently tracked by the steam detector",
+)
+
+
+class QuoteRingBuffer:
+    """Fixed-size, array-backed buffer of the most recent quotes for one market."""
+
+    __slots__ = ("timestamps", "prices", "points", "_head", "_size")
+
+    def __init__(self, capacity: int):
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.prices = np.zeros(capacity, dtype=np.float32)
+        self.points = np.full(capacity, np.nan, dtype=np.float32)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self.timestamps.shape[0]
+
+    @property
+    def last_timestamp(self) -> float | None:
+        if not self._size:
+            return None
+        return float(self.timestamps[self._head - 1])
+
+    def append(self, timestamp: float, price: float, point: float | None) -> bool:
+        """Append a quote, ignoring re-collected or out-of-order quotes."""
+        last = self.last_timestamp
+        if last is not None and timestamp <= last:
+            return False
+        self.timestamps[self._head] = timestamp
+        self.prices[self._head] = price
+        self.points[self._head] = np.nan if point is None else point
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return True
+
+    def _ordered_index(self) -> np.ndarray:
+        return (self._head - self._size + np.arange(self._size)) % self.capacity
+
+    def window(self, since: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Chronological quotes within the window, led by the last quote before it."""
+        idx = self._ordered_index()
+        ts = self.timestamps[idx]
+        start = max(int(np.searchsorted(ts, since, side="left")) - 1, 0)
+        idx = idx[start:]
+        return self.timestamps[idx], self.prices[idx], self.points[idx]
+
+
+class MarketVelocity(BaseModel):
+    event_id: str
+    bookmaker: str
+    offer_type: str
+    choice: str
+    quotes: int
+    price_start: float
+    price_end: float
+    point_start: float | None
+    point_end: float | None
+    implied_change: float
+    velocity: float
+
+
+class SteamEvent(BaseModel):
+    event_id: str
+    offer_type: str
+    choice: str
+    detected_at: datetime
+    window_seconds: int
+    direction: Literal["shorten", "drift"]
+    books_moved: int
+    books_total: int
+    synchronicity: float
+    avg_velocity: float
+    bookmakers: list[str]
+
+
+def _market_velocity(
+    key: MarketKey, buffer: QuoteRingBuffer, since: float
+) -> MarketVelocity | None:
+    ts, prices, points = buffer.window(since)
+    if ts.shape[0] < 2:
+        return None
+    implied = 1.0 / prices.astype(np.float64)
+    implied_change = float(implied[-1] - implied[0])
+    elapsed_minutes = max(float(ts[-1] - ts[0]) / 60.0, 1.0 / 60.0)
+    return MarketVelocity(
+        event_id=key[0],
+        bookmaker=key[1],
+        offer_type=key[2],
+        choice=key[3],
+        quotes=int(ts.shape[0]),
+        price_start=float(prices[0]),
+        price_end=float(prices[-1]),
+        point_start=None if np.isnan(points[0]) else float(points[0]),
+        point_end=None if np.isnan(points[-1]) else float(points[-1]),
+        implied_change=implied_change,
+        velocity=implied_change / elapsed_minutes,
+    )
+
+
+class SteamDetector:
+    """
+    Tracks recent quotes per market key in ring buffers and flags synchronized
+    moves of the same outcome across bookmakers within a rolling window.
+
+    Velocity is measured as the change in implied probability per minute, so
+    moves are comparable across price levels. Time is taken from the quote
+    timestamps rather than the wall clock, which keeps replays deterministic.
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = config.STEAM_WINDOW_SECONDS,
+        buffer_size: int = config.STEAM_BUFFER_SIZE,
+        max_markets: int = config.STEAM_MAX_MARKETS,
+        min_books: int = config.STEAM_MIN_BOOKS,
+        min_move: float = config.STEAM_MIN_MOVE,
+        min_sync: float = config.STEAM_MIN_SYNC,
+        event_history: int = config.STEAM_EVENT_HISTORY,
+    ):
+        self.window_seconds = window_seconds
+        self.buffer_size = buffer_size
+        self.max_markets = max_markets
+        self.min_books = min_books
+        self.min_move = min_move
+        self.min_sync = min_sync
+        self._buffers: OrderedDict[MarketKey, QuoteRingBuffer] = OrderedDict()
+        self._groups: dict[GroupKey, set[str]] = {}
+        self._last_emitted: dict[GroupKey, float] = {}
+        self.events: deque[SteamEvent] = deque(maxlen=event_history)
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def observe_offers(self, offers: list[EventOffer]) -> list[SteamEvent]:
+        """Feed a batch of quotes in timestamp order and return new steam events."""
+        touched: dict[GroupKey, float] = {}
+        for offer in sorted(offers, key=lambda o: o.timestamp):
+            ts = offer.timestamp.timestamp()
+            if self._append(offer, ts):
+                group = (offer.event_id, offer.offer_type, offer.choice)
+                touched[group] = max(ts, touched.get(group, ts))
+        STEAM_QUOTES.inc(len(offers))
+        STEAM_MARKETS.set(len(self._buffers))
+
+        detected = []
+        for group, now in touched.items():
+            if steam := self._detect(group, now):
+                detected.append(steam)
+        return detected
+
+    def _append(self, offer: EventOffer, ts: float) -> bool:
+        key = (offer.event_id, offer.bookmaker, offer.offer_type, offer.choice)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = QuoteRingBuffer(self.buffer_size)
+            self._buffers[key] = buffer
+            self._groups.setdefault(key[:1] + key[2:], set()).add(offer.bookmaker)
+            self._evict()
+        else:
+            self._buffers.move_to_end(key)
+        return buffer.append(ts, offer.price, offer.point)
+
+    def _evict(self) -> None:
+        while len(self._buffers) > self.max_markets:
+            (event_id, bookmaker, offer_type, choice), _ = self._buffers.popitem(last=False)
+            group = (event_id, offer_type, choice)
+            books = self._groups.get(group)
+            if books is not None:
+                books.discard(bookmaker)
+                if not books:
+                    del self._groups[group]
+                    self._last_emitted.pop(group, None)
+
+    def group_velocities(self, group: GroupKey, now: float) -> list[MarketVelocity]:
+        since = now - self.window_seconds
+        event_id, offer_type, choice = group
+        velocities = []
+        for bookmaker in sorted(self._groups.get(group, ())):
+            key = (event_id, bookmaker, offer_type, choice)
+            if (velocity := _market_velocity(key, self._buffers[key], since)) is not None:
+                velocities.append(velocity)
+        return velocities
+
+    def _detect(self, group: GroupKey, now: float) -> SteamEvent | None:
+        last = self._last_emitted.get(group)
+        if last is not None and now - last < self.window_seconds:
+            return None
+
+        velocities = self.group_velocities(group, now)
+        if not velocities:
+            return None
+        changes = np.array([v.implied_change for v in velocities])
+        shortened = changes >= self.min_move
+        drifted = changes <= -self.min_move
+        moved = shortened if shortened.sum() >= drifted.sum() else drifted
+        books_moved = int(moved.sum())
+        books_total = len(self._groups[group])
+        synchronicity = books_moved / books_total
+        if books_moved < self.min_books or synchronicity < self.min_sync:
+            return None
+
+        direction = "shorten" if moved is shortened else "drift"
+        steam = SteamEvent(
+            event_id=group[0],
+            offer_type=group[1],
+            choice=group[2],
+            detected_at=datetime.fromtimestamp(now, UTC),
+            window_seconds=self.window_seconds,
+            direction=direction,
+            books_moved=books_moved,
+            books_total=books_total,
+            synchronicity=synchronicity,
+            avg_velocity=float(np.mean([v.velocity for v, m in zip(velocities, moved, strict=True) if m])),
+            bookmakers=[v.bookmaker for v, m in zip(velocities, moved, strict=True) if m],
+        )
+        self._last_emitted[group] = now
+        self.events.append(steam)
+        STEAM_EVENTS.labels(offer_type=group[1], direction=direction).inc()
+        logger.info(
+            f"Steam detected for {group}: {books_moved}/{books_total} books {direction}"
+        )
+        return steam
+
+    def get_velocities(self, event_id: str) -> list[MarketVelocity]:
+        velocities = []
+        for group in [g for g in self._groups if g[0] == event_id]:
+            now = max(
+                self._buffers[(event_id, b, group[1], group[2])].last_timestamp or 0.0
+                for b in self._groups[group]
+            )
+            velocities.extend(self.group_velocities(group, now))
+        return velocities
+
+    def get_events(self, event_id: str | None = None, limit: int = 100) -> list[SteamEvent]:
+        events = [e for e in reversed(self.events) if event_id is None or e.event_id == event_id]
+        return events[:limit]
+
+
+STEAM_DETECTOR: SteamDetector | None = None
+
+
+def get_steam_detector() -> SteamDetector:
+    global STEAM_DETECTOR
+    if STEAM_DETECTOR is None:
+        STEAM_DETECTOR = SteamDetector()
+    return STEAM_DETECTOR
@@ -5,16 +5,28 @@ from oddstracker.domain.teamdata import NFL_DATA_PI_ABBR_TO_KAMBIDATA, TeamData
 from oddstracker.service import get_client
 
 TEAMS_CACHE = None
+TEAMS_BY_ABBR: dict[str, TeamData] = {}
 
 
 async def get_teams() -> list[TeamData]:
-    global TEAMS_CACHE
+    global TEAMS_CACHE, TEAMS_BY_ABBR
     if not TEAMS_CACHE:
-        await load_and_store_team_data()
-        TEAMS_CACHE = await get_client().get_teams()
+        teams = await get_client().get_teams()
+        if not teams:
+            await load_and_store_team_data()
+            teams = await get_client().get_teams()
+        TEAMS_CACHE = teams
+        TEAMS_BY_ABBR = {t.team_abbr: t for t in TEAMS_CACHE}
     return TEAMS_CACHE
 
 
+def invalidate_teams() -> None:
+    """Drop the cached teams so the next lookup re-reads them from the DB."""
+    global TEAMS_CACHE, TEAMS_BY_ABBR
+    TEAMS_CACHE = None
+    TEAMS_BY_ABBR = {}
+
+
 async def load_and_store_team_data():
     teams = nfl.import_team_desc()
     _teams_data = [
@@ -25,9 +37,9 @@ async def load_and_store_team_data():
     await get_client().add_teamdata(_teams_data)
 
 
-async def get_team_by_abbr(team_abbr: str) -> TeamData:
-    _teams = await get_teams()
-    return list(filter(lambda t: t.team_abbr == team_abbr, _teams))[0]
+async def get_team_by_abbr(team_abbr: str) -> TeamData | None:
+    await get_teams()
+    return TEAMS_BY_ABBR.get(team_abbr)
 
 
 async def get_events_by_teamabbr(team_abbr: str) -> list[SportEvent]:
@@ -37,11 +49,12 @@ async def get_events_by_teamabbr(team_abbr: str) -> list[SportEvent]:
     return await get_client().get_events_by_teamabbr(team_abbr=team_abbr)
 
 
-async def get_team_event_offers(team_abbr: str) -> list[EventOffer]:
+async def get_team_event_offers(
+    team_abbr: str, upcoming: bool = False, latest: bool = False
+) -> list[EventOffer]:
     team = await get_team_by_abbr(team_abbr)
     if not team or not team.team_nick:
         raise ValueError(f"Team with abbreviation '{team_abbr}' not found.")
-    event = (await get_client().get_events_by_teamabbr(team_abbr=team.team_abbr))[0]
-    if not event:
-        raise ValueError(f"No events found for team '{team_abbr}'.")
-    return await get_client().get_eventoffers_for_sportevent(event_id=event.id)
+    return await get_client().get_team_eventoffers(
+        team.team_abbr, upcoming=upcoming, latest=latest
+    )
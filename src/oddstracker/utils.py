@@ -26,6 +26,11 @@ def get_utc_now():
     return datetime.now(UTC)
 
 
+def as_utc(at: datetime) -> datetime:
+    """Naive datetimes, e.g. from query params, are taken as UTC."""
+    return at.replace(tzinfo=UTC) if at.tzinfo is None else at
+
+
 def sign_int(v) -> str:
     if isinstance(v, str) and not v.startswith("-"):
         if int(v) > 0:
@@ -1,5 +1,7 @@
+import copy
 import json
 import os
+import uuid
 from collections.abc import AsyncGenerator, Generator
 from functools import lru_cache
 from typing import Any
@@ -32,6 +34,23 @@ def get_sample_events(provider_key: str) -> list[dict] | dict:
     return load_json(provider_key, "sample-raw")
 
 
+def get_unique_sportevents(provider_key: str, count: int | None = None) -> list:
+    """
+    Sample events converted under fresh event ids, so a test's rows never collide
+    with what other tests stored in the session-scoped DB.
+    """
+    from oddstracker.domain.model.converter import convert_to_sportevents
+
+    suffix = uuid.uuid4().hex[:8]
+    data = copy.deepcopy(get_sample_events(provider_key))
+    _sportevents = convert_to_sportevents(provider_key, data)[:count]
+    for _sportevent in _sportevents:
+        _sportevent.event.id = f"{_sportevent.event.id}_{suffix}"
+        for offer in _sportevent.offers:
+            offer.event_id = _sportevent.event.id
+    return _sportevents
+
+
 class _MockResponse:
 
     def __init__(self, payload: Any, *, status_code: int = 200, headers: dict[str, str] | None = None) -> None:
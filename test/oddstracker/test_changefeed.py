@@ -0,0 +1,94 @@
+import asyncio
+
+import orjson
+import pytest
+
+from oddstracker.service import changefeed
+from oddstracker.service.changefeed import (
+    INSTANCE_ID,
+    MAX_PAYLOAD_BYTES,
+    ChangeFeed,
+    encode_payloads,
+)
+from oddstracker.service.dataversion import DataVersions
+
+
+def test_encode_payloads_single():
+    payloads = encode_payloads(["e1", "e2"], ["MIA"], version=3)
+    assert len(payloads) == 1
+    assert orjson.loads(payloads[0]) == {
+        "origin": INSTANCE_ID,
+        "version": 3,
+        "lsn": 0,
+        "events": ["e1", "e2"],
+        "teams": ["MIA"],
+    }
+
+
+def test_encode_payloads_chunks_under_notify_limit():
+    event_ids = [f"event-{i:06d}" for i in range(2000)]
+    payloads = encode_payloads(event_ids, ["MIA", "BUF"], version=1)
+    assert len(payloads) > 1
+    assert all(len(p) <= MAX_PAYLOAD_BYTES for p in payloads)
+    decoded = [orjson.loads(p) for p in payloads]
+    assert [e for d in decoded for e in d["events"]] == event_ids
+    assert all(d["teams"] == ["MIA", "BUF"] for d in decoded)
+
+
+@pytest.mark.asyncio
+async def test_notification_fan_out_and_remote_apply(monkeypatch):
+    feed = ChangeFeed(channel="test")
+    applied = []
+
+    async def _apply_remote(change):
+        applied.append(change)
+
+    monkeypatch.setattr(feed, "_apply_remote", _apply_remote)
+    queue = feed.subscribe()
+
+    local = encode_payloads(["e1"], [], version=1)[0]
+    remote = encode_payloads(["e2"], [], version=7, origin="other")[0]
+    feed._on_notification(None, 0, "test", local)
+    feed._on_notification(None, 0, "test", remote)
+    feed._on_notification(None, 0, "test", "not json")
+    await asyncio.sleep(0)
+
+    assert [queue.get_nowait()["events"] for _ in range(queue.qsize())] == [["e1"], ["e2"]]
+    assert [c["version"] for c in applied] == [7]
+
+    feed.unsubscribe(queue)
+    feed._on_notification(None, 0, "test", remote)
+    assert queue.empty()
+
+
+def test_slow_subscriber_drops_oldest(monkeypatch):
+    monkeypatch.setattr(changefeed, "SUBSCRIBER_QUEUE_SIZE", 2)
+    feed = ChangeFeed(channel="test")
+    queue = feed.subscribe()
+    for version in range(3):
+        feed._fan_out({"version": version})
+    assert [queue.get_nowait()["version"] for _ in range(2)] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_remote_apply_refreshes_before_bumping(monkeypatch):
+    versions = DataVersions()
+    seen = []
+
+    class _Client:
+        def require_lsn(self, lsn):
+            seen.append(lsn)
+
+        async def refresh_hot_cache(self, event_ids):
+            seen.append(versions.get("e1")[0])
+
+        async def get_eventoffer_rows_batch(self, event_ids, mode):
+            return []
+
+    monkeypatch.setattr(changefeed, "get_client", lambda: _Client())
+    monkeypatch.setattr(changefeed, "get_data_versions", lambda: versions)
+    await ChangeFeed(channel="test")._apply_remote(
+        {"events": ["e1"], "teams": [], "version": 9, "lsn": 42}
+    )
+    assert seen == [42, 0]
+    assert versions.get("e1")[0] == 1
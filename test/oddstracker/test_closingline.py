@@ -0,0 +1,74 @@
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+
+from oddstracker.service.closingline import compute_clv
+
+
+def test_compute_clv():
+    taken = np.array([2.10, 1.80, 2.00])
+    closing = np.array([2.00, 2.00, np.nan])
+    clv, clv_implied = compute_clv(taken, closing)
+
+    assert clv[0] == pytest.approx(0.05)
+    assert clv[1] == pytest.approx(-0.10)
+    assert clv_implied[0] == pytest.approx(1 / 2.00 - 1 / 2.10)
+    assert clv_implied[1] < 0
+    assert np.isnan(clv[2]) and np.isnan(clv_implied[2])
+
+
+@pytest.mark.asyncio
+async def test_ticket_clv(postgres_client):
+    from oddstracker.service.closingline import ClvTicket, get_ticket_clv
+    from test.oddstracker.conftest import get_unique_sportevents
+
+    _sportevents = get_unique_sportevents("theoddsapi")
+    await postgres_client.add_sporteventdata_batch(_sportevents)
+    await postgres_client.freeze_closing_lines(since=datetime(2000, 1, 1, tzinfo=UTC))
+
+    # One ticket per outcome quoted before kickoff, under its real outcome name
+    quoted = {
+        (o.event_id, o.offer_type, o.choice): o
+        for s in _sportevents
+        for o in s.offers
+        if o.offer_type == "h2h"
+        and o.timestamp <= datetime.fromisoformat(s.event.commence_time.replace("Z", "+00:00"))
+    }
+    assert quoted
+    tickets = [
+        ClvTicket(event_id=event_id, offer_type=offer_type, choice=choice, price=2.0)
+        for event_id, offer_type, choice in quoted
+    ]
+    tickets.append(ClvTicket(event_id="missing", offer_type="h2h", choice="Nobody", price=2.0))
+
+    results = await get_ticket_clv(tickets)
+    assert len(results) == len(tickets)
+    for result in results[:-1]:
+        assert result.closing_price is not None
+        assert result.clv == pytest.approx(2.0 / result.closing_price - 1)
+    assert results[-1].closing_price is None and results[-1].clv is None
+
+
+@pytest.mark.asyncio
+async def test_freeze_captures_books_stored_later(postgres_client):
+    from oddstracker.domain.model.sportevent import EventOffer
+    from test.oddstracker.conftest import get_unique_sportevents
+
+    since = datetime(2000, 1, 1, tzinfo=UTC)
+    _sportevent, offer = next(
+        (s, o)
+        for s in get_unique_sportevents("theoddsapi")
+        for o in s.offers
+        if o.timestamp <= datetime.fromisoformat(s.event.commence_time.replace("Z", "+00:00"))
+    )
+    _sportevent.offers = [offer]
+    await postgres_client.add_sporteventdata(_sportevent)
+    await postgres_client.freeze_closing_lines(since=since)
+
+    # Another book's pre-kickoff quote arrives after the first line was frozen
+    _sportevent.offers = [EventOffer(**{**offer.model_dump(), "bookmaker": "latebook"})]
+    await postgres_client.add_sporteventdata(_sportevent)
+    assert await postgres_client.freeze_closing_lines(since=since) >= 1
+    lines = await postgres_client.get_closing_lines([_sportevent.event.id])
+    assert {line.bookmaker for line in lines} == {offer.bookmaker, "latebook"}
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from oddstracker.domain.model.collection_response import CollectionResponse
+from oddstracker.service import collectjobs
+from oddstracker.service.collectjobs import CollectJobQueue
+
+
+@pytest.mark.asyncio
+async def test_collect_job_dedupes_inflight(monkeypatch):
+    release = asyncio.Event()
+    calls = []
+
+    async def _collect(provider_key, league):
+        calls.append((provider_key, league))
+        await release.wait()
+        return CollectionResponse(
+            collected=2, offers=10, stages={"fetch": 0.1}, provider_key=provider_key
+        )
+
+    monkeypatch.setattr(collectjobs, "coordinated_collect", _collect)
+    queue = CollectJobQueue(workers=2)
+
+    job = queue.submit("kambi", "nfl")
+    assert queue.submit("kambi", "nfl") is job
+    other = queue.submit("theoddsapi", "nfl")
+    assert other.job_id != job.job_id
+    assert job.to_response().status == "queued"
+
+    await asyncio.sleep(0)
+    assert job.status == "running"
+    release.set()
+    job = await queue.wait(job.job_id)
+    await queue.wait(other.job_id)
+
+    assert sorted(calls) == [("kambi", "nfl"), ("theoddsapi", "nfl")]
+    assert job.status == "success"
+    assert (job.collected, job.offers) == (2, 10)
+    assert set(job.stages) == {"queue", "fetch"}
+    assert job.to_response().job_id == job.job_id
+    # Finished jobs no longer absorb new submissions
+    assert queue.submit("kambi", "nfl").job_id != job.job_id
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_collect_job_failure(monkeypatch):
+    async def _collect(provider_key, league):
+        raise ValueError("provider down")
+
+    monkeypatch.setattr(collectjobs, "coordinated_collect", _collect)
+    queue = CollectJobQueue(workers=1, history=1)
+
+    first = await queue.wait(queue.submit("kambi", "nfl").job_id)
+    assert first.status == "failed"
+    assert first.error == "provider down"
+    with pytest.raises(ValueError):
+        first.to_response()
+
+    second = await queue.wait(queue.submit("kambi", "nfl").job_id)
+    queue.submit("theoddsapi", "nfl")
+    # Only `history` finished jobs are kept
+    assert queue.get(first.job_id) is None
+    assert queue.get(second.job_id) is second
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_collect_job_wait_survives_trim(monkeypatch):
+    release = asyncio.Event()
+
+    async def _collect(provider_key, league):
+        await release.wait()
+        if provider_key == "theoddsapi":
+            # Runs after the kambi job finished but before its waiter resumes
+            queue.submit("theoddsapi", "nba")
+        return CollectionResponse(collected=1, offers=1, provider_key=provider_key)
+
+    monkeypatch.setattr(collectjobs, "coordinated_collect", _collect)
+    queue = CollectJobQueue(workers=2, history=0)
+
+    job = queue.submit("kambi", "nfl")
+    queue.submit("theoddsapi", "nfl")
+    waiter = asyncio.create_task(queue.wait(job.job_id))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter is job
+    assert job.status == "success"
+    assert queue.get(job.job_id) is None
+    with pytest.raises(ValueError):
+        await queue.wait(job.job_id)
+    await queue.stop()
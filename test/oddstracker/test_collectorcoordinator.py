@@ -0,0 +1,87 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from oddstracker.service import collectorcoordinator
+from oddstracker.service.collectorcoordinator import (
+    LeaseLostError,
+    collector_lease,
+    coordinated_collect,
+    preferred_targets,
+)
+
+TARGETS = [("kambi", "nfl"), ("theoddsapi", "nfl"), ("kambi", "ncaaf")]
+
+
+def test_preferred_targets_spread_across_replicas():
+    orders = {tuple(preferred_targets(TARGETS, f"replica-{i}")) for i in range(8)}
+    assert all(sorted(order) == sorted(TARGETS) for order in orders)
+    assert len({order[0] for order in orders}) > 1
+    assert preferred_targets(TARGETS, "replica-0") == preferred_targets(TARGETS, "replica-0")
+
+
+class _LeaseClient:
+    def __init__(self, available: bool):
+        self.available = available
+        self.released = []
+
+    async def acquire_lease(self, name, holder, ttl, min_age):
+        return self.available
+
+    async def renew_lease(self, name, holder, ttl):
+        return True
+
+    async def release_lease(self, name, holder, collected):
+        self.released.append((name, collected))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("available", [True, False])
+async def test_coordinated_collect(monkeypatch, available):
+    client = _LeaseClient(available)
+    collected = []
+
+    async def _collect(provider_key, league):
+        collected.append((provider_key, league))
+        return collectorcoordinator.CollectionResponse(collected=3, provider_key=provider_key)
+
+    monkeypatch.setattr(collectorcoordinator, "get_client", lambda: client)
+    monkeypatch.setattr(collectorcoordinator, "collect_and_store_bettingdata", _collect)
+
+    response = await coordinated_collect("kambi", "nfl")
+    if available:
+        assert response.status == "success"
+        assert collected == [("kambi", "nfl")]
+        assert client.released == [("collect:kambi:nfl", True)]
+    else:
+        assert response.status == "skipped"
+        assert collected == []
+        assert client.released == []
+
+
+class _LosingLeaseClient(_LeaseClient):
+    def __init__(self, renewal):
+        super().__init__(True)
+        self.renewal = renewal
+
+    async def renew_lease(self, name, holder, ttl):
+        if isinstance(self.renewal, Exception):
+            raise self.renewal
+        return self.renewal
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("renewal", [False, ConnectionError("db down")])
+async def test_lost_lease_cancels_collection(monkeypatch, renewal):
+    client = _LosingLeaseClient(renewal)
+    monkeypatch.setattr(collectorcoordinator, "get_client", lambda: client)
+
+    stored = []
+    with pytest.raises(LeaseLostError):
+        async with collector_lease("collect:kambi:nfl", ttl=timedelta(seconds=0.03)):
+            await asyncio.sleep(1)
+            stored.append(True)
+    assert stored == []
+    assert client.released == [("collect:kambi:nfl", False)]
+    assert not asyncio.current_task().cancelling()
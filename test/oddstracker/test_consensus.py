@@ -0,0 +1,89 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from oddstracker.domain.model.sportevent import EventOffer
+from oddstracker.service.consensus import ConsensusEngine, compute_consensus
+
+START = datetime(2025, 10, 26, 12, 0, tzinfo=UTC)
+
+
+def _offer(bookmaker: str, minutes: int, price: float, point: float | None = None) -> EventOffer:
+    return EventOffer(
+        event_id="2025_08_MIA_ATL",
+        bookmaker=bookmaker,
+        offer_type="spreads",
+        choice="MIA",
+        timestamp=START + timedelta(minutes=minutes),
+        price=price,
+        point=point,
+    )
+
+
+def test_compute_consensus_excludes_outliers():
+    prices = np.array([1.90, 1.91, 1.92, 3.00])
+    points = np.array([-3.0, -3.0, -3.5, np.nan])
+    weights = np.array([1.0, 1.0, 2.0, 1.0])
+
+    price_median, price_weighted, point_median, point_weighted, excluded = compute_consensus(
+        prices, points, weights, outlier_threshold=0.05
+    )
+    assert excluded == 1
+    assert price_median == pytest.approx(1.91)
+    assert 1.90 < price_weighted < 1.92
+    assert point_median == -3.0
+    assert point_weighted == pytest.approx(-3.25)
+
+
+def test_engine_updates_incrementally():
+    engine = ConsensusEngine(book_weights={}, outlier_threshold=0.05)
+    now = START + timedelta(minutes=1)
+    changed = engine.update([_offer(b, 0, 1.91, -3.0) for b in ["a", "b", "c"]], now=now)
+    assert len(changed) == 1
+    assert changed[0].books == 3
+
+    # Re-collected quotes with the same timestamp do not produce a new line
+    assert not engine.update([_offer("a", 0, 1.91, -3.0)], now=now)
+
+    later = START + timedelta(minutes=6)
+    changed = engine.update([_offer("a", 5, 1.80, -3.5), _offer("b", 5, 1.80, -3.5)], now=later)
+    assert len(changed) == 1
+    assert changed[0].price_median == pytest.approx(1.80)
+    assert changed[0].timestamp == later
+    assert engine.get_lines("2025_08_MIA_ATL", "spreads") == changed
+    assert engine.get_lines("2025_08_MIA_ATL", "h2h") == []
+
+
+def test_engine_stamps_moves_with_compute_time():
+    engine = ConsensusEngine(book_weights={}, outlier_threshold=0.05)
+    first = engine.update([_offer("a", 10, 1.91), _offer("b", 10, 1.91)], now=START)
+    # A late quote older than b's latest still moves consensus and gets its own row
+    moved = engine.update([_offer("a", 11, 1.95)], now=START + timedelta(seconds=1))
+    assert moved and moved[0].timestamp > first[0].timestamp
+
+    # Only the weighted point moves: the median of (-3.5, -3, -3) stays at -3
+    engine = ConsensusEngine(book_weights={"a": 3.0}, outlier_threshold=0.05)
+    engine.update([_offer(b, 0, 1.91, -3.0) for b in ["a", "b", "c"]], now=START)
+    (moved,) = engine.update([_offer("a", 1, 1.91, -3.5)], now=START)
+    assert moved.point_median == -3.0
+    assert moved.point_weighted == pytest.approx(-3.3)
+
+
+def test_engine_evicts_stale_events():
+    engine = ConsensusEngine(book_weights={}, outlier_threshold=0.05, window=timedelta(hours=1))
+    engine.update([_offer("a", 0, 1.91)], now=START)
+    assert len(engine) == 1
+    engine.update([], now=START + timedelta(hours=2))
+    assert len(engine) == 0
+    assert engine.get_lines("2025_08_MIA_ATL") == []
+
+
+def test_engine_keeps_collected_events_with_old_quotes():
+    # Stable markets keep their original quote timestamp across collections
+    engine = ConsensusEngine(book_weights={}, outlier_threshold=0.05, window=timedelta(hours=1))
+    quotes = [_offer(b, 0, 1.91, -3.0) for b in ["a", "b"]]
+    assert len(engine.update(quotes, now=START + timedelta(hours=3))) == 1
+    for hours in (4, 5):
+        assert engine.update(quotes, now=START + timedelta(hours=hours)) == []
+    assert len(engine.get_lines("2025_08_MIA_ATL")) == 1
@@ -0,0 +1,32 @@
+import copy
+
+import pytest
+
+from oddstracker.service.conversionpool import ConversionPool, convert_sportevents, split_payload
+from test.oddstracker.conftest import get_sample_events
+
+
+def test_split_payload():
+    events = [{"id": i} for i in range(5)]
+    assert [len(p) for p in split_payload("theoddsapi", events, 2)] == [3, 2]
+    assert split_payload("theoddsapi", events, 8) == [[e] for e in events]
+    assert split_payload("theoddsapi", [], 4) == [[]]
+    kambi = split_payload("kambi", {"events": events, "terms": []}, 2)
+    assert [len(p["events"]) for p in kambi] == [3, 2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider_key", ["theoddsapi", "kambi"])
+async def test_process_conversion_matches_inline(provider_key):
+    data = get_sample_events(provider_key)
+    inline = await convert_sportevents(provider_key, copy.deepcopy(data), executor="inline")
+
+    pool = ConversionPool(processes=2)
+    try:
+        converted = await pool.convert(provider_key, copy.deepcopy(data))
+    finally:
+        pool.shutdown()
+
+    assert [e.event.id for e in converted] == [e.event.id for e in inline]
+    assert [len(e.offers) for e in converted] == [len(e.offers) for e in inline]
+    assert converted[0].offers[0].price == inline[0].offers[0].price
@@ -0,0 +1,52 @@
+import pytest
+
+from oddstracker.service.dataversion import ConditionalRequestMiddleware, DataVersions
+
+
+async def _request(middleware, path: str, headers: dict[str, str] | None = None) -> list[dict]:
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [(k.encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+    await middleware(scope, None, send)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    versions = DataVersions()
+    middleware = ConditionalRequestMiddleware(app, versions=versions)
+
+    sent = await _request(middleware, "/event/a")
+    etag = dict(sent[0]["headers"])[b"etag"].decode()
+    assert etag == versions.etag("a")
+
+    sent = await _request(middleware, "/event/a", {"if-none-match": etag})
+    assert sent[0]["status"] == 304
+    assert calls == ["/event/a"]
+
+    # Ingest of another event leaves this event's ETag valid but changes the listing's
+    versions.bump(["b"])
+    sent = await _request(middleware, "/event/a", {"if-none-match": etag})
+    assert sent[0]["status"] == 304
+    sent = await _request(middleware, "/event", {"if-none-match": etag})
+    assert sent[0]["status"] == 200
+
+    versions.bump(["a"])
+    sent = await _request(middleware, "/event/a", {"if-none-match": etag})
+    assert sent[0]["status"] == 200
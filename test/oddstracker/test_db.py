@@ -1,9 +1,12 @@
 import logging
+from datetime import timedelta
 
 import pytest
 
 from oddstracker.domain.model.converter import convert_to_sportevents
-from test.oddstracker.conftest import get_sample_events
+from oddstracker.domain.model.sportevent import EVENTOFFER_COLUMNS, EventOffer
+from oddstracker.utils import get_utc_now
+from test.oddstracker.conftest import get_sample_events, get_unique_sportevents
 
 logger = logging.getLogger(__name__)
 
@@ -53,3 +56,214 @@ async def test_db_store_retrieve(provider_key, postgres_client):
 
     except Exception as e:
         raise e
+
+
+@pytest.mark.asyncio
+async def test_db_eventoffers_asof(postgres_client):
+    _sporteventdata = get_unique_sportevents("theoddsapi", 1)[0]
+    await postgres_client.add_sporteventdata(_sporteventdata)
+
+    latest = max(o.timestamp for o in _sporteventdata.offers)
+    earliest = min(o.timestamp for o in _sporteventdata.offers)
+    board = await postgres_client.get_eventoffers_asof(latest)
+    assert {o.event_id for o in board} >= {_sporteventdata.event.id}
+    assert all(o.timestamp <= latest for o in board)
+
+    snapshots = await postgres_client.get_eventoffers_asof_batch(
+        [earliest, latest], offer_type="h2h"
+    )
+    assert len(snapshots[latest]) >= len(snapshots[earliest])
+    assert all(o.offer_type == "h2h" for o in snapshots[latest])
+
+
+@pytest.mark.asyncio
+async def test_db_sporteventdata_batch(postgres_client):
+    _sporteventdatas = get_unique_sportevents("theoddsapi", 2)
+    for _sporteventdata in _sporteventdatas:
+        await postgres_client.add_sporteventdata(_sporteventdata)
+    event_ids = [s.event.id for s in _sporteventdatas]
+
+    batch = await postgres_client.get_sporteventdata_batch(event_ids=event_ids, mode="all")
+    assert sorted(b.event.id for b in batch) == sorted(event_ids)
+    by_id = {b.event.id: b for b in batch}
+    for _sporteventdata in _sporteventdatas:
+        assert len(by_id[_sporteventdata.event.id].offers) == len(_sporteventdata.offers)
+
+    latest = await postgres_client.get_sporteventdata_batch(event_ids=event_ids, mode="latest")
+    for data in latest:
+        keys = [(o.bookmaker, o.offer_type, o.choice) for o in data.offers]
+        assert len(keys) == len(set(keys))
+
+
+@pytest.mark.asyncio
+async def test_db_keyset_pages(postgres_client):
+    _sporteventdata = get_unique_sportevents("theoddsapi", 1)[0]
+    await postgres_client.add_sporteventdata(_sporteventdata)
+    event_id = _sporteventdata.event.id
+
+    seen, after = [], None
+    while page := await postgres_client.get_eventoffers_page(3, after=after, event_id=event_id):
+        seen.extend(page)
+        last = page[-1]
+        after = (last.timestamp, last.event_id, last.bookmaker, last.offer_type, last.choice)
+    assert {(o.bookmaker, o.offer_type, o.choice, o.timestamp) for o in seen} == {
+        (o.bookmaker, o.offer_type, o.choice, o.timestamp) for o in _sporteventdata.offers
+    }
+    assert len(seen) == len({(o.bookmaker, o.offer_type, o.choice, o.timestamp) for o in seen})
+    assert [o.timestamp for o in seen] == sorted(o.timestamp for o in seen)
+
+    events = await postgres_client.get_events_page(1)
+    more = await postgres_client.get_events_page(
+        10, after=(events[0].commence_time, events[0].id)
+    )
+    assert events[0].id not in {e.id for e in more}
+
+
+@pytest.mark.asyncio
+async def test_db_add_sporteventdata_batch(postgres_client):
+    _sporteventdatas = get_unique_sportevents("theoddsapi")
+    await postgres_client.add_sporteventdata_batch(_sporteventdatas)
+    # Re-collecting the same payload only bumps updated_at and skips known offers
+    await postgres_client.add_sporteventdata_batch(_sporteventdatas)
+
+    for _sporteventdata in _sporteventdatas:
+        stored = await postgres_client.get_sporteventdata(_sporteventdata.event.id)
+        assert stored is not None
+        assert len(stored.offers) == len(
+            {(o.bookmaker, o.offer_type, o.choice, o.timestamp) for o in _sporteventdata.offers}
+        )
+
+    # Dirty tracking only remembers events commencing within the hot-cache window
+    recent, past = get_unique_sportevents("theoddsapi", 2)
+    recent.event.commence_time = get_utc_now().isoformat()
+    past.event.commence_time = (get_utc_now() - timedelta(days=30)).isoformat()
+    await postgres_client.add_sporteventdata_batch([recent, past])
+    assert recent.event.id in postgres_client._event_fields
+    assert past.event.id not in postgres_client._event_fields
+
+
+@pytest.mark.asyncio
+async def test_db_record_rows_match_orm(postgres_client):
+    _sporteventdata = get_unique_sportevents("theoddsapi", 1)[0]
+    await postgres_client.add_sporteventdata(_sporteventdata)
+    event_id = _sporteventdata.event.id
+    postgres_client.hot_cache = None
+
+    offers = await postgres_client.get_eventoffers_for_sportevent(event_id)
+    rows = await postgres_client.get_eventoffer_rows(event_id)
+    key = lambda row: (row[1], row[2], row[3], row[4])  # noqa: E731
+    assert sorted(map(tuple, rows), key=key) == sorted(
+        (tuple(getattr(o, c) for c in EVENTOFFER_COLUMNS) for o in offers), key=key
+    )
+
+    event_rows = await postgres_client.get_event_rows(id=event_id)
+    assert [r[0] for r in event_rows] == [event_id]
+
+
+@pytest.mark.asyncio
+async def test_db_encoded_storage_round_trip(postgres_client, monkeypatch):
+    from sqlalchemy import text
+    from sqlalchemy.engine import make_url
+
+    from oddstracker import config
+    from oddstracker.adapters.postgres_client import PostgresClient
+
+    # Encoded storage replaces the eventoffer table with a view, so it needs its own DB
+    async with postgres_client.engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("DROP DATABASE IF EXISTS oddstracker_encoded"))
+        await conn.execute(text("CREATE DATABASE oddstracker_encoded"))
+    url = make_url(postgres_client.db_url).set(database="oddstracker_encoded")
+    monkeypatch.setattr(config, "EVENTOFFER_STORAGE", "encoded")
+    client = PostgresClient(db_url=url.render_as_string(hide_password=False), use_null_pool=True)
+    try:
+        async with client.engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb"))
+        await client.initialize()
+        client.hot_cache = None
+
+        _sporteventdatas = get_unique_sportevents("theoddsapi", 2)
+        await client.add_sporteventdata_batch(_sporteventdatas)
+        await client.add_sporteventdata(_sporteventdatas[0])
+
+        def _row(o):
+            return tuple(getattr(o, c) for c in EVENTOFFER_COLUMNS if c != "updated_at")
+
+        for _sporteventdata in _sporteventdatas:
+            event_id = _sporteventdata.event.id
+            expected = {_row(o) for o in _sporteventdata.offers}
+            # One stored row per primary key, decoded back to the original values
+            rows = await client.get_eventoffer_rows(event_id)
+            for offers in (
+                (await client.get_sporteventdata(event_id)).offers,
+                await client.get_eventoffers_page(1000, event_id=event_id),
+                [EventOffer(**dict(zip(EVENTOFFER_COLUMNS, r, strict=True))) for r in rows],
+            ):
+                stored = [_row(o) for o in offers]
+                assert set(stored) <= expected
+                assert len(stored) == len({r[1:5] for r in expected})
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_db_eventoffer_series(postgres_client):
+    _sporteventdata = get_unique_sportevents("theoddsapi", 1)[0]
+    offer = next(o for o in _sporteventdata.offers if o.offer_type == "h2h")
+    later = EventOffer(
+        **{**offer.model_dump(), "timestamp": offer.timestamp + timedelta(hours=1), "price": 9.5}
+    )
+    _sporteventdata.offers.append(later)
+    await postgres_client.add_sporteventdata(_sporteventdata)
+    event_id = _sporteventdata.event.id
+
+    # Buckets before the first in-range quote carry the quote from before `start`
+    rows = await postgres_client.get_eventoffer_series(
+        event_id,
+        "h2h",
+        bucket=timedelta(minutes=5),
+        start=offer.timestamp + timedelta(minutes=10),
+        end=later.timestamp,
+    )
+    prices = [r[3] for r in rows if (r[1], r[2]) == (offer.bookmaker, offer.choice)]
+    assert prices[0] == offer.price
+    assert prices[-1] == later.price
+
+    # Naive bounds are UTC; an open range past the last quote is empty
+    naive = (offer.timestamp + timedelta(minutes=10)).replace(tzinfo=None)
+    assert await postgres_client.get_eventoffer_series(
+        event_id, "h2h", bucket=timedelta(minutes=5), start=naive
+    )
+    assert (
+        await postgres_client.get_eventoffer_series(
+            event_id, "h2h", bucket=timedelta(minutes=5), start=later.timestamp + timedelta(days=1)
+        )
+        == []
+    )
+
+    with pytest.raises(ValueError):
+        await postgres_client.get_eventoffer_series(
+            event_id,
+            "h2h",
+            bucket=timedelta(seconds=1),
+            start=offer.timestamp - timedelta(days=7),
+            end=later.timestamp,
+        )
+
+
+@pytest.mark.asyncio
+async def test_db_collector_lease(postgres_client):
+    ttl = timedelta(minutes=1)
+    name = "collect:test:nfl"
+    assert await postgres_client.acquire_lease(name, "a", ttl)
+    assert not await postgres_client.acquire_lease(name, "b", ttl)
+    assert await postgres_client.renew_lease(name, "a", ttl)
+    assert not await postgres_client.renew_lease(name, "b", ttl)
+
+    await postgres_client.release_lease(name, "a", collected=True)
+    # Released, but collected too recently for the minimum interval
+    assert not await postgres_client.acquire_lease(name, "b", ttl, min_age=ttl)
+    assert await postgres_client.acquire_lease(name, "b", ttl)
+    leases = {lease.name: lease for lease in await postgres_client.get_leases()}
+    assert leases[name].holder == "b"
+    assert leases[name].collected_at is not None
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import pytest
+
+from oddstracker import config
+from oddstracker.adapters.dbengine import (
+    ReadReplica,
+    asyncpg_url,
+    create_engine,
+    engine_options,
+)
+from oddstracker.adapters.postgres_client import PostgresClient
+
+
+def test_asyncpg_url_sets_statement_cache():
+    url = asyncpg_url("postgresql://u:p@localhost:5433/oddstracker")
+    assert url.startswith("postgresql+asyncpg://u:p@localhost:5433/oddstracker")
+    assert f"prepared_statement_cache_size={config.PG_STATEMENT_CACHE_SIZE}" in url
+    assert asyncpg_url(url) == url
+
+
+def test_engine_options():
+    options = engine_options()
+    assert options["pool_size"] == config.PG_POOL_SIZE
+    assert options["max_overflow"] == config.PG_MAX_OVERFLOW
+    assert options["connect_args"]["statement_cache_size"] == config.PG_STATEMENT_CACHE_SIZE
+    assert "pool_size" not in engine_options(use_null_pool=True)
+
+
+def test_create_engine_pool():
+    engine = create_engine("postgresql://u:p@localhost:5433/oddstracker")
+    assert engine.sync_engine.pool.size() == config.PG_POOL_SIZE
+
+
+@pytest.mark.asyncio
+async def test_replica_routing_and_fallback():
+    client = PostgresClient(
+        db_url="postgresql://u:p@localhost:1/oddstracker",
+        read_urls=[
+            "postgresql://u:p@localhost:1/replica0",
+            "postgresql://u:p@localhost:1/replica1",
+        ],
+    )
+    # Unreachable replicas are skipped and reads fall back to the primary
+    assert await client._choose_replica() is None
+    assert all(not r.healthy for r in client.replicas)
+    assert await client._read_engine() is client.engine
+
+    fresh, stale = client.replicas
+    fresh.lag, stale.lag = 0.0, config.PG_REPLICA_MAX_LAG_SECONDS + 1
+    fresh.checked_at = stale.checked_at = time.monotonic()
+    assert {await client._choose_replica() for _ in range(4)} == {fresh}
+
+    # After a write, replicas are used again only once they replayed past it
+    client.require_lsn(100)
+    fresh.replayed = 50
+    assert await client._choose_replica() is None
+    fresh.replayed = 100
+    assert await client._choose_replica() is fresh
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_replica_check_single_flight_and_timeout(monkeypatch):
+    replica = ReadReplica("postgresql://u:p@localhost:1/replica0", role="replica0")
+    probes = []
+
+    async def _measure(delay: float, lag: float | None):
+        probes.append(delay)
+        await asyncio.sleep(delay)
+        return lag
+
+    monkeypatch.setattr(replica, "_measure", lambda: _measure(0.05, 1.0))
+    assert await asyncio.gather(*(replica.check() for _ in range(5))) == [True] + [False] * 4
+    assert probes == [0.05]
+
+    # A disconnected replica measures as NULL, a hanging one times out
+    for measure in (lambda: _measure(0, None), lambda: _measure(5, 0.0)):
+        monkeypatch.setattr(replica, "_measure", measure)
+        monkeypatch.setattr(config, "PG_REPLICA_CHECK_TIMEOUT_SECONDS", 0.05)
+        replica.checked_at = 0.0
+        assert await replica.check() is False
+        assert replica.lag is None
+    await replica.engine.dispose()
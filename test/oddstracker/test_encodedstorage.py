@@ -0,0 +1,50 @@
+from datetime import UTC, datetime
+
+from oddstracker.adapters.encodedstorage import DimensionInterner, create_statements
+from oddstracker.domain.model.sportevent import EventOffer
+
+
+def _offer(bookmaker: str, choice: str) -> EventOffer:
+    ts = datetime(2025, 9, 7, 17, 0, tzinfo=UTC)
+    return EventOffer(
+        event_id="evt",
+        bookmaker=bookmaker,
+        offer_type="h2h",
+        choice=choice,
+        timestamp=ts,
+        price=1.9,
+        updated_at=ts,
+    )
+
+
+def test_interner_missing_and_encode():
+    interner = DimensionInterner()
+    offers = [_offer("draftkings", "MIA"), _offer("fanduel", "MIA")]
+    assert interner.missing(offers) == {
+        "event_id": {"evt"},
+        "bookmaker": {"draftkings", "fanduel"},
+        "offer_type": {"h2h"},
+        "choice": {"MIA"},
+    }
+
+    interner._ids["event_id"]["evt"] = 1
+    interner._ids["bookmaker"].update(draftkings=1, fanduel=2)
+    interner._ids["offer_type"]["h2h"] = 1
+    interner._ids["choice"]["MIA"] = 7
+    assert interner.missing(offers) == {}
+    row = interner.encode(offers[1])
+    assert (row["event_id_key"], row["bookmaker_key"], row["offer_type_key"], row["choice_key"]) == (
+        1,
+        2,
+        1,
+        7,
+    )
+    assert row["price"] == 1.9
+
+
+def test_create_statements_define_decoding_view():
+    statements = create_statements()
+    view = statements[-1]
+    assert view.startswith("CREATE OR REPLACE VIEW eventoffer AS")
+    for column in ("event_id", "bookmaker", "offer_type", "choice", "timestamp", "price", "point"):
+        assert column in view
@@ -0,0 +1,43 @@
+from datetime import UTC, datetime
+
+import orjson
+import pytest
+
+from oddstracker.domain.model.sportevent import EVENTOFFER_COLUMNS, EventOffer
+from oddstracker.service.fastresponse import rows_response
+
+ROWS = [
+    ("2025_08_MIA_ATL", "kambi", "h2h", "MIA", datetime(2025, 10, 26, tzinfo=UTC), 2.1, None,
+     datetime(2025, 10, 26, tzinfo=UTC)),
+    ("2025_08_MIA_ATL", "kambi", "spreads", "MIA", datetime(2025, 10, 26, tzinfo=UTC), 1.9, 3.5,
+     datetime(2025, 10, 26, tzinfo=UTC)),
+]
+
+
+def test_rows_response_sparse_fields():
+    response = rows_response(ROWS, EVENTOFFER_COLUMNS, fields="price,point,timestamp")
+    body = orjson.loads(response.body)
+    assert body == [
+        {"price": 2.1, "timestamp": "2025-10-26T00:00:00Z"},
+        {"price": 1.9, "point": 3.5, "timestamp": "2025-10-26T00:00:00Z"},
+    ]
+
+
+def test_rows_response_all_fields_and_validation():
+    body = orjson.loads(rows_response(ROWS, EVENTOFFER_COLUMNS).body)
+    assert set(body[1]) == set(EVENTOFFER_COLUMNS)
+    assert "point" not in body[0]
+    with pytest.raises(ValueError):
+        rows_response(ROWS, EVENTOFFER_COLUMNS, fields="price,odds")
+
+
+def test_rows_response_matches_pydantic():
+    body = orjson.loads(rows_response(ROWS, EVENTOFFER_COLUMNS).body)
+    assert body == [
+        orjson.loads(
+            EventOffer(**dict(zip(EVENTOFFER_COLUMNS, row, strict=True))).model_dump_json(
+                exclude_none=True
+            )
+        )
+        for row in ROWS
+    ]
@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+from oddstracker.adapters.hotcache import OddsHotCache
+from oddstracker.domain.model.sportevent import EventOffer, SportEvent, SportEventData
+from oddstracker.utils import get_utc_now
+
+NOW = get_utc_now().replace(microsecond=0)
+
+
+def _event(event_id: str, commence: timedelta) -> SportEvent:
+    return SportEvent(
+        id=event_id,
+        sport_key="americanfootball_nfl",
+        sport_title="NFL",
+        commence_time=(NOW + commence).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        home_team="ATL",
+        away_team="MIA",
+    )
+
+
+def _offer(event_id: str, bookmaker: str, minutes: int, price: float) -> EventOffer:
+    return EventOffer(
+        event_id=event_id,
+        bookmaker=bookmaker,
+        offer_type="h2h",
+        choice="MIA",
+        timestamp=NOW - timedelta(minutes=minutes),
+        price=price,
+    )
+
+
+def test_hot_cache_serves_complete_histories():
+    cache = OddsHotCache(timedelta(hours=48))
+    upcoming = _event("upcoming", timedelta(days=1))
+    cache.warm([upcoming], [])
+
+    offers = [_offer("upcoming", "kambi", m, 2.0 + m / 100) for m in (30, 10, 20)]
+    cache.add(SportEventData(event=upcoming, offers=offers), is_new=False)
+    cache.add(SportEventData(event=upcoming, offers=offers[:1]), is_new=False)
+
+    history = cache.get_eventoffers("upcoming")
+    assert [o.timestamp for o in history] == sorted(o.timestamp for o in offers)
+    assert [o.price for o in cache.get_eventoffer_history("h2h", "upcoming", limit=2)] == [
+        2.1,
+        2.2,
+    ]
+    first_last = cache.get_sporteventdata("upcoming", first_last=True)
+    assert [o.price for o in first_last.offers] == [2.3, 2.1]
+
+    # Existing events that were not warmed are never partially cached
+    other = _event("other", timedelta(days=1))
+    cache.add(SportEventData(event=other, offers=offers), is_new=False)
+    assert "other" not in cache
+    cache.add(SportEventData(event=other, offers=offers), is_new=True)
+    assert "other" in cache
+
+    # Events that commenced before the window are evicted
+    old = _event("old", -timedelta(days=3))
+    cache.add(SportEventData(event=old, offers=offers), is_new=True)
+    assert "old" not in cache
+    assert cache.get_eventoffers("old") is None
+
+
+def test_hot_cache_extends_from_watermarks():
+    cache = OddsHotCache(timedelta(hours=48))
+    upcoming = _event("upcoming", timedelta(days=1))
+    first = _offer("upcoming", "kambi", 30, 2.0)
+    cache.warm([upcoming], [])
+    cache.add(SportEventData(event=upcoming, offers=[first]), is_new=False)
+    assert cache.watermarks(["upcoming", "unknown"]) == {"upcoming": first.updated_at}
+
+    # Rows another replica stored, overlapping what the cache already holds
+    late = _offer("upcoming", "fanduel", 40, 2.1)
+    late.updated_at = first.updated_at + timedelta(seconds=5)
+    rows = [
+        (
+            o.event_id,
+            o.bookmaker,
+            o.offer_type,
+            o.choice,
+            o.timestamp,
+            o.price,
+            o.point,
+            o.updated_at,
+        )
+        for o in (first, late)
+    ]
+    cache.extend([upcoming], rows)
+    assert sorted(o.price for o in cache.get_eventoffers("upcoming")) == [2.0, 2.1]
+    assert cache.watermarks(["upcoming"]) == {"upcoming": late.updated_at}
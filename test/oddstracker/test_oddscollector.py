@@ -22,3 +22,30 @@ async def test_odds_collector(
     assert toa_result.collected >= 1
     assert kambi_result.collected >= 1
     assert mock_betting_data_requests.call_count == 2
+
+
+def test_shard_sportevents():
+    from oddstracker.domain.model.converter import convert_to_sportevents
+    from oddstracker.service.oddscollector import shard_sportevents
+    from test.oddstracker.conftest import get_sample_events
+
+    _sportevents = convert_to_sportevents("theoddsapi", get_sample_events("theoddsapi"))
+    shards = shard_sportevents(_sportevents, 3)
+    assert 1 <= len(shards) <= 3
+    assert sorted(e.event.id for shard in shards for e in shard) == sorted(
+        e.event.id for e in _sportevents
+    )
+    assert shard_sportevents(_sportevents, 3) == shards
+
+
+@pytest.mark.asyncio
+async def test_store_sharded_writers(postgres_client):
+    from oddstracker.domain.model.converter import convert_to_sportevents
+    from oddstracker.service.oddscollector import store_sports_betting_info
+    from test.oddstracker.conftest import get_sample_events
+
+    _sportevents = convert_to_sportevents("theoddsapi", get_sample_events("theoddsapi"))
+    await store_sports_betting_info(_sportevents, writers=4)
+
+    stored = await postgres_client.get_events()
+    assert {e.event.id for e in _sportevents} <= {e.id for e in stored}
@@ -0,0 +1,33 @@
+import io
+from datetime import UTC, datetime, timedelta
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from oddstracker.service.oddsexport import encode_batches
+
+START = datetime(2025, 10, 26, 12, 0, tzinfo=UTC)
+
+
+async def _chunks():
+    for i in range(3):
+        yield [
+            ("2025_08_MIA_ATL", bookmaker, "h2h", "MIA", START + timedelta(minutes=i), 1.9 + i, None)
+            for bookmaker in ["kambi", f"book{i}"]
+        ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+async def test_encode_batches(fmt):
+    data = b"".join([chunk async for chunk in encode_batches(fmt, _chunks())])
+
+    if fmt == "parquet":
+        table = pq.read_table(io.BytesIO(data))
+    else:
+        table = pa.ipc.open_stream(data).read_all()
+    assert table.num_rows == 6
+    assert pa.types.is_dictionary(table.schema.field("bookmaker").type)
+    assert set(table.column("bookmaker").to_pylist()) == {"kambi", "book0", "book1", "book2"}
+    assert table.column("point").null_count == 6
@@ -0,0 +1,32 @@
+import pytest
+
+from oddstracker.service import oddsretriever
+from oddstracker.service.oddsretriever import get_sporteventdata_batch
+
+
+class _BatchClient:
+    def __init__(self, matches: int):
+        self.matches = matches
+        self.limits = []
+
+    async def get_sporteventdata_batch(self, limit, **filters):
+        self.limits.append(limit)
+        return [object()] * min(self.matches, limit)
+
+
+@pytest.mark.asyncio
+async def test_batch_requires_filters_and_caps_events(monkeypatch):
+    monkeypatch.setattr(oddsretriever, "BATCH_MAX_EVENTS", 3)
+    client = _BatchClient(matches=2)
+    monkeypatch.setattr(oddsretriever, "get_client", lambda: client)
+
+    assert len(await get_sporteventdata_batch(sport_key="americanfootball_nfl")) == 2
+    assert client.limits == [4]
+
+    with pytest.raises(ValueError):
+        await get_sporteventdata_batch()
+    with pytest.raises(ValueError):
+        await get_sporteventdata_batch(event_ids=["a", "b", "c", "d"])
+    client.matches = 10
+    with pytest.raises(ValueError):
+        await get_sporteventdata_batch(sport_key="americanfootball_nfl")
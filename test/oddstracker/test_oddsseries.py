@@ -0,0 +1,49 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from oddstracker.service import oddsseries
+from oddstracker.service.oddsseries import lttb, parse_bucket
+
+
+def test_parse_bucket():
+    assert parse_bucket("5m") == timedelta(minutes=5)
+    assert parse_bucket("1 hour") == timedelta(hours=1)
+    assert parse_bucket("30s") == timedelta(seconds=30)
+    with pytest.raises(ValueError):
+        parse_bucket("5 fortnights")
+
+
+def test_lttb_preserves_shape():
+    x = np.arange(1000, dtype=np.float64)
+    y = np.zeros(1000)
+    y[500] = 10.0
+
+    idx = lttb(x, y, 50)
+    assert len(idx) == 50
+    assert idx[0] == 0 and idx[-1] == 999
+    assert 500 in idx
+    assert np.all(np.diff(idx) > 0)
+    assert len(lttb(x[:10], y[:10], 50)) == 10
+
+
+@pytest.mark.asyncio
+async def test_series_range_normalised_and_validated(monkeypatch):
+    calls = []
+
+    class _Client:
+        async def get_eventoffer_series(self, event_id, offer_type, bucket, start, end):
+            calls.append((start, end))
+            return []
+
+    monkeypatch.setattr(oddsseries, "get_client", lambda: _Client())
+    start = datetime(2025, 10, 26, 12, 0)
+    end = datetime(2025, 10, 26, 13, 0, tzinfo=UTC)
+    await oddsseries.get_eventoffer_series("e1", "h2h", "5m", start=start, end=end)
+    assert calls == [(start.replace(tzinfo=UTC), end)]
+
+    for bad_end in (start, start - timedelta(hours=1)):
+        with pytest.raises(ValueError):
+            await oddsseries.get_eventoffer_series("e1", "h2h", "5m", start=start, end=bad_end)
+    assert len(calls) == 1
@@ -0,0 +1,50 @@
+import csv
+import io
+from datetime import UTC, datetime
+
+import orjson
+import pytest
+
+from oddstracker.service.oddsstream import STREAM_COLUMNS, encode_csv, encode_ndjson
+
+T0 = datetime(2025, 9, 7, 17, 0, tzinfo=UTC)
+
+ROWS = [
+    ("e1", "dk", "h2h", "MIA", T0, 2.1, None),
+    ("e1", "dk", "spreads", "MIA", T0, 1.9, -3.5),
+]
+
+
+async def _chunks():
+    yield ROWS[:1]
+    yield []
+    yield ROWS[1:]
+
+
+async def _collect(stream) -> list[bytes]:
+    return [data async for data in stream]
+
+
+@pytest.mark.asyncio
+async def test_encode_ndjson():
+    out = await _collect(encode_ndjson(_chunks()))
+    assert len(out) == 2
+    lines = [orjson.loads(line) for line in b"".join(out).splitlines()]
+    assert lines[0] == {
+        "event_id": "e1",
+        "bookmaker": "dk",
+        "offer_type": "h2h",
+        "choice": "MIA",
+        "timestamp": T0.isoformat(),
+        "price": 2.1,
+    }
+    assert lines[1]["point"] == -3.5
+
+
+@pytest.mark.asyncio
+async def test_encode_csv():
+    out = b"".join(await _collect(encode_csv(_chunks()))).decode()
+    rows = list(csv.reader(io.StringIO(out)))
+    assert tuple(rows[0]) == STREAM_COLUMNS
+    assert rows[1] == ["e1", "dk", "h2h", "MIA", T0.isoformat(), "2.1", ""]
+    assert rows[2][-1] == "-3.5"
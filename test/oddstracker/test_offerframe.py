@@ -0,0 +1,63 @@
+from datetime import UTC, datetime, timedelta
+
+from oddstracker.domain.model.offerframe import OfferFrame
+from oddstracker.service.consensus import ConsensusEngine
+from oddstracker.service.oddschanges import frame_changes
+
+T0 = datetime(2025, 9, 7, 17, 0, tzinfo=UTC)
+
+
+def _offers():
+    return [
+        {"event_id": "e1", "bookmaker": "dk", "offer_type": "h2h", "choice": "MIA",
+         "timestamp": T0 + timedelta(minutes=5), "price": 2.1},
+        {"event_id": "e1", "bookmaker": "dk", "offer_type": "h2h", "choice": "MIA",
+         "timestamp": T0, "price": 2.0},
+        {"event_id": "e1", "bookmaker": "fd", "offer_type": "spreads", "choice": "MIA",
+         "timestamp": T0, "price": 1.9, "point": -3.5},
+        {"event_id": "e1", "bookmaker": "fd", "offer_type": "spreads", "choice": "MIA",
+         "timestamp": T0 + timedelta(minutes=1), "price": 1.9, "point": -3.5},
+        {"event_id": "e2", "bookmaker": "dk", "offer_type": "h2h", "choice": "BUF",
+         "timestamp": T0, "price": 1.5},
+    ]
+
+
+def test_offerframe_groups():
+    frame = OfferFrame.from_offers(_offers())
+    assert len(frame) == 5
+    assert frame.categories["bookmaker"] == ["dk", "fd"]
+
+    groups = frame.groups()
+    assert set(groups) == {
+        ("e1", "dk", "h2h", "MIA"),
+        ("e1", "fd", "spreads", "MIA"),
+        ("e2", "dk", "h2h", "BUF"),
+    }
+    dk = groups[("e1", "dk", "h2h", "MIA")]
+    assert [frame.row(i)[4] for i in dk] == [T0, T0 + timedelta(minutes=5)]
+
+    latest = sorted(frame.row(i)[5] for i in frame.latest())
+    assert latest == [1.5, 1.9, 2.1]
+    assert len(frame.first_last()) == 5
+    assert len(frame.where(offer_type="h2h")) == 3
+    assert len(frame.where(bookmaker="missing")) == 0
+    assert frame.row(2)[6] == -3.5 and frame.row(0)[6] is None
+
+
+def test_frame_changes():
+    changes = frame_changes(OfferFrame.from_offers(_offers()))
+    assert list(changes) == ["e1"]
+    (change,) = changes["e1"]
+    assert (change.bookmaker, change.old_price, change.new_price) == ("dk", 2.0, 2.1)
+    assert change.price_changed and not change.point_changed
+
+
+def test_consensus_update_from_frame():
+    frame = OfferFrame.from_offers(_offers())
+    from_frame = ConsensusEngine(book_weights={}).update(frame)
+    from_offers = ConsensusEngine(book_weights={}).update(frame.to_offers())
+    key = lambda line: (line.event_id, line.offer_type, line.choice)  # noqa: E731
+    assert sorted(map(key, from_frame)) == sorted(map(key, from_offers))
+    assert {key(line): line.price_median for line in from_frame} == {
+        key(line): line.price_median for line in from_offers
+    }
@@ -0,0 +1,19 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from oddstracker.service.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_roundtrip():
+    ts = datetime(2025, 9, 7, 17, 0, tzinfo=UTC)
+    cursor = encode_cursor((ts, "evt", "fanduel", "h2h", "MIA"))
+    key = decode_cursor(cursor, 5)
+    assert datetime.fromisoformat(key[0]) == ts
+    assert key[1:] == ["evt", "fanduel", "h2h", "MIA"]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(("a", "b", "c"))])
+def test_cursor_invalid(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2)
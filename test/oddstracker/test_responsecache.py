@@ -0,0 +1,56 @@
+import pytest
+
+from oddstracker.service.responsecache import ResponseCache, ResponseCacheMiddleware
+
+
+def _cache(**kwargs) -> ResponseCache:
+    ttls = {"events": 60, "event": 60, "team": 60, "linemoves": 60}
+    return ResponseCache(ttls=ttls, **kwargs)
+
+
+def _put(cache: ResponseCache, path: str) -> None:
+    rule, tags = cache.match(path)
+    cache.put(path, rule, tags, 200, [], path.encode())
+
+
+def test_invalidation_is_scoped_to_events():
+    cache = _cache()
+    for path in ["/event", "/event/a", "/event/b", "/team/MIA/events", "/linemoves"]:
+        _put(cache, path)
+
+    assert cache.invalidate(["a"], teams=["KC"]) == 3
+    assert cache.get("/event/b") is not None
+    assert cache.get("/team/MIA/events") is not None
+    assert cache.get("/event/a") is None
+    assert cache.get("/event") is None
+
+
+def test_lru_eviction_and_uncached_routes():
+    cache = _cache(max_entries=2)
+    for path in ["/event/a", "/event/b", "/event/c"]:
+        _put(cache, path)
+    assert len(cache) == 2
+    assert cache.get("/event/a") is None
+    assert cache.match("/event/a/velocity") is None
+
+
+@pytest.mark.asyncio
+async def test_middleware_serves_hits():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"[]"})
+
+    middleware = ResponseCacheMiddleware(app, cache=_cache())
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/event", "query_string": b""}
+    await middleware(scope, None, send)
+    await middleware(scope, None, send)
+    assert calls == ["/event"]
+    assert [m.get("body") for m in sent if m["type"] == "http.response.body"] == [b"[]", b"[]"]
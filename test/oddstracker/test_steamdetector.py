@@ -0,0 +1,53 @@
+from datetime import UTC, datetime, timedelta
+
+from oddstracker.domain.model.sportevent import EventOffer
+from oddstracker.service.steamdetector import QuoteRingBuffer, SteamDetector
+
+START = datetime(2025, 10, 26, 12, 0, tzinfo=UTC)
+
+
+def _offer(bookmaker: str, minutes: int, price: float) -> EventOffer:
+    return EventOffer(
+        event_id="2025_08_MIA_ATL",
+        bookmaker=bookmaker,
+        offer_type="h2h",
+        choice="MIA",
+        timestamp=START + timedelta(minutes=minutes),
+        price=price,
+    )
+
+
+def test_ring_buffer_is_bounded():
+    buffer = QuoteRingBuffer(4)
+    for i in range(10):
+        assert buffer.append(float(i), 2.0 + i, None)
+    assert len(buffer) == 4
+    assert not buffer.append(5.0, 1.5, None)
+
+    ts, prices, _ = buffer.window(since=8.0)
+    assert ts.tolist() == [7.0, 8.0, 9.0]
+    assert prices.tolist() == [9.0, 10.0, 11.0]
+
+
+def test_steam_detected_for_synchronized_moves():
+    detector = SteamDetector(window_seconds=900, min_books=3, min_move=0.01, min_sync=0.6)
+    books = ["kambi", "draftkings", "fanduel", "betmgm"]
+    assert not detector.observe_offers([_offer(b, 0, 2.10) for b in books])
+
+    steam = detector.observe_offers([_offer(b, 5, 1.90) for b in books[:3]])
+    assert len(steam) == 1
+    assert steam[0].direction == "shorten"
+    assert steam[0].books_moved == 3
+    assert steam[0].books_total == 4
+    assert steam[0].avg_velocity > 0
+
+    # Cooldown within the window prevents re-emitting the same move
+    assert not detector.observe_offers([_offer(b, 6, 1.85) for b in books[:3]])
+    assert len(detector.get_events()) == 1
+    assert len(detector.get_velocities("2025_08_MIA_ATL")) == 3
+
+
+def test_market_count_is_bounded():
+    detector = SteamDetector(max_markets=2)
+    detector.observe_offers([_offer(b, 0, 2.0) for b in ["a", "b", "c"]])
+    assert len(detector) == 2
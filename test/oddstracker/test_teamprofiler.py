@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 
@@ -42,3 +44,45 @@ async def test_get_team_events(
     _teamdata = await get_team_by_abbr(team_abbr)
     for event in events:
         assert _teamdata.team_abbr in (event.home_team, event.away_team)
+
+
+@pytest.mark.asyncio
+async def test_get_team_event_offers(
+    postgres_client,
+    mock_betting_data_requests,
+):
+    from oddstracker.domain.model.converter import convert_to_sportevents
+    from oddstracker.service.oddscollector import collect_and_store_bettingdata
+    from oddstracker.service.teamprofiler import (
+        get_events_by_teamabbr,
+        get_team_by_abbr,
+        get_team_event_offers,
+    )
+    from test.oddstracker.conftest import get_sample_events
+
+    await collect_and_store_bettingdata(
+        provider_key="kambi",
+        league="nfl",
+        db_store=True,
+    )
+
+    team_abbr = "MIA"
+    events = await get_events_by_teamabbr(team_abbr)
+    offers = await get_team_event_offers(team_abbr)
+    assert events and offers
+    assert {o.event_id for o in offers} <= {e.id for e in events}
+
+    # An offer from the collected payload comes back unchanged
+    expected = next(
+        o
+        for s in convert_to_sportevents("kambi", copy.deepcopy(get_sample_events("kambi")))
+        if team_abbr in (s.event.home_team, s.event.away_team)
+        for o in s.offers
+    )
+    key = lambda o: (o.event_id, o.bookmaker, o.offer_type, o.choice, o.timestamp)  # noqa: E731
+    assert {key(o): o.price for o in offers}[key(expected)] == expected.price
+
+    latest = await get_team_event_offers(team_abbr, latest=True)
+    keys = [(o.event_id, o.bookmaker, o.offer_type, o.choice) for o in latest]
+    assert len(keys) == len(set(keys))
+    assert await get_team_by_abbr("XXX") is None